@@ -1,5 +1,23 @@
 from django.apps import AppConfig
+from django.contrib.auth.hashers import get_hashers
+from django.contrib.auth.password_validation import get_default_password_validators
+from django.core.signals import request_started
+from django.db.backends.signals import connection_created
 
 
 class AuthenticationConfig(AppConfig):
     name = "core"
+
+    def ready(self):
+        import core.signals  # noqa: F401
+        from core.db import close_unusable_connections, install_slow_query_log
+        from core.metrics import install_query_timing, install_serializer_timing
+
+        request_started.connect(close_unusable_connections, dispatch_uid="core.db.close_unusable_connections")
+        connection_created.connect(install_query_timing, dispatch_uid="core.metrics.install_query_timing")
+        install_serializer_timing()
+        connection_created.connect(install_slow_query_log, dispatch_uid="core.db.install_slow_query_log")
+
+        # Load common passwords list and hashers before first request, workers forked after preload share them.
+        get_default_password_validators()
+        get_hashers()
@@ -0,0 +1,4 @@
+__all__ = ["CachedTokenAuthentication", "UserResolverBackend"]
+
+from core.authentication.backends import UserResolverBackend
+from core.authentication.token import CachedTokenAuthentication
@@ -0,0 +1,34 @@
+from django.contrib.auth.backends import ModelBackend
+
+from core.models import User
+from core.services import check_user_password, get_user_resolver, hash_password
+
+
+class UserResolverBackend(ModelBackend):
+    """
+    ModelBackend that finds User by case-insensitive email through request UserResolver,
+    so sign in validators and authentication share one users query, and checks password with password service,
+    in hashing pool if it is turned on, rehashing outdated hashes.
+    Password of unknown email is hashed anyway, so response time does not tell which emails exist.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        """
+        Args:
+            request: Request or None.
+            username: String with email, as Django admin and other username based callers pass it.
+            password: String - raw password.
+            **kwargs: Credentials with "email" from views.
+        Returns:
+            User or None if email or password is wrong or User is inactive.
+        """
+        email = username or kwargs.get(User.USERNAME_FIELD)
+        if email is None or password is None:
+            return None
+        user = get_user_resolver(request).get_by_email(email)
+        if user is None:
+            hash_password(password)
+            return None
+        if check_user_password(user, password) and self.user_can_authenticate(user):
+            return user
+        return None
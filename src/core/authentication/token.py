@@ -0,0 +1,79 @@
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication, get_authorization_header
+
+from asgiref.sync import sync_to_async
+
+from core.services.cache import TieredCache
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Drop-in replacement of DRF TokenAuthentication that caches token to user resolution.
+    Token with its User is kept in bounded in-process LRU cache with TTL
+    and in shared Django cache from AUTH_TOKEN_CACHE_ALIAS setting if it is set.
+    Cached tokens are invalidated in all processes when token is deleted or its User is changed,
+    AUTH_TOKEN_LOCAL_CACHE_TIMEOUT bounds staleness of processes that missed the invalidation broadcast.
+    """
+
+    cache = TieredCache(
+        prefix="auth_token",
+        timeout=settings.AUTH_TOKEN_CACHE_TIMEOUT,
+        local_timeout=settings.AUTH_TOKEN_LOCAL_CACHE_TIMEOUT,
+        max_size=settings.AUTH_TOKEN_LOCAL_CACHE_SIZE,
+        alias=settings.AUTH_TOKEN_CACHE_ALIAS,
+    )
+
+    def authenticate_credentials(self, key):
+        """
+        Get User and Token by token key from cache or from database on cache miss.
+        Args:
+            key: String with token key.
+        Returns:
+            Tuple with User and Token.
+        Raises:
+            AuthenticationFailed if token does not exist or user is inactive.
+        """
+        token = self.cache.get(key)
+        if token is not None:
+            return token.user, token
+
+        user, token = super().authenticate_credentials(key)
+        self.cache.add(key, token)
+        return user, token
+
+    async def aauthenticate(self, request):
+        """
+        Async authenticate() for async views, token from in-process cache is resolved without leaving event loop,
+        on cache miss shared cache and database are queried in one sync_to_async call.
+        Args:
+            request: Django HttpRequest.
+        Returns:
+            Tuple with User and Token or None if request has no token.
+        Raises:
+            AuthenticationFailed if token header is malformed, token does not exist or user is inactive.
+        """
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed(_("Invalid token header."))
+        try:
+            key = auth[1].decode()
+        except UnicodeError:
+            raise exceptions.AuthenticationFailed(_("Invalid token header."))
+
+        token = self.cache.get_local(key)
+        if token is not None:
+            return token.user, token
+        return await sync_to_async(self.authenticate_credentials)(key)
+
+    @classmethod
+    def invalidate(cls, *keys):
+        """
+        Removes tokens from cache of all processes.
+        Args:
+            *keys: Strings with token keys.
+        """
+        cls.cache.delete_many(list(keys))
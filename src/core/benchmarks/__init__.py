@@ -0,0 +1,11 @@
+__all__ = ["BENCHMARKS", "benchmark", "compare_results", "run_benchmark"]
+
+from core.benchmarks import (  # noqa: F401
+    authentication,
+    endpoints,
+    load,
+    serializers,
+    sqlite,
+)
+from core.benchmarks.compare import compare_results
+from core.benchmarks.registry import BENCHMARKS, benchmark, run_benchmark
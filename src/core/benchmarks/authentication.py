@@ -0,0 +1,34 @@
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token as AuthToken
+from rest_framework.test import APIClient
+
+from core.authentication import CachedTokenAuthentication
+from core.benchmarks.registry import benchmark
+from core.benchmarks.utils import measure, override_attribute, rollback
+from core.models import User
+from core.views import TicketViewSet
+
+
+@benchmark("authentication")
+def authentication_benchmark(options):
+    """
+    Compares requests per second of ticket list with DRF TokenAuthentication and CachedTokenAuthentication.
+    Args:
+        options: Dict with "iterations" - number of requests for each authentication class.
+    Returns:
+        Dict with results for each authentication class.
+    """
+    iterations = options.get("iterations") or 1000
+    results = {}
+    with rollback():
+        user = User.objects.create(email="benchmark-authentication@example.com")
+        token = AuthToken.objects.create(user=user)
+        client = APIClient(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+        for authentication_class in (TokenAuthentication, CachedTokenAuthentication):
+            with override_attribute(TicketViewSet, "authentication_classes", [authentication_class]):
+                results[authentication_class.__name__] = measure(
+                    lambda: client.get("/api/ticket/", {"page_size": 1, "total": "false"}), iterations
+                )
+        CachedTokenAuthentication.invalidate(token.key)
+    return results
@@ -0,0 +1,32 @@
+def _numbers(value, path=()):
+    if isinstance(value, bool):
+        return
+    if isinstance(value, (int, float)):
+        yield "/".join(path), value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _numbers(item, (*path, str(key)))
+
+
+def compare_results(baseline, current):
+    """
+    Compares numeric results of two runs of "manage.py benchmark", e.g. latency, queries and RSS.
+    Args:
+        baseline: List of benchmark results from the earlier run.
+        current: List of benchmark results from the later run.
+    Returns:
+        Dict with "benchmark/case/metric" paths present in both runs as keys and dicts with baseline and current
+        values and change in percent as values, change is None if baseline value is 0.
+    """
+    baseline_numbers = dict(_numbers({result["benchmark"]: result for result in baseline}))
+    comparison = {}
+    for path, value in _numbers({result["benchmark"]: result for result in current}):
+        if path not in baseline_numbers:
+            continue
+        old_value = baseline_numbers[path]
+        comparison[path] = {
+            "baseline": old_value,
+            "current": value,
+            "change_percent": round((value - old_value) / old_value * 100, 1) if old_value else None,
+        }
+    return comparison
@@ -0,0 +1,355 @@
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter, namedtuple
+from contextlib import ExitStack
+from django.conf import settings
+from django.core import mail
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+from urllib.parse import urlencode
+
+from core import urls as core_urls
+from core.benchmarks.factories import BENCHMARK_PASSWORD, TicketFactory, UserFactory
+from core.benchmarks.load import run_load
+from core.benchmarks.registry import benchmark
+from core.benchmarks.utils import (
+    override_attribute,
+    peak_rss_mb,
+    percentiles,
+    process_tree_peak_rss_mb,
+    rollback,
+)
+from core.models import HashTag, Ticket, Token, TokenTypeEnum, User
+from core.services import issue_auth_token
+from rest_api.celery import app as celery_app
+
+ANONYMOUS, USER, STAFF = "anonymous", "user", "staff"
+
+# Endpoint request is built by prepare(number) -> (path, data) outside of measured time,
+# so single use endpoints get a fresh Ticket or token on every request.
+# Repeatable endpoints accept the same request many times and are also measured on a running server.
+Endpoint = namedtuple("Endpoint", ["url_name", "method", "client", "prepare", "repeatable"])
+
+SERVERS = ("gunicorn", "uvicorn")
+SERVER_START_TIMEOUT = 30
+
+
+def _path(url_name, **kwargs):
+    return reverse(f"api:{url_name}", kwargs=kwargs)
+
+
+def _create_fixtures():
+    user = UserFactory(email="benchmark-endpoints@example.com")
+    staff = UserFactory(email="benchmark-endpoints-staff@example.com", is_staff=True)
+    hash_tag = HashTag.objects.create(name="benchmark-endpoints", description="Benchmark endpoints")
+    TicketFactory.create_batch(100, creator=user, hash_tag=hash_tag)
+    return {
+        "user": user,
+        "staff": staff,
+        "hash_tag": hash_tag,
+        "ticket": Ticket.objects.filter(creator=user).first(),
+        "tokens": {USER: issue_auth_token(user), STAFF: issue_auth_token(staff)},
+    }
+
+
+def _endpoints(fixtures):
+    """
+    Returns:
+        List of Endpoint, at least one for every url of core.urls.
+    """
+    user, hash_tag, ticket = fixtures["user"], fixtures["hash_tag"], fixtures["ticket"]
+
+    def token(token_type):
+        return str(Token.objects.create(user=user, token_type=token_type).value)
+
+    def open_ticket():
+        return Ticket.objects.create(creator=user, hash_tag=hash_tag, question="Benchmark ticket to close").id
+
+    def new_hash_tag(number):
+        return HashTag.objects.create(name=f"endpoints-{number}", description="Benchmark").id
+
+    tickets = {"tickets": [{"hash_tag": hash_tag.name, "question": f"Question {index}"} for index in range(10)]}
+    return [
+        Endpoint(
+            "auth-sign-in",
+            "post",
+            ANONYMOUS,
+            lambda number: (_path("auth-sign-in"), {"email": user.email, "password": BENCHMARK_PASSWORD}),
+            True,
+        ),
+        Endpoint(
+            "auth-sign-up",
+            "post",
+            ANONYMOUS,
+            lambda number: (
+                _path("auth-sign-up"),
+                {
+                    "email": f"benchmark-sign-up-{number}@example.com",
+                    "password": BENCHMARK_PASSWORD,
+                    "first_name": "Benchmark",
+                    "last_name": "Sign Up",
+                },
+            ),
+            False,
+        ),
+        Endpoint(
+            "auth-confirm-email",
+            "post",
+            ANONYMOUS,
+            lambda number: (_path("auth-confirm-email"), {"token": token(TokenTypeEnum.EMAIL_VERIFICATION)}),
+            False,
+        ),
+        # Sends email on every request, so it is not repeated on a running server.
+        Endpoint(
+            "auth-forgot-password",
+            "post",
+            ANONYMOUS,
+            lambda number: (_path("auth-forgot-password"), {"email": user.email}),
+            False,
+        ),
+        Endpoint(
+            "auth-reset-password",
+            "post",
+            ANONYMOUS,
+            lambda number: (
+                _path("auth-reset-password"),
+                {"token": token(TokenTypeEnum.RESET_PASSWORD), "password": BENCHMARK_PASSWORD},
+            ),
+            False,
+        ),
+        Endpoint("ticket-list", "get", STAFF, lambda number: (_path("ticket-list"), {}), True),
+        Endpoint("ticket-list", "get", USER, lambda number: (_path("ticket-list"), {}), True),
+        Endpoint(
+            "ticket-list",
+            "post",
+            USER,
+            lambda number: (_path("ticket-list"), {"hash_tag": hash_tag.name, "question": "Benchmark question"}),
+            True,
+        ),
+        Endpoint("ticket-detail", "get", USER, lambda number: (_path("ticket-detail", pk=ticket.id), {}), True),
+        Endpoint("ticket-search", "get", USER, lambda number: (_path("ticket-search"), {"q": "question"}), True),
+        Endpoint("ticket-export", "get", USER, lambda number: (_path("ticket-export"), {}), True),
+        Endpoint("ticket-changes", "get", USER, lambda number: (_path("ticket-changes"), {}), True),
+        Endpoint("ticket-close", "post", USER, lambda number: (_path("ticket-close"), {"id": open_ticket()}), False),
+        Endpoint("ticket-bulk-create", "post", USER, lambda number: (_path("ticket-bulk-create"), tickets), True),
+        Endpoint(
+            "ticket-bulk-close",
+            "post",
+            USER,
+            lambda number: (_path("ticket-bulk-close"), {"ids": [open_ticket() for _ in range(10)]}),
+            False,
+        ),
+        Endpoint("hash_tag-list", "get", STAFF, lambda number: (_path("hash_tag-list"), {}), True),
+        Endpoint(
+            "hash_tag-list",
+            "post",
+            STAFF,
+            lambda number: (_path("hash_tag-list"), {"name": f"new-endpoints-{number}", "description": "Benchmark"}),
+            False,
+        ),
+        Endpoint("hash_tag-detail", "get", STAFF, lambda number: (_path("hash_tag-detail", pk=hash_tag.id), {}), True),
+        Endpoint(
+            "hash_tag-detail",
+            "patch",
+            STAFF,
+            lambda number: (_path("hash_tag-detail", pk=hash_tag.id), {"description": "Benchmark endpoints"}),
+            True,
+        ),
+        Endpoint(
+            "hash_tag-detail",
+            "delete",
+            STAFF,
+            lambda number: (_path("hash_tag-detail", pk=new_hash_tag(number)), {}),
+            False,
+        ),
+        Endpoint("async-ticket-list", "get", STAFF, lambda number: (_path("async-ticket-list"), {}), True),
+        Endpoint(
+            "async-ticket-detail", "get", USER, lambda number: (_path("async-ticket-detail", pk=ticket.id), {}), True
+        ),
+        Endpoint("async-hash_tag-list", "get", STAFF, lambda number: (_path("async-hash_tag-list"), {}), True),
+        Endpoint(
+            "async-hash_tag-detail",
+            "get",
+            STAFF,
+            lambda number: (_path("async-hash_tag-detail", pk=hash_tag.id), {}),
+            True,
+        ),
+    ]
+
+
+def _case_name(endpoint):
+    return f"{endpoint.method.upper()} {endpoint.url_name} as {endpoint.client}"
+
+
+def _not_covered(endpoints):
+    return sorted({pattern.name for pattern in core_urls.urlpatterns} - {endpoint.url_name for endpoint in endpoints})
+
+
+def _measure_with_client(client, endpoint, iterations):
+    latencies, queries, statuses = [], [], Counter()
+    # The first request warms up caches and is not measured.
+    for number in range(iterations + 1):
+        path, data = endpoint.prepare(number)
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            if endpoint.method == "get":
+                response = client.get(path, data)
+            else:
+                response = getattr(client, endpoint.method)(path, data, format="json")
+            if response.streaming:
+                b"".join(response.streaming_content)
+            elapsed = time.perf_counter() - started
+        if number:
+            latencies.append(elapsed)
+            queries.append(len(captured))
+            statuses[str(response.status_code)] += 1
+    return {
+        **percentiles(latencies),
+        "queries_per_request": round(sum(queries) / len(queries), 2),
+        "statuses": dict(statuses),
+    }
+
+
+def _run_with_client(iterations):
+    results = {}
+    with rollback(), ExitStack() as stack:
+        # Rate limits would reject most of measured requests, emails are rendered but kept in memory.
+        stack.enter_context(override_attribute(APIView, "throttle_classes", []))
+        stack.enter_context(
+            override_settings(
+                EMAIL_OUTBOX_URL="memory://", EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend"
+            )
+        )
+        stack.enter_context(override_attribute(celery_app.conf, "task_always_eager", True))
+        fixtures = _create_fixtures()
+        clients = {
+            ANONYMOUS: APIClient(),
+            USER: APIClient(HTTP_AUTHORIZATION=f"Token {fixtures['tokens'][USER]}"),
+            STAFF: APIClient(HTTP_AUTHORIZATION=f"Token {fixtures['tokens'][STAFF]}"),
+        }
+        endpoints = _endpoints(fixtures)
+        for endpoint in endpoints:
+            results[_case_name(endpoint)] = _measure_with_client(clients[endpoint.client], endpoint, iterations)
+            mail.outbox = []
+    return endpoints, results
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _server_command(server, port, workers):
+    if server == "gunicorn":
+        return ["gunicorn", "rest_api.wsgi", "--workers", str(workers), "--bind", f"127.0.0.1:{port}"]
+    return [
+        *("uvicorn", "rest_api.asgi:application", "--workers", str(workers)),
+        *("--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"),
+    ]
+
+
+def _start_server(server, workers):
+    port = _free_port()
+    environ = {
+        **os.environ,
+        **{
+            f"THROTTLE_{scope.upper()}_RATE": "1000000/s" for scope in settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]
+        },
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", *_server_command(server, port, workers)],
+        cwd=settings.BASE_DIR,
+        env=environ,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while True:
+        if process.poll() is not None:
+            raise RuntimeError(f"{server} exited with code {process.returncode}.")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            if time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError(f"{server} did not start in {SERVER_START_TIMEOUT} seconds.")
+            time.sleep(0.1)
+
+
+def _stop_server(process):
+    process.terminate()
+    try:
+        process.wait(10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _run_with_server(server, workers, iterations, concurrency):
+    fixtures = _create_fixtures()
+    try:
+        endpoints = [endpoint for endpoint in _endpoints(fixtures) if endpoint.repeatable]
+        process, base_url = _start_server(server, workers)
+        try:
+            results = {}
+            for endpoint in endpoints:
+                path, data = endpoint.prepare(0)
+                headers = {"Accept": "application/json"}
+                if endpoint.client != ANONYMOUS:
+                    headers["Authorization"] = f"Token {fixtures['tokens'][endpoint.client]}"
+                body = b""
+                if endpoint.method == "get":
+                    path += f"?{urlencode(data)}" if data else ""
+                else:
+                    headers["Content-Type"] = "application/json"
+                    body = json.dumps(data).encode("utf-8")
+                url, method = base_url + path, endpoint.method.upper()
+                asyncio.run(run_load(url, headers, concurrency, concurrency, method, body))  # Warm up workers.
+                results[_case_name(endpoint)] = asyncio.run(
+                    run_load(url, headers, iterations, concurrency, method, body)
+                )
+            return endpoints, results, process_tree_peak_rss_mb(process.pid)
+        finally:
+            _stop_server(process)
+    finally:
+        HashTag.objects.filter(name="benchmark-endpoints").delete()
+        User.objects.filter(id__in=[fixtures["user"].id, fixtures["staff"].id]).delete()
+
+
+@benchmark("endpoints")
+def endpoints_benchmark(options):
+    """
+    Measures every endpoint of core.urls on data already in configured database, see "manage.py seed".
+    By default requests go through Django test client inside transaction that is rolled back, rate limits are off
+    and emails are rendered but not sent, every endpoint gets latency percentiles, queries per request
+    and status codes, peak RSS is of the benchmark process.
+    With "server" option gunicorn or uvicorn is started with the same environment and settings,
+    endpoints that accept the same request repeatedly are loaded over HTTP and peak RSS is of server processes,
+    data created by requests is committed and deleted after run.
+    Args:
+        options: Dict with "iterations" - requests per endpoint, "server" - "gunicorn", "uvicorn" or None,
+            "workers" - server worker processes, "concurrency" - concurrent clients of server.
+    Returns:
+        Dict with number of Tickets in database, url names not covered by benchmark and results for each endpoint.
+    """
+    iterations = options.get("iterations") or 100
+    server = options.get("server")
+    report = {"tickets": Ticket.objects.count(), "server": server or "test client"}
+    if server:
+        workers, concurrency = options.get("workers") or 2, options.get("concurrency") or 16
+        endpoints, results, rss = _run_with_server(server, workers, iterations, concurrency)
+        report.update({"workers": workers, "concurrency": concurrency, "server_peak_rss_mb": rss})
+    else:
+        endpoints, results = _run_with_client(iterations)
+        report["peak_rss_mb"] = peak_rss_mb()
+    return {**report, "not_covered": _not_covered(endpoints), "endpoints": results}
@@ -0,0 +1,106 @@
+import functools
+import itertools
+from django.db import transaction
+from django.db.models import Max
+
+import factory
+from factory.django import DjangoModelFactory
+
+from core.models import HashTag, Ticket, User
+from core.services import hash_password, hash_tag_versions, ticket_versions
+
+BENCHMARK_PASSWORD = "Benchmark-password-2021"
+
+
+@functools.lru_cache(maxsize=None)
+def benchmark_password_hash():
+    # Hashing is slow on purpose, all seeded Users share one hash.
+    return hash_password(BENCHMARK_PASSWORD)
+
+
+class UserFactory(DjangoModelFactory):
+    """
+    User with verified email and BENCHMARK_PASSWORD.
+    """
+
+    class Meta:
+        model = User
+
+    email = factory.Sequence(lambda number: f"benchmark-user-{number}@example.com")
+    username = factory.SelfAttribute("email")
+    first_name = "Benchmark"
+    last_name = factory.Sequence(lambda number: f"User {number}")
+    password = factory.LazyFunction(benchmark_password_hash)
+    is_email_verified = True
+
+
+class HashTagFactory(DjangoModelFactory):
+    class Meta:
+        model = HashTag
+
+    name = factory.Sequence(lambda number: f"benchmark-{number}")
+    description = factory.Sequence(lambda number: f"Benchmark hashtag {number}")
+
+
+class TicketFactory(DjangoModelFactory):
+    """
+    Ticket with deterministic question, every fourth Ticket is archived.
+    """
+
+    class Meta:
+        model = Ticket
+
+    creator = factory.SubFactory(UserFactory)
+    hash_tag = factory.SubFactory(HashTagFactory)
+    question = factory.Sequence(lambda number: f"Benchmark question {number} about hashtag and ticket search")
+    is_archived = factory.Sequence(lambda number: number % 4 == 0)
+
+
+def _bulk_create(factory_class, count, batch_size):
+    """
+    Returns:
+        List of created objects with id only, SQLite does not return ids from bulk inserts.
+    """
+    model = factory_class._meta.model
+    last_id = model.objects.aggregate(last_id=Max("id"))["last_id"] or 0
+    for start in range(0, count, batch_size):
+        with transaction.atomic():
+            model.objects.bulk_create(factory_class.build_batch(min(batch_size, count - start)))
+    return list(model.objects.filter(id__gt=last_id).only("id").order_by("id"))
+
+
+def seed_database(tickets, users=None, hash_tags=None, batch_size=5000, progress=None):
+    """
+    Seeds Users, HashTags and Tickets with bulk inserts of objects built by factories.
+    Tickets are spread over Users and HashTags round robin, so the same arguments always give the same data.
+    Sequences continue from existing rows, so database can be seeded again to grow it.
+    Args:
+        tickets: Integer - number of Tickets.
+        users: Integer - number of Users, one per 100 Tickets by default.
+        hash_tags: Integer - number of HashTags, one per 1000 Tickets but at most 1000 by default.
+        batch_size: Integer - objects built and inserted at once.
+        progress: Callable with number of created Tickets, called after every batch.
+    Returns:
+        Dict with numbers of created objects.
+    """
+    users = users or max(1, tickets // 100)
+    hash_tags = hash_tags or min(1000, max(1, tickets // 1000))
+    for factory_class in (UserFactory, HashTagFactory, TicketFactory):
+        # Sequence numbers of seeded rows are below their ids.
+        factory_class.reset_sequence(factory_class._meta.model.objects.aggregate(last_id=Max("id"))["last_id"] or 0)
+
+    creators = _bulk_create(UserFactory, users, batch_size)
+    tags = _bulk_create(HashTagFactory, hash_tags, batch_size)
+    creators, tags = itertools.cycle(creators), itertools.cycle(tags)
+    for start in range(0, tickets, batch_size):
+        count = min(batch_size, tickets - start)
+        objects = [TicketFactory.build(creator=next(creators), hash_tag=next(tags)) for _ in range(count)]
+        with transaction.atomic():
+            Ticket.objects.bulk_create(objects)
+        if progress is not None:
+            progress(start + count)
+
+    # Bulk inserts send no signals, collection versions are bumped here.
+    ticket_versions.bump()
+    hash_tag_versions.bump()
+    return {"users": users, "hash_tags": hash_tags, "tickets": tickets}
@@ -0,0 +1,142 @@
+import asyncio
+import time
+from rest_framework.authtoken.models import Token as AuthToken
+from urllib.parse import urlsplit
+
+from core.benchmarks.registry import benchmark
+from core.benchmarks.utils import percentiles
+from core.models import HashTag, Ticket, User
+
+
+async def _read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Connection closed by server.")
+    status = int(status_line.split()[1])
+    # HTTP/1.0 servers close connection after response unless keep-alive is announced.
+    length, chunked, close = 0, False, status_line.startswith(b"HTTP/1.0")
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin1").partition(":")
+        name, value = name.strip().lower(), value.strip().lower()
+        if name == "content-length":
+            length = int(value)
+        elif name == "transfer-encoding":
+            chunked = "chunked" in value
+        elif name == "connection":
+            close = value == "close" or (close and value != "keep-alive")
+    if chunked:
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(length)
+    return status, close
+
+
+async def _worker(url, headers, pending, latencies, errors, method, body):
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    if body:
+        headers = {**headers, "Content-Length": len(body)}
+    request = (
+        f"{method} {path} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+        + "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        + "\r\n"
+    ).encode("latin1") + body
+    reader = writer = None
+    while pending:
+        pending.pop()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+            started = time.perf_counter()
+            writer.write(request)
+            status, close = await _read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            if not 200 <= status < 300:
+                errors.append(status)
+            if close:
+                writer.close()
+                writer = None
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError) as error:
+            errors.append(type(error).__name__)
+            if writer is not None:
+                writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def run_load(url, headers, requests, concurrency, method="GET", body=b""):
+    """
+    Sends the same request over keep-alive connections from concurrent clients.
+    Args:
+        url: String - absolute http url.
+        headers: Dict with request headers.
+        requests: Integer - total number of requests.
+        concurrency: Integer - number of concurrent clients, each keeps one connection.
+        method: String - HTTP method.
+        body: Bytes - request body, "Content-Type" must be in headers if it is not empty.
+    Returns:
+        Dict with requests per second, latency percentiles in milliseconds and count of errors and not 2xx responses.
+    """
+    pending = list(range(requests))
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(_worker(url, headers, pending, latencies, errors, method, body) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "per_second": round(len(latencies) / elapsed, 1),
+        **percentiles(latencies),
+        "errors": len(errors),
+    }
+
+
+@benchmark("async_views")
+def async_views_benchmark(options):
+    """
+    Load test of ticket and hashtag read endpoints served by running servers, e.g.
+    WSGI "gunicorn rest_api.wsgi -w 4" and ASGI "uvicorn rest_api.asgi:application --workers 4".
+    Sync endpoints are measured on both servers, async "/api/async/" endpoints on ASGI server only.
+    Servers must use the same database, benchmark data is committed and deleted after run.
+    Args:
+        options: Dict with "wsgi_url" and "asgi_url" - base urls of servers, "iterations" - requests per case,
+            "concurrency" - number of concurrent clients.
+    Returns:
+        Dict with results for each server and endpoint, or with reason if no server url is given.
+    """
+    targets = []
+    if options.get("wsgi_url"):
+        targets += [("wsgi", options["wsgi_url"], "/api/ticket/"), ("wsgi", options["wsgi_url"], "/api/hash_tag/")]
+    if options.get("asgi_url"):
+        for path in ("/api/ticket/", "/api/async/ticket/", "/api/hash_tag/", "/api/async/hash_tag/"):
+            targets.append(("asgi", options["asgi_url"], path))
+    if not targets:
+        return {"skipped": "Pass --wsgi-url and/or --asgi-url of running servers."}
+
+    requests = options.get("iterations") or 2000
+    concurrency = options.get("concurrency") or 64
+    user = User.objects.create(email="benchmark-load@example.com", is_staff=True)
+    try:
+        token = AuthToken.objects.create(user=user)
+        hash_tag = HashTag.objects.create(name="benchmark-load")
+        Ticket.objects.bulk_create(
+            Ticket(creator=user, hash_tag=hash_tag, question=f"Benchmark question {number}") for number in range(100)
+        )
+        headers = {"Authorization": f"Token {token.key}"}
+        results = {}
+        for server, base_url, path in targets:
+            url = base_url.rstrip("/") + path + "?page_size=20&total=false"
+            asyncio.run(run_load(url, headers, concurrency, concurrency))  # Warm up caches and connections.
+            results[f"{server} {path}"] = asyncio.run(run_load(url, headers, requests, concurrency))
+        return results
+    finally:
+        HashTag.objects.filter(name="benchmark-load").delete()
+        user.delete()
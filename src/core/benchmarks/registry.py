@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.test.utils import override_settings
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Registers benchmark function under given name.
+    Benchmark function takes options dict and returns dict with results that can be dumped to JSON.
+    Args:
+        name: String - benchmark name for "manage.py benchmark" command.
+    Returns:
+        Decorator.
+    """
+
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def run_benchmark(name, **options):
+    """
+    Runs registered benchmark, Django test client host "testserver" is allowed as in tests.
+    Args:
+        name: String - benchmark name.
+        **options: Benchmark options, e.g. iterations.
+    Returns:
+        Dict with benchmark results.
+    Raises:
+        KeyError if benchmark is not registered.
+    """
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+        return {"benchmark": name, **BENCHMARKS[name](options)}
@@ -0,0 +1,46 @@
+from rest_framework.renderers import JSONRenderer
+
+from core.benchmarks.registry import benchmark
+from core.benchmarks.utils import measure, rollback
+from core.models import HashTag, Ticket, User
+from core.renderers import FastJSONRenderer
+from core.renderers.json import orjson
+from core.serializers import TicketSerializer, TicketValuesSerializer
+
+
+@benchmark("serializers")
+def serializers_benchmark(options):
+    """
+    Compares serialization and rendering of a page of Tickets by TicketSerializer with JSONRenderer
+    and by TicketValuesSerializer with FastJSONRenderer, database queries are included.
+    Args:
+        options: Dict with "iterations" - number of rendered pages for each case, "rows" - Tickets on page.
+    Returns:
+        Dict with results for each case and flag if both cases rendered identical bytes.
+    """
+    iterations = options.get("iterations") or 200
+    rows = options.get("rows") or 1000
+    with rollback():
+        user = User.objects.create(email="benchmark-serializers@example.com")
+        hash_tag = HashTag.objects.create(name="benchmark-serializers")
+        Ticket.objects.bulk_create(
+            Ticket(creator=user, hash_tag=hash_tag, question=f"Benchmark question {number} ü", is_archived=number % 2)
+            for number in range(rows)
+        )
+        queryset = Ticket.objects.filter(creator=user).order_by("id")
+
+        def model_serializer():
+            return JSONRenderer().render(TicketSerializer(queryset.for_read(), many=True).data)
+
+        def values_serializer():
+            return FastJSONRenderer().render(
+                TicketValuesSerializer(TicketValuesSerializer.values(queryset), many=True).data
+            )
+
+        return {
+            "rows": rows,
+            "orjson": orjson is not None,
+            "identical": model_serializer() == values_serializer(),
+            "TicketSerializer+JSONRenderer": measure(model_serializer, iterations),
+            "TicketValuesSerializer+FastJSONRenderer": measure(values_serializer, iterations),
+        }
@@ -0,0 +1,141 @@
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from django.db import OperationalError, connections, transaction
+from django.db.utils import load_backend
+
+from core.benchmarks.registry import benchmark
+from core.benchmarks.utils import percentiles
+from core.models import HashTag, Ticket, User
+from core.services import close_ticket
+
+MODES = {
+    # Stock backend with rollback journal and deferred transactions.
+    "default": "django.db.backends.sqlite3",
+    "tuned": "core.db.backends.sqlite3",
+}
+READ_SHARE = 0.8
+
+
+@contextmanager
+def _use_database(engine, name):
+    """
+    Replaces "default" connection of the current thread with connection to another SQLite file.
+    """
+    original = connections["default"]
+    wrapper = load_backend(engine).DatabaseWrapper(
+        {**original.settings_dict, "ENGINE": engine, "NAME": name}, "default"
+    )
+    connections["default"] = wrapper
+    try:
+        yield wrapper
+    finally:
+        wrapper.close()
+        connections["default"] = original
+
+
+def _copy_database(source, target):
+    source_connection, target_connection = sqlite3.connect(source), sqlite3.connect(target)
+    try:
+        source_connection.backup(target_connection)
+        # WAL mode is persistent, copy of a WAL database would not measure the stock backend.
+        target_connection.execute("PRAGMA journal_mode = DELETE")
+    finally:
+        source_connection.close()
+        target_connection.close()
+
+
+def _run_worker(user_id, hash_tag_id, iterations, seed):
+    """
+    Runs mixed Ticket traffic in a forked process: reads of the latest page,
+    creation of Tickets and closing of Tickets created before, which reads the row and then updates it.
+    Returns:
+        Tuple with lists of read and write durations and number of "database is locked" errors.
+    """
+    generator = random.Random(seed)
+    user = User.objects.get(id=user_id)
+    reads, writes, locked, created = [], [], 0, []
+    for number in range(iterations):
+        started = time.perf_counter()
+        try:
+            if generator.random() < READ_SHARE:
+                list(Ticket.objects.order_by("-id").values("id", "question", "is_archived")[:20])
+                reads.append(time.perf_counter() - started)
+                continue
+            if created and number % 2:
+                close_ticket.apply_many([created.pop()], user)
+            else:
+                with transaction.atomic():
+                    created.append(
+                        Ticket.objects.create(creator=user, hash_tag_id=hash_tag_id, question=f"Question {seed}").id
+                    )
+            writes.append(time.perf_counter() - started)
+        except OperationalError as error:
+            if "locked" not in str(error):
+                raise
+            locked += 1
+    connections.close_all()
+    return reads, writes, locked
+
+
+def _run_mode(engine, name, concurrency, iterations):
+    with _use_database(engine, name):
+        user = User.objects.create(email="benchmark-sqlite@example.com", is_staff=True)
+        hash_tag = HashTag.objects.create(name="benchmark-sqlite")
+        Ticket.objects.bulk_create(
+            Ticket(creator=user, hash_tag=hash_tag, question=f"Benchmark question {number}") for number in range(1000)
+        )
+        # Forked processes must not share the parent connection.
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        started = time.perf_counter()
+        with context.Pool(concurrency) as pool:
+            results = pool.starmap(
+                _run_worker, [(user.id, hash_tag.id, iterations, seed) for seed in range(concurrency)]
+            )
+        elapsed = time.perf_counter() - started
+        journal_mode = connections["default"].cursor().execute("PRAGMA journal_mode").fetchone()[0]
+
+    reads = [duration for worker_reads, _, _ in results for duration in worker_reads]
+    writes = [duration for _, worker_writes, _ in results for duration in worker_writes]
+    return {
+        "engine": engine,
+        "journal_mode": journal_mode,
+        "per_second": round((len(reads) + len(writes)) / elapsed, 1),
+        "reads": {"count": len(reads), **percentiles(reads)},
+        "writes": {"count": len(writes), **percentiles(writes)},
+        "locked_errors": sum(locked for _, _, locked in results),
+    }
+
+
+@benchmark("sqlite_concurrency")
+def sqlite_concurrency_benchmark(options):
+    """
+    Mixed read/write Ticket traffic from concurrent processes against copies of the configured SQLite database,
+    with stock backend and with tuned "core.db.backends.sqlite3" backend (WAL, pragmas and "BEGIN IMMEDIATE").
+    Each process makes 80% reads of the latest Tickets page and 20% writes that create or close a Ticket.
+    Args:
+        options: Dict with "iterations" - operations per process, "concurrency" - number of processes.
+    Returns:
+        Dict with throughput, latency percentiles and "database is locked" errors for each backend,
+        or with reason if default database is not an SQLite file.
+    """
+    settings_dict = connections["default"].settings_dict
+    if connections["default"].vendor != "sqlite" or settings_dict["NAME"] in ("", ":memory:"):
+        return {"skipped": "Default database is not an SQLite file."}
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return {"skipped": "Processes can not be forked on this platform."}
+
+    iterations = options.get("iterations") or 200
+    concurrency = options.get("concurrency") or 8
+    results = {"processes": concurrency, "iterations": iterations}
+    with tempfile.TemporaryDirectory() as directory:
+        for mode, engine in MODES.items():
+            name = os.path.join(directory, f"{mode}.sqlite3")
+            _copy_database(settings_dict["NAME"], name)
+            results[mode] = _run_mode(engine, name, concurrency, iterations)
+    return results
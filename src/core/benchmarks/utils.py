@@ -0,0 +1,125 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+
+class Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rollback():
+    """
+    Runs benchmark inside transaction that is rolled back, so benchmark data never stays in database.
+    """
+    try:
+        with transaction.atomic():
+            yield
+            raise Rollback()
+    except Rollback:
+        pass
+
+
+@contextmanager
+def override_attribute(obj, name, value):
+    old_value = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield
+    finally:
+        setattr(obj, name, old_value)
+
+
+def measure(func, iterations):
+    """
+    Calls function given number of times after one warm up call.
+    Args:
+        func: Callable without arguments.
+        iterations: Integer - number of calls.
+    Returns:
+        Dict with calls per second, mean call time in milliseconds and database queries per call.
+    """
+    func()
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = time.perf_counter() - started
+    return {
+        "iterations": iterations,
+        "per_second": round(iterations / elapsed, 1),
+        "mean_ms": round(elapsed / iterations * 1000, 4),
+        "queries_per_call": round(len(queries) / iterations, 2),
+    }
+
+
+def percentiles(samples):
+    """
+    Args:
+        samples: List of durations in seconds.
+    Returns:
+        Dict with 50th, 95th and 99th percentiles and mean in milliseconds.
+    """
+    if not samples:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "mean_ms": None}
+    ordered = sorted(samples)
+
+    def percentile(rank):
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * rank))] * 1000, 3)
+
+    return {
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+    }
+
+
+def peak_rss_mb():
+    """
+    Returns:
+        Float - peak resident set size of the current process in megabytes, None where it is not available.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _children(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as children:
+            return [int(child) for child in children.read().split()]
+    except OSError:
+        return []
+
+
+def process_tree_peak_rss_mb(pid):
+    """
+    Sums peak resident set sizes of process and its descendants, e.g. of server master and workers.
+    Workers peak at different moments, so the sum is an upper bound of peak memory of the whole server.
+    Args:
+        pid: Integer - process id of running process.
+    Returns:
+        Float - megabytes, None if /proc is not available.
+    """
+    if not os.path.exists(f"/proc/{pid}/status"):
+        return None
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        pending += _children(current)
+        try:
+            with open(f"/proc/{current}/status") as status:
+                for line in status:
+                    if line.startswith("VmHWM:"):
+                        total += int(line.split()[1])
+        except OSError:
+            continue
+    return round(total / 1024, 1)
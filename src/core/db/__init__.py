@@ -0,0 +1,12 @@
+__all__ = [
+    "PrimaryReplicaRouter",
+    "close_unusable_connections",
+    "install_slow_query_log",
+    "normalize_sql",
+    "replica_reads",
+    "slow_query_log",
+]
+
+from core.db.health import close_unusable_connections
+from core.db.routers import PrimaryReplicaRouter, replica_reads
+from core.db.slow_queries import install_slow_query_log, normalize_sql, slow_query_log
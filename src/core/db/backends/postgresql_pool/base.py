@@ -0,0 +1,66 @@
+import os
+import threading
+from django.db.backends.postgresql import base
+
+import psycopg2.extras
+import psycopg2.pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    PostgreSQL backend with in-process connection pool.
+    Connection is taken from pool when request needs it and returned when Django closes it,
+    at the end of every request with CONN_MAX_AGE 0, so threads share POOL_SIZE connections instead of keeping one each.
+    Pool must not be smaller than number of threads that use database at once, exhausted pool raises database error.
+    With CONN_HEALTH_CHECKS connection from pool is checked with "SELECT 1" and replaced if it was dropped.
+    """
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def get_pool(self, conn_params):
+        # Pool is created in process that uses it, connections must not be shared by forked workers.
+        key = (self.alias, os.getpid())
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = psycopg2.pool.ThreadedConnectionPool(0, self.settings_dict["POOL_SIZE"], **conn_params)
+                self._pools[key] = pool
+        return pool
+
+    def get_new_connection(self, conn_params):
+        pool = self.get_pool(conn_params)
+        connection = pool.getconn()
+        if self.settings_dict.get("CONN_HEALTH_CHECKS") and not self._is_alive(connection):
+            pool.putconn(connection, close=True)
+            connection = pool.getconn()
+
+        # The same session setup as django.db.backends.postgresql does for new connection.
+        options = self.settings_dict["OPTIONS"]
+        try:
+            self.isolation_level = options["isolation_level"]
+        except KeyError:
+            self.isolation_level = connection.isolation_level
+        else:
+            if self.isolation_level != connection.isolation_level:
+                connection.set_session(isolation_level=self.isolation_level)
+        psycopg2.extras.register_default_jsonb(conn_or_curs=connection, loads=lambda x: x)
+        return connection
+
+    @staticmethod
+    def _is_alive(connection):
+        if connection.closed:
+            return False
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                # Pool rolls back unfinished transaction and closes broken connection.
+                self._pools[(self.alias, os.getpid())].putconn(self.connection, close=bool(self.connection.closed))
@@ -0,0 +1,35 @@
+from django.db.backends.sqlite3 import base
+
+#  Defaults for concurrent web workers, "PRAGMAS" in database settings override them.
+DEFAULT_PRAGMAS = {
+    # Readers do not block writer and writer does not block readers.
+    "journal_mode": "WAL",
+    # WAL is synced on checkpoint only, committed transaction may be lost on power failure but database stays intact.
+    "synchronous": "NORMAL",
+    # Milliseconds to wait for write lock before "database is locked".
+    "busy_timeout": 5000,
+    # Negative size is in KiB, 64 MiB page cache per connection.
+    "cache_size": -64000,
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    SQLite backend tuned for several processes writing to one database file.
+    Every new connection gets pragmas from DEFAULT_PRAGMAS and "PRAGMAS" in database settings.
+    Transactions start with "BEGIN IMMEDIATE", so write lock is taken at the beginning and waits for busy_timeout.
+    Deferred "BEGIN" takes it on the first write, and transaction that has already read fails at once
+    with "database is locked" if another one writes, SQLite can not wait there without a deadlock.
+    """
+
+    def get_new_connection(self, conn_params):
+        connection = super().get_new_connection(conn_params)
+        pragmas = {**DEFAULT_PRAGMAS, **self.settings_dict.get("PRAGMAS", {})}
+        for name, value in pragmas.items():
+            connection.execute(f"PRAGMA {name} = {value}")
+        return connection
+
+    def _start_transaction_under_autocommit(self):
+        self.cursor().execute("BEGIN IMMEDIATE")
@@ -0,0 +1,16 @@
+from django.db import connections
+
+
+def close_unusable_connections(**kwargs):
+    """
+    request_started receiver, closes persistent connections that were dropped by server or network
+    while they were idle, so the request opens a new one instead of failing on the first query.
+    It is done for databases with CONN_HEALTH_CHECKS only, every check is one "SELECT 1" round trip.
+    Args:
+        **kwargs: Extra parameters to match signal signature.
+    """
+    for connection in connections.all():
+        if not connection.settings_dict.get("CONN_HEALTH_CHECKS") or connection.connection is None:
+            continue
+        if not connection.in_atomic_block and not connection.is_usable():
+            connection.close()
@@ -0,0 +1,45 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+
+_replica_reads = ContextVar("replica_reads", default=False)
+
+
+@contextmanager
+def replica_reads():
+    """
+    Context manager and decorator that lets PrimaryReplicaRouter send reads to replicas,
+    e.g. for list and retrieve views. Everything else reads from primary, so writes and reads
+    that must see them (authentication, validation before write, cached catalogs) are never stale.
+    """
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends reads inside replica_reads() to a random replica ("replica_*" aliases from DATABASES), all other queries
+    and all writes to primary "default" database. Migrations are applied to primary only, replicas follow it.
+    """
+
+    def __init__(self):
+        self.replicas = [alias for alias in settings.DATABASES if alias.startswith("replica_")]
+
+    def db_for_read(self, model, **hints):
+        if self.replicas and _replica_reads.get():
+            return random.choice(self.replicas)
+        return None
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
@@ -0,0 +1,197 @@
+import hashlib
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError, connections, router
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Statements EXPLAIN accepts on all supported databases, it does not execute them.
+EXPLAINABLE = ("select", "insert", "update", "delete", "with")
+SLOW_QUERY_QUEUE_SIZE = 1000
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\?")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """
+    Replaces literals and placeholders with "?" and lists of them with "(...)",
+    so the same query with other parameters or number of IN values has the same text.
+    Args:
+        sql: String - SQL with "%s" placeholders.
+    Returns:
+        String - normalized SQL.
+    """
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _LIST.sub("(...)", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+def fingerprint(alias, normalized_sql):
+    return hashlib.blake2b(f"{alias}\n{normalized_sql}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SlowQueryLog:
+    """
+    Collects queries slower than SLOW_QUERY_THRESHOLD in a daemon thread, so requests only put them in a queue.
+    Thread explains the first slow call of every fingerprint on the database it ran on, with its own connection,
+    and adds calls to SlowQuery rows in the primary database. Queries of the thread itself are not collected.
+    Queue is bounded, slow queries are dropped when it is full.
+    Attributes:
+        size: Integer - queue size.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=size)
+        self._explained = set()
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def submit(self, alias, sql, params, many, duration, example):
+        if threading.current_thread() is self._thread:
+            return
+        if self._pid != os.getpid():
+            self._start()
+        try:
+            self._queue.put_nowait((alias, sql, params, many, duration, example))
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self):
+        # Thread is started in every process, forked workers do not inherit thread of the parent.
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self.size)
+                self._thread = threading.Thread(target=self._run, name="slow-query-log", daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                self._save(*item)
+            except Exception:
+                logger.exception("Slow query was not saved.")
+            if self._queue.empty():
+                # Connections of this thread are not closed by request signals.
+                connections.close_all()
+
+    def _explain(self, alias, sql, params, many):
+        if not sql.lstrip().lower().startswith(EXPLAINABLE):
+            return ""
+        if many:
+            # Plan of the first parameters set, iterator of them may be consumed already.
+            params = next(iter(params), None) if isinstance(params, (list, tuple)) else None
+            if params is None:
+                return ""
+        connection = connections[alias]
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+                return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+        except DatabaseError as error:
+            return f"EXPLAIN failed: {error}"
+
+    def _save(self, alias, sql, params, many, duration, example):
+        # Model is imported here, the log is set up when connections are created, before apps are ready.
+        from core.models import SlowQuery
+
+        normalized = normalize_sql(sql)
+        key = fingerprint(alias, normalized)
+        plan = None
+        if key not in self._explained:
+            plan = self._explain(alias, sql, params, many)
+            self._explained.add(key)
+
+        using = router.db_for_write(SlowQuery)
+        changes = {
+            "calls": F("calls") + 1,
+            "total_duration": F("total_duration") + duration,
+            "max_duration": Greatest("max_duration", duration),
+            "example": example,
+            "last_seen": timezone.now(),
+        }
+        if plan:
+            changes["plan"] = plan
+        if SlowQuery.objects.using(using).filter(fingerprint=key).update(**changes):
+            return
+        try:
+            SlowQuery.objects.using(using).create(
+                fingerprint=key,
+                database=alias,
+                sql=normalized,
+                example=example,
+                calls=1,
+                total_duration=duration,
+                max_duration=duration,
+                plan=plan or "",
+                last_seen=timezone.now(),
+            )
+        except IntegrityError:
+            # Another process created the row first.
+            SlowQuery.objects.using(using).filter(fingerprint=key).update(**changes)
+
+
+slow_query_log = SlowQueryLog(size=SLOW_QUERY_QUEUE_SIZE)
+
+
+def executed_query(connection, cursor, sql, params, many):
+    """
+    Args:
+        connection: Database connection query ran on.
+        cursor: Cursor query ran with.
+        sql: String - SQL with "%s" placeholders.
+        params: Query parameters, list of them for executemany.
+        many: Boolean - True for executemany.
+    Returns:
+        String - SQL with parameters quoted by database, SQL with placeholders for executemany
+        or if database can not quote parameters.
+    """
+    if many or not params:
+        return sql
+    try:
+        return connection.ops.last_executed_query(cursor, sql, params)
+    except Exception:
+        logger.debug("Parameters of slow query were not quoted.", exc_info=True)
+        return sql
+
+
+def log_slow_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper, passes queries slower than SLOW_QUERY_THRESHOLD seconds to slow_query_log.
+    Statement with parameters is built here, only the cursor that ran it knows it on some databases.
+    """
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started
+        if duration >= settings.SLOW_QUERY_THRESHOLD:
+            connection = context["connection"]
+            example = executed_query(connection, context["cursor"], sql, params, many)
+            slow_query_log.submit(connection.alias, sql, params, many, duration, example)
+
+
+def install_slow_query_log(sender, connection, **kwargs):
+    """
+    connection_created signal receiver, slow queries are collected only if SLOW_QUERY_THRESHOLD is set.
+    """
+    if settings.SLOW_QUERY_THRESHOLD is not None and log_slow_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(log_slow_query)
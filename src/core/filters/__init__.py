@@ -0,0 +1,3 @@
+__all__ = ["TicketFilterBackend"]
+
+from core.filters.tickets import TicketFilterBackend
@@ -0,0 +1,71 @@
+from rest_framework.filters import BaseFilterBackend
+
+from drf_yasg import openapi
+
+from core.serializers import TicketFilterSerializer
+
+
+class TicketFilterBackend(BaseFilterBackend):
+    """
+    Ticket list filter backend.
+    Compiles all filters from query parameters into conditions of one query,
+    HashTag names are matched through join on HashTag.name without separate HashTag lookup.
+    Filters by HashTag or creator with is_archived are covered by composite indexes on Ticket.
+    """
+
+    parameters = [
+        openapi.Parameter(
+            "hash_tag",
+            openapi.IN_QUERY,
+            description="HashTag name, can be repeated or separated by comma.",
+            type=openapi.TYPE_STRING,
+        ),
+        openapi.Parameter(
+            "filter", openapi.IN_QUERY, description="Alias of hash_tag parameter.", type=openapi.TYPE_STRING
+        ),
+        openapi.Parameter("is_archived", openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN),
+        openapi.Parameter("creator", openapi.IN_QUERY, description="Creator User id.", type=openapi.TYPE_INTEGER),
+        openapi.Parameter("min_id", openapi.IN_QUERY, description="Minimal Ticket id.", type=openapi.TYPE_INTEGER),
+        openapi.Parameter("max_id", openapi.IN_QUERY, description="Maximal Ticket id.", type=openapi.TYPE_INTEGER),
+    ]
+
+    def filter_queryset(self, request, queryset, view):
+        """
+        Filters Tickets by query parameters from request.
+        Args:
+            request: Request with query parameters.
+            queryset: Ticket QuerySet.
+            view: View that filters queryset.
+        Returns:
+            Filtered QuerySet.
+        Raises:
+            ValidationError if query parameters are invalid.
+        """
+        serializer = TicketFilterSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return queryset.filter(**self.get_filter_kwargs(serializer.validated_data))
+
+    @staticmethod
+    def get_filter_kwargs(data):
+        """
+        Builds QuerySet.filter keyword arguments from validated query parameters.
+        Args:
+            data: TicketFilterSerializer validated data.
+        Returns:
+            Dict with lookups.
+        """
+        lookups = {}
+        hash_tags = data.get("hash_tag")
+        if len(hash_tags) == 1:
+            lookups["hash_tag__name"] = hash_tags[0]
+        elif hash_tags:
+            lookups["hash_tag__name__in"] = hash_tags
+        if data.get("is_archived") is not None:
+            lookups["is_archived"] = data["is_archived"]
+        if data.get("creator") is not None:
+            lookups["creator_id"] = data["creator"]
+        if data.get("min_id") is not None:
+            lookups["id__gte"] = data["min_id"]
+        if data.get("max_id") is not None:
+            lookups["id__lte"] = data["max_id"]
+        return lookups
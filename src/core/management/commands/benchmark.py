@@ -0,0 +1,46 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmarks import BENCHMARKS, compare_results, run_benchmark
+from core.benchmarks.endpoints import SERVERS
+
+
+class Command(BaseCommand):
+    help = "Runs benchmarks against configured database and prints results as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("names", nargs="*", help=f"Benchmark names, all by default: {', '.join(BENCHMARKS)}.")
+        parser.add_argument("--iterations", type=int, help="Number of iterations for each measured case.")
+        parser.add_argument("--output", help="Path to JSON file to write results to.")
+        parser.add_argument("--concurrency", type=int, help="Number of concurrent clients of load benchmarks.")
+        parser.add_argument("--wsgi-url", help="Base url of running WSGI server for load benchmarks.")
+        parser.add_argument("--asgi-url", help="Base url of running ASGI server for load benchmarks.")
+        parser.add_argument("--server", choices=SERVERS, help="Server started by endpoints benchmark.")
+        parser.add_argument("--workers", type=int, help="Number of worker processes of started server.")
+        parser.add_argument(
+            "--compare", help="Path to JSON file with results of earlier run, comparison is printed instead of results."
+        )
+
+    def handle(self, *args, **options):
+        names = options["names"] or list(BENCHMARKS)
+        unknown = set(names) - set(BENCHMARKS)
+        if unknown:
+            raise CommandError(f"Unknown benchmarks: {', '.join(sorted(unknown))}.")
+
+        benchmark_options = {
+            "iterations": options["iterations"],
+            "concurrency": options["concurrency"],
+            "wsgi_url": options["wsgi_url"],
+            "asgi_url": options["asgi_url"],
+            "server": options["server"],
+            "workers": options["workers"],
+        }
+        results = [run_benchmark(name, **benchmark_options) for name in names]
+        report = json.dumps(results, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                output.write(report)
+        if options["compare"]:
+            with open(options["compare"]) as baseline:
+                report = json.dumps(compare_results(json.load(baseline), results), indent=2)
+        self.stdout.write(report)
@@ -0,0 +1,34 @@
+import json
+import time
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmarks.factories import BENCHMARK_PASSWORD, seed_database
+
+
+class Command(BaseCommand):
+    help = "Seeds configured database with benchmark Users, HashTags and Tickets and prints their numbers as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tickets", type=int, default=10000, help="Number of Tickets, 10000 by default.")
+        parser.add_argument("--users", type=int, help="Number of Users, one per 100 Tickets by default.")
+        parser.add_argument("--hash-tags", type=int, help="Number of HashTags, one per 1000 Tickets by default.")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Objects inserted at once.")
+
+    def handle(self, *args, **options):
+        if options["tickets"] < 0 or options["batch_size"] < 1:
+            raise CommandError("Number of Tickets must not be negative and batch size must be positive.")
+
+        started = time.perf_counter()
+
+        def progress(created):
+            self.stderr.write(f"{created}/{options['tickets']} tickets, {time.perf_counter() - started:.1f}s")
+
+        created = seed_database(
+            options["tickets"],
+            users=options["users"],
+            hash_tags=options["hash_tags"],
+            batch_size=options["batch_size"],
+            progress=progress if options["verbosity"] > 1 else None,
+        )
+        report = {**created, "password": BENCHMARK_PASSWORD, "seconds": round(time.perf_counter() - started, 1)}
+        self.stdout.write(json.dumps(report, indent=2))
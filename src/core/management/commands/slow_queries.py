@@ -0,0 +1,51 @@
+import textwrap
+from django.core.management.base import BaseCommand
+from django.db.models import F
+
+from core.models import SlowQuery
+
+ORDERINGS = {
+    "total": F("total_duration").desc(),
+    "mean": (F("total_duration") / F("calls")).desc(),
+    "max": F("max_duration").desc(),
+    "calls": F("calls").desc(),
+}
+
+
+class Command(BaseCommand):
+    help = "Prints the slowest queries collected with SLOW_QUERY_THRESHOLD setting with their plans."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=10, help="Number of queries, 10 by default.")
+        parser.add_argument(
+            "--order", choices=list(ORDERINGS), default="total", help="Sort by total, mean or max time or calls."
+        )
+        parser.add_argument("--database", help="Only queries that ran on database with this alias.")
+        parser.add_argument("--reset", action="store_true", help="Delete collected queries after printing.")
+
+    def handle(self, *args, **options):
+        queries = SlowQuery.objects.all()
+        if options["database"]:
+            queries = queries.filter(database=options["database"])
+        top = list(queries.order_by(ORDERINGS[options["order"]], "id")[: options["limit"]])
+        if not top:
+            self.stdout.write("No slow queries.")
+
+        for rank, query in enumerate(top, start=1):
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f"{rank}. {query.calls} calls, total {query.total_duration * 1000:.1f} ms, "
+                    f"mean {query.total_duration / query.calls * 1000:.1f} ms, "
+                    f"max {query.max_duration * 1000:.1f} ms, database {query.database}, "
+                    f"last seen {query.last_seen:%Y-%m-%d %H:%M:%S}"
+                )
+            )
+            self.stdout.write(textwrap.indent(query.sql, "    "))
+            self.stdout.write("  Last call:")
+            self.stdout.write(textwrap.indent(query.example, "    "))
+            self.stdout.write("  Plan:")
+            self.stdout.write(textwrap.indent(query.plan or "not available", "    "))
+            self.stdout.write("")
+
+        if options["reset"]:
+            queries.delete()
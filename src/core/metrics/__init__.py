@@ -0,0 +1,17 @@
+__all__ = [
+    "PerformanceMiddleware",
+    "RequestTimings",
+    "current_timings",
+    "get_metrics_store",
+    "install_query_timing",
+    "install_serializer_timing",
+]
+
+from core.metrics.middleware import PerformanceMiddleware
+from core.metrics.stores import get_metrics_store
+from core.metrics.timings import (
+    RequestTimings,
+    current_timings,
+    install_query_timing,
+    install_serializer_timing,
+)
@@ -0,0 +1,85 @@
+import asyncio
+import random
+import time
+from django.conf import settings
+
+from core.metrics.stores import get_metrics_store
+from core.metrics.timings import RequestTimings, current_timings
+
+# Other methods are recorded as "OTHER", so clients can not add label values.
+METHODS = {"GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"}
+
+
+def _server_timing(duration, timings):
+    return (
+        f"app;dur={duration * 1000:.1f}, "
+        f'db;dur={timings.db * 1000:.1f};desc="{timings.queries} queries", '
+        f"serializer;dur={timings.serializer * 1000:.1f}"
+    )
+
+
+class PerformanceMiddleware:
+    """
+    Records wall time, status and response size of every request by url name of its view, e.g. "ticket-list",
+    requests without view are recorded as "unmatched". Share of requests set by METRICS_SAMPLE_RATE
+    also gets database queries, database time and serializer time, and "Server-Timing" header
+    if METRICS_SERVER_TIMING is on. Metrics are exposed by core.views.metrics.
+    Put it first in MIDDLEWARE, so wall time includes the rest of middleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Django checks this attribute to call middleware without a thread.
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if hasattr(self, "_is_coroutine"):
+            return self.__acall__(request)
+        timings, token = self._start()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            if token is not None:
+                current_timings.reset(token)
+        self._finish(request, response, time.perf_counter() - started, timings)
+        return response
+
+    async def __acall__(self, request):
+        timings, token = self._start()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            if token is not None:
+                current_timings.reset(token)
+        self._finish(request, response, time.perf_counter() - started, timings)
+        return response
+
+    def _start(self):
+        if random.random() >= settings.METRICS_SAMPLE_RATE:
+            return None, None
+        timings = RequestTimings()
+        return timings, current_timings.set(timings)
+
+    def _finish(self, request, response, duration, timings):
+        match = request.resolver_match
+        if response.streaming:
+            size = None
+        else:
+            # CommonMiddleware has set the header unless response was returned before it.
+            size = int(response.get("Content-Length") or len(response.content))
+        get_metrics_store().record(
+            match.url_name if match and match.url_name else "unmatched",
+            request.method if request.method in METHODS else "OTHER",
+            response.status_code,
+            duration,
+            size,
+            timings,
+        )
+        if timings is not None and settings.METRICS_SERVER_TIMING:
+            response["Server-Timing"] = _server_timing(duration, timings)
@@ -0,0 +1,134 @@
+import bisect
+import threading
+from collections import defaultdict
+
+# Upper bounds of request duration histogram buckets in seconds.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Metric name: (type, help).
+METRICS = {
+    "qna_http_requests_total": ("counter", "Requests by view, method and status code."),
+    "qna_http_request_duration_seconds": ("histogram", "Wall time of requests by view and method."),
+    "qna_http_response_size_bytes": ("summary", "Size of not streamed responses by view and method."),
+    "qna_http_sampled_requests_total": ("counter", "Requests with database and serializer timings."),
+    "qna_http_db_queries_total": ("counter", "Database queries of sampled requests."),
+    "qna_http_db_duration_seconds_total": ("counter", "Database time of sampled requests."),
+    "qna_http_serializer_duration_seconds_total": ("counter", "Serializer time of sampled requests."),
+}
+
+
+BUCKET_BOUNDS = (*map(repr, DURATION_BUCKETS), "+Inf")
+
+
+class _SeriesKeys:
+    """
+    Keys of all samples of one view and method, built once, so recording a request does not build tuples.
+    """
+
+    def __init__(self, view, method):
+        labels = (("view", view), ("method", method))
+        self.labels = labels
+        self.statuses = {}
+        self.buckets = [
+            ("qna_http_request_duration_seconds", "_bucket", (*labels, ("le", bound))) for bound in BUCKET_BOUNDS
+        ]
+        self.duration_sum = ("qna_http_request_duration_seconds", "_sum", labels)
+        self.duration_count = ("qna_http_request_duration_seconds", "_count", labels)
+        self.size_sum = ("qna_http_response_size_bytes", "_sum", labels)
+        self.size_count = ("qna_http_response_size_bytes", "_count", labels)
+        self.sampled = ("qna_http_sampled_requests_total", "", labels)
+        self.queries = ("qna_http_db_queries_total", "", labels)
+        self.db = ("qna_http_db_duration_seconds_total", "", labels)
+        self.serializer = ("qna_http_serializer_duration_seconds_total", "", labels)
+
+    def status(self, status_code):
+        key = self.statuses.get(status_code)
+        if key is None:
+            key = self.statuses[status_code] = (
+                "qna_http_requests_total",
+                "",
+                (*self.labels, ("status", str(status_code))),
+            )
+        return key
+
+
+class MetricsRegistry:
+    """
+    In-process metric values. Samples are kept as (metric name, suffix, labels) keys with float values,
+    histogram buckets are not cumulative, so a request updates one bucket, they are summed up on render.
+    """
+
+    def __init__(self):
+        self.values = defaultdict(float)
+        self._keys = {}
+        self._lock = threading.Lock()
+
+    def record(self, view, method, status_code, duration, size=None, timings=None):
+        """
+        Args:
+            view: String - url name of view, e.g. "ticket-list".
+            method: String - HTTP method.
+            status_code: Integer - response status code.
+            duration: Float - wall time in seconds.
+            size: Integer - response size in bytes, None for streamed responses.
+            timings: RequestTimings of sampled request or None.
+        """
+        with self._lock:
+            keys = self._keys.get((view, method))
+            if keys is None:
+                keys = self._keys[(view, method)] = _SeriesKeys(view, method)
+            values = self.values
+            values[keys.status(status_code)] += 1
+            values[keys.buckets[bisect.bisect_left(DURATION_BUCKETS, duration)]] += 1
+            values[keys.duration_sum] += duration
+            values[keys.duration_count] += 1
+            if size is not None:
+                values[keys.size_sum] += size
+                values[keys.size_count] += 1
+            if timings is not None:
+                values[keys.sampled] += 1
+                values[keys.queries] += timings.queries
+                values[keys.db] += timings.db
+                values[keys.serializer] += timings.serializer
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.values)
+
+
+def _format_labels(labels):
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels) + "}" if labels else ""
+
+
+def _format_value(value):
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def render_metrics(values):
+    """
+    Args:
+        values: Dict with (metric name, suffix, labels) keys and float values.
+    Returns:
+        String in Prometheus text exposition format 0.0.4.
+    """
+    samples = defaultdict(list)
+    buckets = defaultdict(dict)
+    for (name, suffix, labels), value in values.items():
+        if suffix == "_bucket":
+            buckets[(name, labels[:-1])][labels[-1][1]] = value
+        else:
+            samples[name].append((suffix, labels, value))
+    for (name, labels), counts in buckets.items():
+        total = 0
+        for bound in BUCKET_BOUNDS:
+            total += counts.get(bound, 0)
+            samples[name].append(("_bucket", (*labels, ("le", bound)), total))
+
+    lines = []
+    for name, (metric_type, description) in METRICS.items():
+        if name not in samples:
+            continue
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"]
+        for suffix, labels, value in sorted(samples[name], key=lambda sample: (sample[1][:2], sample[0])):
+            lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,134 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from django.conf import settings
+
+import redis
+
+from core.metrics.registry import MetricsRegistry, render_metrics
+from core.services.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+MEMORY_URL = "memory://"
+
+
+class MemoryMetricsStore:
+    """
+    In-process metrics, every process exposes its own requests.
+    Use it for tests and single process servers.
+    """
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def record(self, *args, **kwargs):
+        self.registry.record(*args, **kwargs)
+
+    def render(self):
+        return render_metrics(self.registry.snapshot())
+
+
+class RedisMetricsStore:
+    """
+    Metrics of all processes summed up in one Redis hash, so any process can expose them.
+    Requests are recorded in process and a daemon thread sends increments with one pipeline every flush_interval
+    seconds, before rendering too, so requests and the event loop never wait for Redis.
+    If Redis is not available metrics of current process are rendered.
+    Attributes:
+        client: redis.Redis client.
+        registry: MetricsRegistry of current process.
+        key: String - Redis hash key.
+        flush_interval: Float - seconds between flushes.
+    """
+
+    def __init__(self, client, registry, key, flush_interval):
+        self.client = client
+        self.registry = registry
+        self.key = key
+        self.flush_interval = flush_interval
+        self._flushed = {}
+        self._thread = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+    def record(self, *args, **kwargs):
+        if self._pid != os.getpid():
+            self._start()
+        self.registry.record(*args, **kwargs)
+
+    def _start(self):
+        # Thread is started in every process, forked workers do not inherit thread of the parent.
+        with self._start_lock:
+            if self._pid != os.getpid():
+                # Forked process could inherit the lock held by flush of the parent.
+                self._lock = threading.Lock()
+                self._thread = threading.Thread(target=self._run, name="metrics-flush", daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Metrics were not flushed.")
+
+    def flush(self):
+        # Only one thread flushes, metrics recorded meanwhile go with the next flush.
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            values = self.registry.snapshot()
+            increments = {key: value - self._flushed.get(key, 0) for key, value in values.items()}
+            increments = {key: value for key, value in increments.items() if value}
+            if not increments:
+                return
+            pipeline = self.client.pipeline(transaction=False)
+            for key, value in increments.items():
+                pipeline.hincrbyfloat(self.key, json.dumps(key), value)
+            pipeline.execute()
+            self._flushed = values
+        except (redis.RedisError, OSError):
+            logger.warning("Metrics store is not available, metrics are kept in process.", exc_info=True)
+        finally:
+            self._lock.release()
+
+    def render(self):
+        self.flush()
+        try:
+            values = self.client.hgetall(self.key)
+        except (redis.RedisError, OSError):
+            logger.warning("Metrics store is not available, rendering metrics of current process.", exc_info=True)
+            return render_metrics(self.registry.snapshot())
+        return render_metrics(
+            {
+                (name, suffix, tuple(map(tuple, labels))): float(value)
+                for (name, suffix, labels), value in ((json.loads(key), value) for key, value in values.items())
+            }
+        )
+
+
+_registry = MetricsRegistry()
+_memory_store = MemoryMetricsStore(_registry)
+
+
+@functools.lru_cache(maxsize=None)
+def _redis_store(url):
+    return RedisMetricsStore(get_redis(url), _registry, settings.METRICS_KEY, settings.METRICS_FLUSH_INTERVAL)
+
+
+def get_metrics_store():
+    """
+    Get store by METRICS_STORE_URL from settings.
+    Returns:
+        MemoryMetricsStore if url is "memory://", RedisMetricsStore shared by the process otherwise.
+    """
+    if settings.METRICS_STORE_URL == MEMORY_URL:
+        return _memory_store
+    return _redis_store(settings.METRICS_STORE_URL)
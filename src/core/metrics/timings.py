@@ -0,0 +1,74 @@
+import time
+from contextvars import ContextVar
+from rest_framework.serializers import BaseSerializer
+
+
+class RequestTimings:
+    """
+    Database and serializer timings of one sampled request.
+    Attributes:
+        queries: Integer - number of database queries.
+        db: Float - seconds spent in database queries.
+        serializer: Float - seconds spent in serializer "data" of the outermost serializers.
+    """
+
+    __slots__ = ("queries", "db", "serializer", "serializing")
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.serializer = 0.0
+        self.serializing = False
+
+
+# Timings of current sampled request, None otherwise. Context is copied to sync_to_async threads,
+# so queries of async views are counted too.
+current_timings = ContextVar("current_timings", default=None)
+
+
+def time_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper, counts queries of sampled requests and costs one ContextVar lookup otherwise.
+    """
+    timings = current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db += time.perf_counter() - started
+        timings.queries += 1
+
+
+def install_query_timing(sender, connection, **kwargs):
+    """
+    connection_created signal receiver, wrappers stay with connection wrapper when it reconnects.
+    """
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
+
+
+def install_serializer_timing():
+    """
+    Wraps BaseSerializer.data, which serializes instance for every DRF and values serializer,
+    nested serializers are timed as part of the outermost one.
+    """
+    data = BaseSerializer.data
+    if getattr(data.fget, "timed", False):
+        return
+
+    def timed_data(self):
+        timings = current_timings.get()
+        if timings is None or timings.serializing:
+            return data.fget(self)
+        timings.serializing = True
+        started = time.perf_counter()
+        try:
+            return data.fget(self)
+        finally:
+            timings.serializer += time.perf_counter() - started
+            timings.serializing = False
+
+    timed_data.timed = True
+    BaseSerializer.data = property(timed_data)
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_ticket_is_archived"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(fields=["hash_tag", "is_archived", "id"], name="ticket_hash_tag_archived_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(fields=["creator", "is_archived", "id"], name="ticket_creator_archived_idx"),
+        ),
+    ]
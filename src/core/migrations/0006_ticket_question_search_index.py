@@ -0,0 +1,56 @@
+from django.db import migrations
+
+# SQL is frozen here, so later changes of core.search backends do not change what this migration does.
+# Backends recreate missing parts after every migrate, see core.signals.search.
+INSTALL_SQL = {
+    "postgresql": [
+        "CREATE INDEX IF NOT EXISTS core_ticket_question_search_idx ON core_ticket "
+        "USING GIN (to_tsvector('simple'::regconfig, COALESCE(question, '')))",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS core_ticket_fts USING fts5("
+        "question, content='core_ticket', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        "CREATE TRIGGER IF NOT EXISTS core_ticket_fts_insert AFTER INSERT ON core_ticket BEGIN "
+        "INSERT INTO core_ticket_fts(rowid, question) VALUES (new.id, new.question); END",
+        "CREATE TRIGGER IF NOT EXISTS core_ticket_fts_delete AFTER DELETE ON core_ticket BEGIN "
+        "INSERT INTO core_ticket_fts(core_ticket_fts, rowid, question) VALUES ('delete', old.id, old.question); END",
+        "CREATE TRIGGER IF NOT EXISTS core_ticket_fts_update AFTER UPDATE OF question ON core_ticket BEGIN "
+        "INSERT INTO core_ticket_fts(core_ticket_fts, rowid, question) VALUES ('delete', old.id, old.question); "
+        "INSERT INTO core_ticket_fts(rowid, question) VALUES (new.id, new.question); END",
+        "INSERT INTO core_ticket_fts(core_ticket_fts) VALUES ('rebuild')",
+    ],
+}
+
+UNINSTALL_SQL = {
+    "postgresql": [
+        "DROP INDEX IF EXISTS core_ticket_question_search_idx",
+    ],
+    "sqlite": [
+        "DROP TRIGGER IF EXISTS core_ticket_fts_insert",
+        "DROP TRIGGER IF EXISTS core_ticket_fts_delete",
+        "DROP TRIGGER IF EXISTS core_ticket_fts_update",
+        "DROP TABLE IF EXISTS core_ticket_fts",
+    ],
+}
+
+
+def install_search_index(apps, schema_editor):
+    # Other vendors search without index.
+    for sql in INSTALL_SQL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def uninstall_search_index(apps, schema_editor):
+    for sql in UNINSTALL_SQL.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_ticket_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:32
+
+import uuid
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def copy_value_to_uuid(apps, schema_editor):
+    """
+    Parse string values into new UUID column, tokens with malformed values could never be matched and are deleted.
+    """
+    Token = apps.get_model("core", "Token")
+    tokens, malformed = [], []
+    for token in Token.objects.only("id", "value").iterator(chunk_size=BATCH_SIZE):
+        try:
+            token.value_uuid = uuid.UUID(token.value)
+        except (TypeError, ValueError):
+            malformed.append(token.id)
+            continue
+        tokens.append(token)
+        if len(tokens) >= BATCH_SIZE:
+            Token.objects.bulk_update(tokens, ["value_uuid"])
+            tokens = []
+    Token.objects.bulk_update(tokens, ["value_uuid"])
+    Token.objects.filter(id__in=malformed).delete()
+
+
+def copy_uuid_to_value(apps, schema_editor):
+    Token = apps.get_model("core", "Token")
+    tokens = []
+    for token in Token.objects.only("id", "value_uuid").iterator(chunk_size=BATCH_SIZE):
+        token.value = str(token.value_uuid)
+        tokens.append(token)
+        if len(tokens) >= BATCH_SIZE:
+            Token.objects.bulk_update(tokens, ["value"])
+            tokens = []
+    Token.objects.bulk_update(tokens, ["value"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_ticket_question_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="token",
+            name="value_uuid",
+            field=models.UUIDField(null=True),
+        ),
+        migrations.AlterField(
+            model_name="token",
+            name="value",
+            field=models.CharField(max_length=200, null=True),
+        ),
+        migrations.RunPython(copy_value_to_uuid, copy_uuid_to_value),
+        migrations.RemoveField(
+            model_name="token",
+            name="value",
+        ),
+        migrations.RenameField(
+            model_name="token",
+            old_name="value_uuid",
+            new_name="value",
+        ),
+        migrations.AlterField(
+            model_name="token",
+            name="value",
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name="token",
+            index=models.Index(fields=["value", "token_type", "expiration_date"], name="token_value_type_exp_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="token",
+            index=models.Index(fields=["expiration_date"], name="token_expiration_idx"),
+        ),
+    ]
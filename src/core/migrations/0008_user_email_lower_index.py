@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:33
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_token_uuid_value"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(django.db.models.functions.text.Lower("email"), name="user_email_lower_idx"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-18 06:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_timestamps"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(fields=["updated_at", "id"], name="ticket_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ticket",
+            index=models.Index(fields=["creator", "updated_at", "id"], name="ticket_creator_updated_idx"),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.25 on 2026-10-18 07:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_ticket_updated_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SlowQuery",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("fingerprint", models.CharField(max_length=32, unique=True)),
+                ("database", models.CharField(max_length=100)),
+                ("sql", models.TextField()),
+                ("example", models.TextField()),
+                ("calls", models.PositiveBigIntegerField(default=0)),
+                ("total_duration", models.FloatField(default=0)),
+                ("max_duration", models.FloatField(default=0)),
+                ("plan", models.TextField(blank=True)),
+                ("first_seen", models.DateTimeField(auto_now_add=True)),
+                ("last_seen", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name_plural": "slow queries",
+            },
+        ),
+    ]
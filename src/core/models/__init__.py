@@ -1,4 +1,5 @@
-__all__ = ["User", "Token", "TokenTypeEnum", "HashTag", "Ticket"]
+__all__ = ["User", "Token", "TokenTypeEnum", "HashTag", "Ticket", "SlowQuery"]
 
 from core.models.authentication import Token, TokenTypeEnum, User
+from core.models.diagnostics import SlowQuery
 from core.models.ticket import HashTag, Ticket
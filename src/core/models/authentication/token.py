@@ -17,31 +17,67 @@ class TokenTypeEnum(models.TextChoices):
     RESET_PASSWORD = _("RESET PASSWORD")
 
 
+class TokenQuerySet(models.QuerySet):
+    """
+    Token QuerySet with lookups of valid and expired tokens.
+    """
+
+    def get_valid(self, value, token_type):
+        """
+        Get not expired token of given type, served by (value, token_type, expiration_date) index.
+        Args:
+            value: String or UUID - token value from client.
+            token_type: String - One of TokenTypeEnum value.
+        Returns:
+            Token.
+        Raises:
+            Token.DoesNotExist if value is not UUID or there is no valid token with such value.
+        """
+        try:
+            value = value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+        except (TypeError, ValueError, AttributeError):
+            raise self.model.DoesNotExist("Token value is not UUID.")
+        return self.get(value=value, token_type=token_type, expiration_date__gt=timezone.now())
+
+    def expired(self):
+        return self.filter(expiration_date__lte=timezone.now())
+
+
 class Token(models.Model):
     """
     Token Django ORM model - token user can verify email and reset password.
     Attributes:
-        value: String - uuid4 string.
+        value: UUID - unique uuid4.
         token_type: String - One of TokenTypeEnum value.
         expiration_date: DateTime - time when token will be expire.
         user: Foreign key to User model.
     """
 
-    value = models.CharField(max_length=200)
+    value = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     token_type = models.CharField(
         max_length=55, choices=TokenTypeEnum.choices, default=TokenTypeEnum.EMAIL_VERIFICATION
     )
     expiration_date = models.DateTimeField()
     user = models.ForeignKey("User", on_delete=models.CASCADE)
 
+    objects = TokenQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["value", "token_type", "expiration_date"], name="token_value_type_exp_idx"),
+            models.Index(fields=["expiration_date"], name="token_expiration_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         """
-        Override Model.save() method we can set value to uuid4 and
-        expiration_time to now() + VERIFICATION_TOKEN_EXPIRATION_TIME from settings
+        Override Model.save() method we can set expiration_time of new token
+        to now() + VERIFICATION_TOKEN_EXPIRATION_TIME from settings, value is set to uuid4 by default
         Args:
             *args: Model Parameters.
             **kwargs: Model Parameters.
         """
-        self.value = uuid.uuid4()
-        self.expiration_date = timezone.now() + datetime.timedelta(seconds=settings.VERIFICATION_TOKEN_EXPIRATION_TIME)
+        if self._state.adding and self.expiration_date is None:
+            self.expiration_date = timezone.now() + datetime.timedelta(
+                seconds=settings.VERIFICATION_TOKEN_EXPIRATION_TIME
+            )
         super(Token, self).save(*args, **kwargs)
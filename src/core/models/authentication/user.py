@@ -1,5 +1,7 @@
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 
@@ -18,6 +20,17 @@ class NoUserNameUserManager(UserManager):
         """
         super().create_superuser(username=email, email=email, password=password)
 
+    def by_email(self, email):
+        """
+        Case-insensitive lookup by email, served by functional index on LOWER(email).
+        Both sides are lowered by database, so lookup matches index expression exactly.
+        Args:
+            email: String with Email.
+        Returns:
+            QuerySet with User with given email.
+        """
+        return self.alias(email_lower=Lower("email")).filter(email_lower=Lower(Value(email)))
+
 
 class User(AbstractUser):
     """
@@ -36,6 +49,9 @@ class User(AbstractUser):
     REQUIRED_FIELDS = []
     objects = NoUserNameUserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [models.Index(Lower("email"), name="user_email_lower_idx")]
+
     def save(self, *args, **kwargs):
         """
         Save User with given parameters from args and kwargs.
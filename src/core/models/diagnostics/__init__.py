@@ -0,0 +1,3 @@
+__all__ = ["SlowQuery"]
+
+from core.models.diagnostics.slow_queries import SlowQuery
@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class SlowQuery(models.Model):
+    """
+    SlowQuery Django ORM model
+    Statistics of queries slower than SLOW_QUERY_THRESHOLD grouped by normalized SQL, see core.db.slow_queries.
+    Attributes:
+        fingerprint: String - hash of normalized SQL and database alias.
+        database: String - database alias the query ran on.
+        sql: String - normalized SQL with literals and placeholders replaced by "?".
+        example: String - SQL of the last slow call with parameters quoted by database,
+            with "%s" placeholders if parameters can not be quoted, e.g. of executemany.
+        calls: Integer - number of slow calls.
+        total_duration: Float - seconds spent in slow calls.
+        max_duration: Float - seconds of the slowest call.
+        plan: String - query plan by EXPLAIN ("EXPLAIN QUERY PLAN" on SQLite) of the first slow call.
+        first_seen: Datetime of the first slow call.
+        last_seen: Datetime of the last slow call.
+    """
+
+    fingerprint = models.CharField(max_length=32, unique=True)
+    database = models.CharField(max_length=100)
+    sql = models.TextField()
+    example = models.TextField()
+    calls = models.PositiveBigIntegerField(default=0)
+    total_duration = models.FloatField(default=0)
+    max_duration = models.FloatField(default=0)
+    plan = models.TextField(blank=True)
+    first_seen = models.DateTimeField(auto_now_add=True)
+    last_seen = models.DateTimeField()
+
+    class Meta:
+        verbose_name_plural = "slow queries"
@@ -9,7 +9,11 @@ class HashTag(models.Model):
     Attributes:
         name: String - Name of HashTag category.
         description: String - Description of HashTag.
+        created_at: Datetime when HashTag was created.
+        updated_at: Datetime when HashTag was changed last time.
     """
 
     name = models.CharField(max_length=25, unique=True)
     description = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
@@ -1,6 +1,24 @@
 from django.db import models
 
 
+class TicketQuerySet(models.QuerySet):
+    """
+    Ticket QuerySet with shared query builders for ticket read paths.
+    """
+
+    def for_read(self):
+        """
+        Joins HashTag in the same query and fetches only columns TicketSerializer represents,
+        so list of N Tickets costs one query instead of N + 1.
+        Creator is represented by primary key, so creator_id column is enough and User is not joined.
+        Returns:
+            QuerySet with select_related HashTag and deferred unused columns.
+        """
+        return self.select_related("hash_tag").only(
+            "id", "question", "is_archived", "created_at", "updated_at", "creator", "hash_tag__name"
+        )
+
+
 class Ticket(models.Model):
     """
     Ticket Django ORM model
@@ -10,9 +28,23 @@ class Ticket(models.Model):
         hash_tag: ForeignKey to HashTag, type of ticket.
         question: String with question, max length is 4000 because of telegram restrictions.
         is_archived: Boolean, True if ticket marked as solved or closed.
+        created_at: Datetime when ticket was created.
+        updated_at: Datetime when ticket was changed last time, conditional UPDATEs set it explicitly.
     """
 
     creator = models.ForeignKey("User", on_delete=models.CASCADE)
     hash_tag = models.ForeignKey("HashTag", on_delete=models.CASCADE, blank=False)
     question = models.CharField(max_length=4000, blank=False)
     is_archived = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = TicketQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["hash_tag", "is_archived", "id"], name="ticket_hash_tag_archived_idx"),
+            models.Index(fields=["creator", "is_archived", "id"], name="ticket_creator_archived_idx"),
+            models.Index(fields=["updated_at", "id"], name="ticket_updated_idx"),
+            models.Index(fields=["creator", "updated_at", "id"], name="ticket_creator_updated_idx"),
+        ]
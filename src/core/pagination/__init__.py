@@ -0,0 +1,4 @@
+__all__ = ["IdCursorPagination", "BoundedOffsetPagination"]
+
+from core.pagination.cursor import IdCursorPagination
+from core.pagination.offset import BoundedOffsetPagination
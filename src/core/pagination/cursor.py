@@ -0,0 +1,151 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from django.db.models import QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+# Ids are 64-bit signed integers, bigger cursors overflow database parameters.
+MAX_ID = 2**63 - 1
+
+
+class IdCursorPagination(BasePagination):
+    """
+    Keyset pagination with stable ordering on id.
+    Every page is fetched with "WHERE id > cursor ORDER BY id LIMIT page_size + 1",
+    so request cost does not depend on table size or on how far the client has scrolled.
+    Attributes:
+        page_size: Integer - default number of items on page, REST_FRAMEWORK["PAGE_SIZE"] from settings.
+        max_page_size: Integer - upper bound for page size requested by client.
+        cursor_query_param: String - query parameter with opaque cursor token.
+        page_size_query_param: String - query parameter with requested page size.
+        total_query_param: String - query parameter to turn total counting on or off, e.g. "?total=true".
+        include_total: Boolean - count all items when client did not ask, off as COUNT(*) reads the whole
+            filtered table on every page.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = 1000
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    total_query_param = "total"
+    include_total = False
+    invalid_cursor_message = _("Invalid cursor.")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Get one page of queryset after cursor from request.
+        Args:
+            queryset: QuerySet to paginate, its ordering is replaced with ordering by id,
+                or sequence of items already ordered by id, e.g. from cache.
+                Items are model instances or tuples with id first, e.g. from ValuesSerializer.values().
+            request: Request with pagination query parameters.
+            view: View that paginates queryset.
+        Returns:
+            List with page items.
+        Raises:
+            NotFound if cursor is invalid.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        after = self.decode_cursor(request)
+        if isinstance(queryset, QuerySet):
+            self.total = queryset.count() if self.get_include_total(request) else None
+            if after is not None:
+                queryset = queryset.filter(id__gt=after)
+            page = list(queryset.order_by("id")[: page_size + 1])
+        else:
+            self.total = len(queryset) if self.get_include_total(request) else None
+            items = queryset if after is None else [item for item in queryset if self.get_item_id(item) > after]
+            page = list(items[: page_size + 1])
+
+        has_next = len(page) > page_size
+        page = page[:page_size]
+        self.next_cursor = self.encode_cursor(self.get_item_id(page[-1])) if has_next else None
+        return page
+
+    def get_paginated_response(self, data):
+        """
+        Wraps page data with next page link and total.
+        Args:
+            data: Serialized page items.
+        Returns:
+            Response with {"next": link or null, "total": count, "results": data}, total is omitted if turned off.
+        """
+        response = OrderedDict([("next", self.get_next_link())])
+        if self.total is not None:
+            response["total"] = self.total
+        response["results"] = data
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "total": {"type": "integer", "example": 123},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        """
+        Get page size from request query parameters or default one.
+        Args:
+            request: Request with query parameters.
+        Returns:
+            Integer - page size, not greater than max_page_size.
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_include_total(self, request):
+        value = request.query_params.get(self.total_query_param)
+        if value is None:
+            return self.include_total
+        return value.lower() not in ("0", "false", "no", "off")
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    @staticmethod
+    def get_item_id(item):
+        return item[0] if isinstance(item, tuple) else item.id
+
+    @staticmethod
+    def encode_cursor(item_id):
+        return urlsafe_b64encode(str(item_id).encode("ascii")).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, request):
+        """
+        Decodes id of the last item on previous page from request cursor.
+        Args:
+            request: Request with query parameters.
+        Returns:
+            Integer id or None if there is no cursor in request.
+        Raises:
+            NotFound if cursor is invalid or its id is out of id range.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            item_id = int(urlsafe_b64decode(padded.encode("ascii")).decode("ascii"))
+        except (TypeError, ValueError, UnicodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        if not 1 <= item_id <= MAX_ID:
+            raise NotFound(self.invalid_cursor_message)
+        return item_id
@@ -0,0 +1,77 @@
+from collections import OrderedDict
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class BoundedOffsetPagination(BasePagination):
+    """
+    Limit offset pagination for results that are not ordered by id, e.g. ranked search results.
+    Offset is bounded by max_offset and nothing is counted, so every page is read in bounded time.
+    Attributes:
+        default_limit: Integer - default number of items on page, REST_FRAMEWORK["PAGE_SIZE"] from settings.
+        max_limit: Integer - upper bound for page size requested by client.
+        max_offset: Integer - upper bound for offset, items after it are not reachable.
+        limit_query_param: String - query parameter with requested page size.
+        offset_query_param: String - query parameter with offset.
+    """
+
+    default_limit = api_settings.PAGE_SIZE
+    max_limit = 100
+    max_offset = 1000
+    limit_query_param = "limit"
+    offset_query_param = "offset"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Get one page of queryset.
+        Args:
+            queryset: Ordered QuerySet to paginate.
+            request: Request with pagination query parameters.
+            view: View that paginates queryset.
+        Returns:
+            List with page items.
+        """
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = self.get_offset(request)
+
+        page = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(page) > self.limit and self.offset + self.limit <= self.max_offset
+        return page[: self.limit]
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([("next", self.get_next_link()), ("results", data)]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return min(self.default_limit, self.max_limit)
+        if limit <= 0:
+            return min(self.default_limit, self.max_limit)
+        return min(limit, self.max_limit)
+
+    def get_offset(self, request):
+        try:
+            offset = int(request.query_params[self.offset_query_param])
+        except (KeyError, ValueError):
+            return 0
+        return min(max(offset, 0), self.max_offset)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
@@ -0,0 +1,3 @@
+__all__ = ["FastJSONRenderer", "render_json"]
+
+from core.renderers.json import FastJSONRenderer, render_json
@@ -0,0 +1,46 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed, output is byte-identical to JSONRenderer
+    with default compact settings: UTF-8 without ASCII escaping and with escaped U+2028 and U+2029.
+    Falls back to JSONRenderer when orjson is not installed, indentation is requested
+    or data has values orjson can not encode, e.g. integers out of 64-bit range.
+    """
+
+    _default_encoder = JSONEncoder()
+    # Dates and dataclasses are encoded by DRF JSONEncoder, orjson formats them differently.
+    _options = (
+        (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS) if orjson else 0
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        fallback = orjson is None or self.ensure_ascii or not self.compact
+        if fallback or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(data, default=self._default_encoder.default, option=self._options)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+        # JSONRenderer escapes line and paragraph separators, they are invalid in JavaScript string literals.
+        return content.replace("\u2028".encode(), b"\\u2028").replace("\u2029".encode(), b"\\u2029")
+
+
+def render_json(data):
+    """
+    Render data with FastJSONRenderer outside of DRF views.
+    Args:
+        data: JSON serializable data.
+    Returns:
+        Bytes with JSON.
+    """
+    return FastJSONRenderer().render(data)
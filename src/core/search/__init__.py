@@ -0,0 +1,3 @@
+__all__ = ["get_search_backend"]
+
+from core.search.backends import get_search_backend
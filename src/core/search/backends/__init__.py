@@ -0,0 +1,40 @@
+__all__ = [
+    "BaseSearchBackend",
+    "PostgreSQLSearchBackend",
+    "SQLiteSearchBackend",
+    "get_search_backend",
+]
+
+from django.conf import settings
+from django.db import connections, router
+from django.utils.module_loading import import_string
+
+from core.search.backends.base import BaseSearchBackend
+from core.search.backends.postgresql import PostgreSQLSearchBackend
+from core.search.backends.sqlite import SQLiteSearchBackend
+
+BACKENDS_BY_VENDOR = {
+    "postgresql": PostgreSQLSearchBackend,
+    "sqlite": SQLiteSearchBackend,
+}
+
+
+def get_search_backend(using=None):
+    """
+    Get Ticket search backend for database connection.
+    Backend is taken from TICKET_SEARCH_BACKEND setting if it is set, otherwise it is chosen by database vendor,
+    unknown vendors fall back to BaseSearchBackend without index.
+    Args:
+        using: Database alias, by default database that Ticket is read from.
+    Returns:
+        Search backend instance.
+    """
+    from core.models import Ticket
+
+    connection = connections[using or router.db_for_read(Ticket)]
+    backend_path = getattr(settings, "TICKET_SEARCH_BACKEND", None)
+    if backend_path:
+        backend_class = import_string(backend_path)
+    else:
+        backend_class = BACKENDS_BY_VENDOR.get(connection.vendor, BaseSearchBackend)
+    return backend_class(connection)
@@ -0,0 +1,54 @@
+import re
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class BaseSearchBackend:
+    """
+    Ticket.question search backend without index.
+    Subclasses keep inverted index of questions in database and rank matches by relevance.
+    Attributes:
+        connection: Database connection index is kept in.
+        max_words: Integer - words after this number in search query are ignored.
+    """
+
+    max_words = 16
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def install(self):
+        """
+        Creates index structures in database, must be safe to call more than once.
+        """
+
+    def uninstall(self):
+        """
+        Drops index structures from database.
+        """
+
+    def get_words(self, text):
+        """
+        Splits search query into words, so special characters of query languages can not break the query.
+        Args:
+            text: String with search query.
+        Returns:
+            List of words.
+        """
+        return WORD_RE.findall(text)[: self.max_words]
+
+    def search(self, queryset, text):
+        """
+        Filters Tickets that contain all words of search query.
+        Args:
+            queryset: Ticket QuerySet.
+            text: String with search query.
+        Returns:
+            QuerySet ordered by relevance, most relevant first.
+        """
+        words = self.get_words(text)
+        if not words:
+            return queryset.none()
+        for word in words:
+            queryset = queryset.filter(question__icontains=word)
+        return queryset.order_by("-id")
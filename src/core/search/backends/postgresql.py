@@ -0,0 +1,41 @@
+from core.search.backends.base import BaseSearchBackend
+
+
+class PostgreSQLSearchBackend(BaseSearchBackend):
+    """
+    PostgreSQL search backend, matches tsvector of Ticket.question with GIN expression index.
+    Index is built on the same expression django.contrib.postgres SearchVector compiles to,
+    so PostgreSQL keeps it up to date on every insert and update and uses it for search queries.
+    Attributes:
+        config: String - text search configuration, "simple" does not depend on question language.
+        index_name: String - name of GIN index.
+    """
+
+    config = "simple"
+    index_name = "core_ticket_question_search_idx"
+
+    def install(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.index_name} ON core_ticket "
+                f"USING GIN (to_tsvector('{self.config}'::regconfig, COALESCE(question, '')))"
+            )
+
+    def uninstall(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX IF EXISTS {self.index_name}")
+
+    def search(self, queryset, text):
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+        words = self.get_words(text)
+        if not words:
+            return queryset.none()
+
+        vector = SearchVector("question", config=self.config)
+        query = SearchQuery(" ".join(words), config=self.config, search_type="plain")
+        return (
+            queryset.annotate(search=vector, rank=SearchRank(vector, query))
+            .filter(search=query)
+            .order_by("-rank", "-id")
+        )
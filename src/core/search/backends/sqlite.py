@@ -0,0 +1,71 @@
+from core.search.backends.base import BaseSearchBackend
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """
+    SQLite search backend, external content FTS5 table over core_ticket kept up to date by triggers,
+    so every create, close or bulk update of Ticket is indexed in the same transaction.
+    Matches are ranked with bm25.
+    Attributes:
+        table: String - name of FTS5 table.
+        triggers: Dict - trigger name to SQL that creates it.
+    """
+
+    table = "core_ticket_fts"
+    triggers = {
+        "core_ticket_fts_insert": (
+            "CREATE TRIGGER IF NOT EXISTS core_ticket_fts_insert AFTER INSERT ON core_ticket BEGIN "
+            "INSERT INTO core_ticket_fts(rowid, question) VALUES (new.id, new.question); END"
+        ),
+        "core_ticket_fts_delete": (
+            "CREATE TRIGGER IF NOT EXISTS core_ticket_fts_delete AFTER DELETE ON core_ticket BEGIN "
+            "INSERT INTO core_ticket_fts(core_ticket_fts, rowid, question) VALUES ('delete', old.id, old.question); "
+            "END"
+        ),
+        "core_ticket_fts_update": (
+            "CREATE TRIGGER IF NOT EXISTS core_ticket_fts_update AFTER UPDATE OF question ON core_ticket BEGIN "
+            "INSERT INTO core_ticket_fts(core_ticket_fts, rowid, question) VALUES ('delete', old.id, old.question); "
+            "INSERT INTO core_ticket_fts(rowid, question) VALUES (new.id, new.question); END"
+        ),
+    }
+
+    def install(self):
+        """
+        Creates FTS5 table and triggers.
+        SQLite migrations rebuild core_ticket when its schema changes and triggers are dropped with old table,
+        so missing triggers are created again and index is rebuilt from core_ticket.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                f"question, content='core_ticket', content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+            )
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'core_ticket'",
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+            if set(self.triggers) <= existing:
+                return
+            for sql in self.triggers.values():
+                cursor.execute(sql)
+            cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('rebuild')")
+
+    def uninstall(self):
+        with self.connection.cursor() as cursor:
+            for name in self.triggers:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(f"DROP TABLE IF EXISTS {self.table}")
+
+    def search(self, queryset, text):
+        words = self.get_words(text)
+        if not words:
+            return queryset.none()
+
+        match = " ".join('"{}"'.format(word) for word in words)
+        return queryset.extra(
+            tables=[self.table],
+            where=[f"{self.table}.rowid = core_ticket.id", f"{self.table} MATCH %s"],
+            params=[match],
+            select={"rank": f"{self.table}.rank"},
+            order_by=["rank", "-id"],
+        )
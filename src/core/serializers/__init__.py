@@ -6,10 +6,21 @@ __all__ = [
     "ForgotPasswordSerializer",
     "ResetPasswordSerializer",
     "TicketSerializer",
+    "TicketBulkCloseSerializer",
+    "TicketBulkCreateSerializer",
+    "TicketChangesSerializer",
     "TicketCreateSerializer",
     "TicketCloseSerializer",
+    "TicketExportSerializer",
+    "TicketFilterSerializer",
+    "TicketSearchSerializer",
+    "TicketValuesSerializer",
     "HashTagCreateSerializer",
     "HashTagSerializer",
+    "HashTagValuesSerializer",
+    "UserValuesSerializer",
+    "UserWithTokenValuesSerializer",
+    "ValuesSerializer",
 ]
 
 from core.serializers.authentication import (
@@ -18,11 +29,25 @@ from core.serializers.authentication import (
     ResetPasswordSerializer,
     UserSignInSerializer,
     UserSignUpSerializer,
+    UserValuesSerializer,
     UserWithTokenSerializer,
+    UserWithTokenValuesSerializer,
+)
+from core.serializers.hash_tags import (
+    HashTagCreateSerializer,
+    HashTagSerializer,
+    HashTagValuesSerializer,
 )
-from core.serializers.hash_tags import HashTagCreateSerializer, HashTagSerializer
 from core.serializers.tickets import (
+    TicketBulkCloseSerializer,
+    TicketBulkCreateSerializer,
+    TicketChangesSerializer,
     TicketCloseSerializer,
     TicketCreateSerializer,
+    TicketExportSerializer,
+    TicketFilterSerializer,
+    TicketSearchSerializer,
     TicketSerializer,
+    TicketValuesSerializer,
 )
+from core.serializers.values import ValuesSerializer
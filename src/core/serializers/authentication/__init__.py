@@ -5,6 +5,8 @@ __all__ = [
     "ConfirmEmailSerializer",
     "ForgotPasswordSerializer",
     "ResetPasswordSerializer",
+    "UserValuesSerializer",
+    "UserWithTokenValuesSerializer",
 ]
 
 from core.serializers.authentication.confirm_email import ConfirmEmailSerializer
@@ -13,3 +15,7 @@ from core.serializers.authentication.reset_password import ResetPasswordSerializ
 from core.serializers.authentication.sign_in import UserSignInSerializer
 from core.serializers.authentication.sign_up import UserSignUpSerializer
 from core.serializers.authentication.user_with_token import UserWithTokenSerializer
+from core.serializers.authentication.values import (
+    UserValuesSerializer,
+    UserWithTokenValuesSerializer,
+)
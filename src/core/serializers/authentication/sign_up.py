@@ -31,7 +31,7 @@ class UserSignUpSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError if user with email already exist or password is not strong enough.
         """
-        if User.objects.filter(email=data["email"]).first():
+        if User.objects.by_email(data["email"]).exists():
             raise serializers.ValidationError({"email": _("User with this email already exist.")})
 
         user = User(
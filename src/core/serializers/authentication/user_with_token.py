@@ -1,7 +1,7 @@
 from rest_framework import serializers
-from rest_framework.authtoken.models import Token
 
 from core.serializers.authentication.user import UserSerializer
+from core.services import get_auth_token_key
 
 
 class UserWithTokenSerializer(serializers.ModelSerializer):
@@ -15,5 +15,4 @@ class UserWithTokenSerializer(serializers.ModelSerializer):
         fields = UserSerializer.Meta.fields + ("token",)
 
     def get_token(self, obj):
-        token, created = Token.objects.get_or_create(user=obj)
-        return token.key
+        return get_auth_token_key(obj)
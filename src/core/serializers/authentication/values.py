@@ -0,0 +1,27 @@
+from core.serializers.values import ValuesSerializer
+from core.services import get_auth_token_key
+
+
+class UserValuesSerializer(ValuesSerializer):
+    """
+    Fast read only UserSerializer, output is identical to UserSerializer.
+    """
+
+    columns = (
+        ("id", "id"),
+        ("first_name", "first_name"),
+        ("last_name", "last_name"),
+        ("email", "email"),
+    )
+
+
+class UserWithTokenValuesSerializer(UserValuesSerializer):
+    """
+    Fast read only UserWithTokenSerializer, output is identical to UserWithTokenSerializer.
+    Token is resolved by User, so it represents model instances only.
+    """
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data["token"] = get_auth_token_key(instance)
+        return data
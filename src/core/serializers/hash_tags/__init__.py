@@ -1,4 +1,5 @@
-__all__ = ["HashTagCreateSerializer", "HashTagSerializer"]
+__all__ = ["HashTagCreateSerializer", "HashTagSerializer", "HashTagValuesSerializer"]
 
 from core.serializers.hash_tags.create import HashTagCreateSerializer
 from core.serializers.hash_tags.retrieve import HashTagSerializer
+from core.serializers.hash_tags.values import HashTagValuesSerializer
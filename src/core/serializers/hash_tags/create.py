@@ -2,6 +2,7 @@ from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
 from core.models import HashTag
+from core.services import hash_tag_catalog
 
 
 class HashTagCreateSerializer(serializers.ModelSerializer):
@@ -15,7 +16,7 @@ class HashTagCreateSerializer(serializers.ModelSerializer):
         model = HashTag
         fields = ("name", "description")
         extra_kwargs = {
-            "name": {"required": True},
+            "name": {"required": True, "validators": []},
             "description": {"required": True},
         }
 
@@ -27,7 +28,7 @@ class HashTagCreateSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError if hash_tag with given name already exist
         """
-        if HashTag.objects.filter(name=data["name"]).first():
+        if hash_tag_catalog.get_by_name(data["name"]) is not None:
             raise serializers.ValidationError({"hash_tag": data["name"] + " " + _("HashTag already exist.")})
 
         return data
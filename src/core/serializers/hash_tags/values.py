@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+from core.serializers.values import ValuesSerializer
+
+
+class HashTagValuesSerializer(ValuesSerializer):
+    """
+    Fast read only HashTagSerializer, output is identical to HashTagSerializer.
+    """
+
+    columns = (
+        ("id", "id"),
+        ("name", "name"),
+        ("description", "description"),
+        ("created_at", "created_at", serializers.DateTimeField()),
+        ("updated_at", "updated_at", serializers.DateTimeField()),
+    )
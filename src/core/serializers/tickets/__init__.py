@@ -1,5 +1,25 @@
-__all__ = ["TicketCreateSerializer", "TicketSerializer", "TicketCloseSerializer"]
+__all__ = [
+    "TicketBulkCloseSerializer",
+    "TicketBulkCreateSerializer",
+    "TicketChangesSerializer",
+    "TicketCreateSerializer",
+    "TicketExportSerializer",
+    "TicketSerializer",
+    "TicketCloseSerializer",
+    "TicketFilterSerializer",
+    "TicketSearchSerializer",
+    "TicketValuesSerializer",
+]
 
+from core.serializers.tickets.bulk import (
+    TicketBulkCloseSerializer,
+    TicketBulkCreateSerializer,
+)
+from core.serializers.tickets.changes import TicketChangesSerializer
 from core.serializers.tickets.close import TicketCloseSerializer
 from core.serializers.tickets.create import TicketCreateSerializer
+from core.serializers.tickets.export import TicketExportSerializer
+from core.serializers.tickets.filter import TicketFilterSerializer
 from core.serializers.tickets.retrieve import TicketSerializer
+from core.serializers.tickets.search import TicketSearchSerializer
+from core.serializers.tickets.values import TicketValuesSerializer
@@ -0,0 +1,41 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from core.pagination.cursor import MAX_ID
+
+
+class TicketBulkCreateSerializer(serializers.Serializer):
+    """
+    Ticket bulk create data serializer.
+    Validates only shape of request, every ticket is validated by TicketCreateSerializer separately,
+    so invalid tickets are reported one by one and do not reject the whole batch.
+    """
+
+    tickets = serializers.ListField(
+        child=serializers.DictField(), allow_empty=False, max_length=settings.TICKET_BULK_MAX_SIZE
+    )
+
+    def update(self, instance, validated_data):
+        raise NotImplementedError()
+
+    def create(self, validated_data):
+        raise NotImplementedError()
+
+
+class TicketBulkCloseSerializer(serializers.Serializer):
+    """
+    Ticket bulk close data serializer.
+    Represent list of Ticket ids.
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=MAX_ID),
+        allow_empty=False,
+        max_length=settings.TICKET_BULK_MAX_SIZE,
+    )
+
+    def update(self, instance, validated_data):
+        raise NotImplementedError()
+
+    def create(self, validated_data):
+        raise NotImplementedError()
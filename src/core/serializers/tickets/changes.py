@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+from core.services.tickets.changes import decode_sync_token
+
+
+class TicketChangesSerializer(serializers.Serializer):
+    """
+    Ticket changes query parameters serializer.
+    Represent sync token from previous response and maximum number of Tickets.
+    """
+
+    since = serializers.CharField(required=False, max_length=64)
+    page_size = serializers.IntegerField(
+        min_value=1, max_value=settings.TICKET_CHANGES_MAX_PAGE_SIZE, default=settings.TICKET_CHANGES_PAGE_SIZE
+    )
+
+    def validate_since(self, value):
+        """
+        Args:
+            value: String sync token.
+        Returns:
+            SyncToken.
+        Raises:
+            ValidationError if token is invalid.
+        """
+        try:
+            return decode_sync_token(value)
+        except ValueError:
+            raise serializers.ValidationError(_("Invalid sync token."))
+
+    def update(self, instance, validated_data):
+        raise NotImplementedError()
+
+    def create(self, validated_data):
+        raise NotImplementedError()
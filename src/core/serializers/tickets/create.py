@@ -1,7 +1,8 @@
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
-from core.models import HashTag, Ticket
+from core.models import Ticket
+from core.services import hash_tag_catalog
 
 
 class TicketCreateSerializer(serializers.ModelSerializer):
@@ -25,12 +26,16 @@ class TicketCreateSerializer(serializers.ModelSerializer):
         Validates data from serializer
         Args:
             data: Serializer data - dict with hash_tag.name and question.
+        Returns:
+            Data where hash_tag is HashTag instance with given name.
         Raises:
             ValidationError if hash_tag with given name does not exist
         """
-        if HashTag.objects.filter(name=data["hash_tag"]["name"]).first() is None:
+        hash_tag = hash_tag_catalog.get_by_name(data["hash_tag"]["name"])
+        if hash_tag is None:
             raise serializers.ValidationError(
                 {"hash_tag": data["hash_tag"]["name"] + " " + _("HashTag does not exist.")}
             )
 
+        data["hash_tag"] = hash_tag
         return data
@@ -0,0 +1,18 @@
+from rest_framework import serializers
+
+from core.services.tickets.export import EXPORT_FORMATS
+
+
+class TicketExportSerializer(serializers.Serializer):
+    """
+    Ticket export query parameters serializer.
+    Parameter is not named "format", DRF reserves "?format=" for renderer selection.
+    """
+
+    export_format = serializers.ChoiceField(choices=list(EXPORT_FORMATS), default="json")
+
+    def update(self, instance, validated_data):
+        raise NotImplementedError()
+
+    def create(self, validated_data):
+        raise NotImplementedError()
@@ -0,0 +1,51 @@
+from rest_framework import serializers
+
+from core.pagination.cursor import MAX_ID
+
+
+class QueryBooleanField(serializers.BooleanField):
+    """
+    BooleanField of query parameters, missing parameter is skipped, BooleanField reads it as unchecked HTML checkbox.
+    """
+
+    default_empty_html = serializers.empty
+
+
+class TicketFilterSerializer(serializers.Serializer):
+    """
+    Ticket list query parameters serializer.
+    HashTag names can be passed as repeated "?hash_tag=" parameters or separated by comma,
+    "?filter=" is kept as an alias of "?hash_tag=" for old clients.
+    """
+
+    hash_tag = serializers.ListField(child=serializers.CharField(max_length=255), required=False)
+    filter = serializers.CharField(max_length=255, required=False)
+    is_archived = QueryBooleanField(required=False, allow_null=True)
+    creator = serializers.IntegerField(required=False, min_value=1, max_value=MAX_ID)
+    min_id = serializers.IntegerField(required=False, min_value=1, max_value=MAX_ID)
+    max_id = serializers.IntegerField(required=False, min_value=1, max_value=MAX_ID)
+
+    def validate(self, data):
+        """
+        Validates data from serializer
+        Args:
+            data: Serializer data - dict with query parameters.
+        Returns:
+            Data where hash_tag is a list of unique HashTag names from "?hash_tag=" and "?filter=".
+        """
+        names = list(data.get("hash_tag", []))
+        if data.get("filter"):
+            names.append(data.pop("filter"))
+        hash_tags = []
+        for name in ",".join(names).split(","):
+            name = name.strip()
+            if name and name not in hash_tags:
+                hash_tags.append(name)
+        data["hash_tag"] = hash_tags
+        return data
+
+    def update(self, instance, validated_data):
+        raise NotImplementedError()
+
+    def create(self, validated_data):
+        raise NotImplementedError()
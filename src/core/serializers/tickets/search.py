@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+
+class TicketSearchSerializer(serializers.Serializer):
+    """
+    Ticket search query parameters serializer.
+    """
+
+    q = serializers.CharField(required=True, max_length=255)
+
+    def update(self, instance, validated_data):
+        raise NotImplementedError()
+
+    def create(self, validated_data):
+        raise NotImplementedError()
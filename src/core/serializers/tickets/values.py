@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+from core.serializers.values import ValuesSerializer
+
+
+class TicketValuesSerializer(ValuesSerializer):
+    """
+    Fast read only TicketSerializer, output is identical to TicketSerializer.
+    """
+
+    columns = (
+        ("id", "id"),
+        ("hash_tag", "hash_tag__name"),
+        ("question", "question"),
+        ("is_archived", "is_archived"),
+        ("created_at", "created_at", serializers.DateTimeField()),
+        ("updated_at", "updated_at", serializers.DateTimeField()),
+        ("creator", "creator_id"),
+    )
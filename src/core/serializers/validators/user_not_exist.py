@@ -1,21 +1,28 @@
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
-from core.models import User
+from core.services import get_user_resolver
 
 
 class UserDoesNotExistValidator:
+    """
+    Resolves User through request UserResolver, so view gets the same User without another query.
+    """
+
+    requires_context = True
+
     def __init__(self):
         pass
 
-    def __call__(self, value):
+    def __call__(self, value, serializer_field):
         """
         Validates data from serializer
         Args:
             value: String with Email
+            serializer_field: Field validated value belongs to, its context has request.
         Raises:
             ValidationError if user with email does not exist.
         """
-        user = User.objects.filter(email=value).first()
+        user = get_user_resolver(serializer_field.context.get("request")).get_by_email(value)
         if user is None:
             raise serializers.ValidationError(_("User with this email does not exist."))
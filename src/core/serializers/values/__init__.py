@@ -0,0 +1,3 @@
+__all__ = ["ValuesSerializer"]
+
+from core.serializers.values.base import ValuesSerializer
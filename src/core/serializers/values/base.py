@@ -0,0 +1,52 @@
+from operator import attrgetter
+from rest_framework import serializers
+
+
+class ValuesSerializer(serializers.BaseSerializer):
+    """
+    Read only serializer that builds plain dicts without per field to_representation machinery of ModelSerializer.
+    Rows fetched with values() (see values method) are zipped with field names,
+    model instances are read with attribute getters, e.g. "hash_tag__name" lookup is read as "hash_tag.name".
+    Subclasses must produce the same output as ModelSerializer they replace, values JSON does not render as is
+    (e.g. datetimes) are converted with to_representation of the same DRF field.
+    Attributes:
+        columns: Tuple of (field name, model lookup) pairs or (field name, model lookup, DRF field) triples
+            in output order, primary key must be the first column.
+    """
+
+    columns = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.names = tuple(column[0] for column in cls.columns)
+        cls.lookups = tuple(column[1] for column in cls.columns)
+        cls.getters = tuple(attrgetter(lookup.replace("__", ".")) for lookup in cls.lookups)
+        cls.converters = tuple((column[0], column[2].to_representation) for column in cls.columns if len(column) > 2)
+
+    @classmethod
+    def values(cls, queryset):
+        """
+        Args:
+            queryset: QuerySet of serializer model.
+        Returns:
+            QuerySet of tuples with columns values, joins are made by the same query.
+        """
+        return queryset.values_list(*cls.lookups)
+
+    def to_representation(self, instance):
+        """
+        Args:
+            instance: Tuple from values() QuerySet or model instance.
+        Returns:
+            Dict with fields in columns order.
+        """
+        if isinstance(instance, tuple):
+            data = dict(zip(self.names, instance))
+        else:
+            data = {name: getter(instance) for name, getter in zip(self.names, self.getters)}
+        for name, convert in self.converters:
+            data[name] = convert(data[name])
+        return data
+
+    def to_internal_value(self, data):
+        raise NotImplementedError("{} is read only.".format(self.__class__.__name__))
@@ -1,7 +1,68 @@
-__all__ = ["send_template_email", "send_reset_password_email", "send_email_verification"]
+__all__ = [
+    "event_hub",
+    "get_event_broker",
+    "publish_tickets_closed",
+    "publish_tickets_created",
+    "send_template_email",
+    "send_reset_password_email",
+    "send_email_verification",
+    "hash_tag_catalog",
+    "get_auth_token_key",
+    "invalidate_auth_token_key",
+    "issue_auth_token",
+    "bulk_close_tickets",
+    "bulk_create_tickets",
+    "close_ticket",
+    "export_tickets",
+    "get_ticket_changes",
+    "restamp_late_changes",
+    "TicketTransition",
+    "TransitionResult",
+    "check_user_password",
+    "hash_password",
+    "set_user_password",
+    "UserResolver",
+    "get_user_resolver",
+    "CollectionVersion",
+    "hash_tag_versions",
+    "ticket_versions",
+]
 
+from core.services.auth_token import (
+    get_auth_token_key,
+    invalidate_auth_token_key,
+    issue_auth_token,
+)
 from core.services.email import (
     send_email_verification,
     send_reset_password_email,
     send_template_email,
 )
+from core.services.events import (
+    event_hub,
+    get_event_broker,
+    publish_tickets_closed,
+    publish_tickets_created,
+)
+from core.services.hash_tags import hash_tag_catalog
+from core.services.passwords import (
+    check_user_password,
+    hash_password,
+    set_user_password,
+)
+from core.services.tickets import (
+    TicketTransition,
+    TransitionResult,
+    bulk_close_tickets,
+    bulk_create_tickets,
+    close_ticket,
+    export_tickets,
+    get_ticket_changes,
+    restamp_late_changes,
+)
+from core.services.users import UserResolver, get_user_resolver
+from core.services.versions import (
+    CollectionVersion,
+    hash_tag_versions,
+    ticket_versions,
+)
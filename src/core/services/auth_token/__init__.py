@@ -0,0 +1,7 @@
+__all__ = ["get_auth_token_key", "invalidate_auth_token_key", "issue_auth_token"]
+
+from core.services.auth_token.tokens import (
+    get_auth_token_key,
+    invalidate_auth_token_key,
+    issue_auth_token,
+)
@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from rest_framework.authtoken.models import Token as AuthToken
+
+from core.services.cache import TieredCache
+
+token_key_cache = TieredCache(
+    prefix="auth_token_key",
+    timeout=settings.AUTH_TOKEN_CACHE_TIMEOUT,
+    local_timeout=settings.AUTH_TOKEN_LOCAL_CACHE_TIMEOUT,
+    max_size=settings.AUTH_TOKEN_LOCAL_CACHE_SIZE,
+    alias=settings.AUTH_TOKEN_CACHE_ALIAS,
+)
+
+
+def issue_auth_token(user):
+    """
+    Creates authentication token for new User, call it in the same transaction User is created in.
+    Args:
+        user: Saved User without token.
+    Returns:
+        String with token key.
+    """
+    key = AuthToken.objects.create(user=user).key
+    token_key_cache.set(user.pk, key)
+    return key
+
+
+def get_auth_token_key(user):
+    """
+    Get User authentication token key from cache, from database on cache miss
+    or create token if User still does not have one.
+    Concurrent creation of the same token is resolved by unique user_id index of token table.
+    Args:
+        user: Saved User.
+    Returns:
+        String with token key.
+    """
+    key = token_key_cache.get(user.pk)
+    if key is not None:
+        return key
+
+    key = AuthToken.objects.filter(user_id=user.pk).values_list("key", flat=True).first()
+    if key is None:
+        try:
+            with transaction.atomic():
+                key = AuthToken.objects.create(user=user).key
+        except IntegrityError:
+            key = AuthToken.objects.filter(user_id=user.pk).values_list("key", flat=True).get()
+    token_key_cache.add(user.pk, key)
+    return key
+
+
+def invalidate_auth_token_key(user_id):
+    token_key_cache.delete(user_id)
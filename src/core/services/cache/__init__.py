@@ -0,0 +1,4 @@
+__all__ = ["LocalCache", "TieredCache"]
+
+from core.services.cache.local import LocalCache
+from core.services.cache.tiered import TieredCache
@@ -0,0 +1,128 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from django.conf import settings
+
+import redis
+
+from core.services.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+MEMORY_URL = "memory://"
+
+# TieredCache instances by key prefix, invalidations name the prefix and keys to drop from their in-process levels.
+_caches = {}
+
+
+def register_cache(cache):
+    _caches[cache.prefix] = cache
+
+
+def drop_local_keys(prefix, keys):
+    cache = _caches.get(prefix)
+    if cache is not None:
+        for key in keys:
+            cache.local.delete(key)
+
+
+def drop_all_local_keys():
+    for cache in _caches.values():
+        cache.local.clear()
+
+
+class MemoryInvalidationBus:
+    """
+    Bus of a single process, TieredCache drops keys of the current process itself.
+    Use it for tests and single process servers.
+    """
+
+    def publish(self, prefix, keys):
+        pass
+
+    def start(self):
+        pass
+
+
+class RedisInvalidationBus:
+    """
+    Broadcasts keys deleted from TieredCache to all processes through Redis pub/sub,
+    every process drops them from in-process level of its cache with the same prefix.
+    Every process keeps one subscription in a daemon thread, started when it caches the first value.
+    In-process levels are cleared on every (re)subscription, invalidations published while process
+    was not subscribed are lost. If Redis is not available local timeout of TieredCache bounds staleness.
+    Attributes:
+        client: redis.Redis client.
+        channel: String - pub/sub channel name.
+    """
+
+    reconnect_delay = 1.0
+
+    def __init__(self, client, channel):
+        self.client = client
+        self.channel = channel
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def publish(self, prefix, keys):
+        """
+        Drops keys in other processes when they receive the message.
+        Args:
+            prefix: String - prefix of TieredCache.
+            keys: List of keys without prefix, JSON serializable.
+        """
+        try:
+            self.client.publish(self.channel, json.dumps({"prefix": prefix, "keys": keys}, separators=(",", ":")))
+        except (redis.RedisError, OSError):
+            logger.warning(
+                "Cache invalidation was not broadcast, other processes keep keys until timeout.", exc_info=True
+            )
+
+    def start(self):
+        """
+        Starts listening thread once per process, threads do not survive fork of preloading server.
+        """
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                threading.Thread(target=self._listen, name="cache-invalidation", daemon=True).start()
+                self._pid = os.getpid()
+
+    def _listen(self):
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                drop_all_local_keys()
+                for message in pubsub.listen():
+                    if message["type"] == "message":
+                        invalidation = json.loads(message["data"])
+                        drop_local_keys(invalidation["prefix"], invalidation["keys"])
+            except (redis.RedisError, OSError, ValueError, KeyError):
+                logger.exception("Cache invalidation bus lost Redis subscription, reconnecting.")
+                time.sleep(self.reconnect_delay)
+            finally:
+                pubsub.close()
+
+
+_memory_bus = MemoryInvalidationBus()
+
+
+@functools.lru_cache(maxsize=None)
+def _redis_bus(url, channel):
+    return RedisInvalidationBus(get_redis(url), channel)
+
+
+def get_invalidation_bus():
+    """
+    Get bus by CACHE_INVALIDATION_URL from settings.
+    Returns:
+        MemoryInvalidationBus if url is "memory://", RedisInvalidationBus shared by the process otherwise.
+    """
+    if settings.CACHE_INVALIDATION_URL == MEMORY_URL:
+        return _memory_bus
+    return _redis_bus(settings.CACHE_INVALIDATION_URL, settings.CACHE_INVALIDATION_CHANNEL)
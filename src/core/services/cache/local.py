@@ -0,0 +1,63 @@
+import threading
+import time
+from collections import OrderedDict
+
+MISSING = object()
+
+
+class LocalCache:
+    """
+    Thread safe in-process cache with least recently used eviction and time to live.
+    Attributes:
+        max_size: Integer - max number of keys, least recently used keys are evicted first.
+        timeout: Float - default time to live of key in seconds.
+    """
+
+    def __init__(self, max_size=1024, timeout=60):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Get value by key.
+        Args:
+            key: Hashable key.
+            default: Value to return if key is missing or expired.
+        Returns:
+            Cached value or default.
+        """
+        with self._lock:
+            item = self._data.get(key, MISSING)
+            if item is MISSING:
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        """
+        Set value by key, evicts least recently used keys if cache is full.
+        Args:
+            key: Hashable key.
+            value: Any value.
+            timeout: Float - time to live in seconds, default timeout if None.
+        """
+        expires_at = time.monotonic() + (self.timeout if timeout is None else timeout)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,120 @@
+from django.core.cache import caches
+
+from core.services.cache.invalidation import get_invalidation_bus, register_cache
+from core.services.cache.local import MISSING, LocalCache
+
+# Shared level value of deleted key, add() of values loaded before deletion does not overwrite it.
+INVALIDATED = "tiered-cache:invalidated"
+
+
+class TieredCache:
+    """
+    Two level cache: in-process LocalCache in front of shared Django cache (Redis, Memcached or locmem).
+    Local level saves network round trip on hot keys. Deleted keys are broadcast to local levels of other processes
+    by invalidation bus, short local timeout bounds staleness if a broadcast is lost.
+    Deleted key is replaced with a marker in shared level for tombstone_timeout seconds, so a value read from
+    database before the change and cached with add() after it does not outlive the change.
+    Attributes:
+        prefix: String - prefix of keys in shared cache and name of the cache on invalidation bus.
+        timeout: Integer - time to live of keys in shared cache in seconds.
+        local: LocalCache - in-process level.
+        alias: String - alias of shared cache from CACHES setting, only local level is used if None.
+        tombstone_timeout: Integer - seconds deleted key can not be added, longer than request transactions.
+    """
+
+    def __init__(self, prefix, timeout, local_timeout, max_size=1024, alias="default", tombstone_timeout=30):
+        self.prefix = prefix
+        self.timeout = timeout
+        self.local = LocalCache(max_size=max_size, timeout=local_timeout)
+        self.alias = alias
+        self.tombstone_timeout = tombstone_timeout
+        register_cache(self)
+
+    @property
+    def shared(self):
+        return caches[self.alias] if self.alias else None
+
+    def make_key(self, key):
+        return f"{self.prefix}:{key}"
+
+    def get(self, key, default=None):
+        """
+        Get value from local level, then from shared one.
+        Args:
+            key: String key without prefix.
+            default: Value to return if key is missing in both levels.
+        Returns:
+            Cached value or default.
+        """
+        value = self.local.get(key, MISSING)
+        if value is not MISSING or self.shared is None:
+            return default if value is MISSING else value
+        value = self.shared.get(self.make_key(key), MISSING)
+        if value is MISSING or value == INVALIDATED:
+            return default
+        self._set_local(key, value)
+        return value
+
+    def get_local(self, key, default=None):
+        """
+        Get value from local level only, it never touches network, so it is safe to call from event loop.
+        Args:
+            key: String key without prefix.
+            default: Value to return if key is missing in local level.
+        Returns:
+            Cached value or default.
+        """
+        return self.local.get(key, default)
+
+    def get_or_set(self, key, loader):
+        """
+        Get value from cache or load it and add to both levels.
+        Args:
+            key: String key without prefix.
+            loader: Callable without arguments that returns value to cache.
+        Returns:
+            Cached or loaded value.
+        """
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            value = loader()
+            self.add(key, value)
+        return value
+
+    def add(self, key, value):
+        """
+        Caches value loaded from database, unless key was deleted recently or another process cached it meanwhile.
+        Args:
+            key: String key without prefix.
+            value: Any picklable value.
+        """
+        if self.shared is not None and not self.shared.add(self.make_key(key), value, self.timeout):
+            return
+        self._set_local(key, value)
+
+    def set(self, key, value):
+        if self.shared is not None:
+            self.shared.set(self.make_key(key), value, self.timeout)
+        self._set_local(key, value)
+
+    def delete(self, key):
+        self.delete_many([key])
+
+    def delete_many(self, keys):
+        """
+        Deletes keys from shared level and from local levels of all processes.
+        Args:
+            keys: List of keys without prefix.
+        """
+        if not keys:
+            return
+        if self.shared is not None:
+            self.shared.set_many({self.make_key(key): INVALIDATED for key in keys}, self.tombstone_timeout)
+        for key in keys:
+            self.local.delete(key)
+        get_invalidation_bus().publish(self.prefix, keys)
+
+    def _set_local(self, key, value):
+        self.local.set(key, value)
+        # Process listens to invalidations from the first value it keeps.
+        get_invalidation_bus().start()
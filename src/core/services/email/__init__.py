@@ -1,7 +1,19 @@
-__all__ = ["send_template_email", "send_reset_password_email", "send_email_verification"]
+__all__ = [
+    "send_template_email",
+    "send_reset_password_email",
+    "send_email_verification",
+    "deliver_outbox",
+    "email_connection_pool",
+    "get_outbox",
+    "render_email",
+]
 
+from core.services.email.connection import email_connection_pool
+from core.services.email.delivery import deliver_outbox
+from core.services.email.outbox import get_outbox
 from core.services.email.send_email import (
     send_email_verification,
     send_reset_password_email,
     send_template_email,
 )
+from core.services.email.templates import render_email
@@ -0,0 +1,57 @@
+import threading
+import time
+from contextlib import contextmanager
+from django.conf import settings
+from django.core.mail import get_connection
+
+
+class EmailConnectionPool:
+    """
+    Keeps one long-lived email backend connection per worker process,
+    so TLS handshake and SMTP login are paid once per idle period instead of once per message.
+    Attributes:
+        max_idle: Integer - seconds after which idle connection is reopened, SMTP servers drop idle clients.
+    """
+
+    def __init__(self, max_idle=30):
+        self.max_idle = max_idle
+        self._connection = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow open connection, it is closed if borrower fails, so next borrower reconnects.
+        Yields:
+            Email backend with open connection.
+        """
+        with self._lock:
+            if self._connection is not None and time.monotonic() - self._last_used > self.max_idle:
+                self._close()
+            if self._connection is None:
+                connection = get_connection(fail_silently=False)
+                connection.open()
+                self._connection = connection
+            try:
+                yield self._connection
+            except BaseException:
+                self._close()
+                raise
+            finally:
+                self._last_used = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+
+email_connection_pool = EmailConnectionPool(max_idle=settings.EMAIL_CONNECTION_MAX_IDLE)
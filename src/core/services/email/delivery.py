@@ -0,0 +1,70 @@
+import logging
+from django.conf import settings
+from smtplib import SMTPRecipientsRefused, SMTPResponseException
+
+from core.services.email.connection import email_connection_pool
+from core.services.email.outbox import get_outbox
+from core.services.email.templates import render_email
+
+logger = logging.getLogger(__name__)
+
+
+def deliver_outbox(outbox=None, batch_size=None):
+    """
+    Send all queued messages in batches, every batch goes through one pooled connection.
+    Args:
+        outbox: Outbox to take messages from, outbox from settings if None.
+        batch_size: Integer - number of messages in batch, EMAIL_BATCH_SIZE from settings if None.
+    Returns:
+        Integer - number of sent messages.
+    Raises:
+        SMTPException or OSError if connection failed, not sent messages are returned to outbox.
+    """
+    outbox = outbox or get_outbox()
+    batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+    sent = 0
+    while True:
+        batch = outbox.pop_batch(batch_size)
+        if not batch:
+            return sent
+        sent += deliver_batch(outbox, batch)
+
+
+def deliver_batch(outbox, batch):
+    """
+    Render and send batch of messages.
+    Messages that can never be sent (unknown template, all recipients refused, other permanent 5xx SMTP errors)
+    are logged and dropped, so they do not block the outbox. On any other error, e.g. lost connection or
+    temporary 4xx SMTP error, the rest of batch is returned to outbox before error is raised.
+    Args:
+        outbox: Outbox to return not sent messages to.
+        batch: List of queued messages.
+    Returns:
+        Integer - number of sent messages.
+    """
+    sent = 0
+    position = 0
+    try:
+        with email_connection_pool.connection() as connection:
+            for position, message in enumerate(batch):
+                try:
+                    email = render_email(message, connection=connection)
+                except Exception:
+                    logger.exception("Dropping email %s, it can not be rendered.", message.get("template"))
+                    continue
+                try:
+                    sent += connection.send_messages([email])
+                except SMTPRecipientsRefused as error:
+                    logger.warning(
+                        "Dropping email %s, recipients refused: %s", message.get("template"), error.recipients
+                    )
+                except SMTPResponseException as error:
+                    if error.smtp_code < 500:
+                        raise
+                    logger.warning(
+                        "Dropping email %s, rejected with %s: %s", message.get("template"), error.smtp_code, error
+                    )
+    except BaseException:
+        outbox.push_front(batch[position:])
+        raise
+    return sent
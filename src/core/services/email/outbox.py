@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+from collections import deque
+from django.conf import settings
+
+from core.services.redis import get_redis
+
+MEMORY_URL = "memory://"
+
+
+class MemoryOutbox:
+    """
+    In-process outbox, messages are visible to current process only.
+    Use it for tests and with CELERY_TASK_ALWAYS_EAGER, workers can not see messages queued by web process.
+    """
+
+    def __init__(self):
+        self._messages = deque()
+        self._flush_at = 0.0
+        self._lock = threading.Lock()
+
+    def push(self, message):
+        """
+        Add message to the end of outbox.
+        Args:
+            message: Dictionary - JSON serializable message.
+        Returns:
+            Integer - number of queued messages.
+        """
+        with self._lock:
+            self._messages.append(message)
+            return len(self._messages)
+
+    def push_front(self, messages):
+        """
+        Return messages that were not sent to the beginning of outbox, so they keep their order.
+        Args:
+            messages: List of messages.
+        """
+        with self._lock:
+            self._messages.extendleft(reversed(messages))
+
+    def pop_batch(self, size):
+        """
+        Take at most size messages from the beginning of outbox.
+        Args:
+            size: Integer - max number of messages.
+        Returns:
+            List of messages, empty if outbox is empty.
+        """
+        with self._lock:
+            return [self._messages.popleft() for _ in range(min(size, len(self._messages)))]
+
+    def claim_flush(self, window):
+        """
+        Claim flush of outbox, only one claim succeeds during window.
+        Args:
+            window: Integer - length of window in seconds.
+        Returns:
+            Boolean - True if flush should be scheduled by caller.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._flush_at:
+                return False
+            self._flush_at = now + window
+            return True
+
+    def __len__(self):
+        return len(self._messages)
+
+
+class RedisOutbox:
+    """
+    Outbox in Redis list shared by web processes and Celery workers.
+    Attributes:
+        client: redis.Redis client.
+        key: String - key of the list with JSON encoded messages.
+    """
+
+    def __init__(self, client, key="email:outbox"):
+        self.client = client
+        self.key = key
+        self.flush_key = f"{key}:flush"
+
+    def push(self, message):
+        return self.client.rpush(self.key, json.dumps(message))
+
+    def push_front(self, messages):
+        if messages:
+            self.client.lpush(self.key, *[json.dumps(message) for message in reversed(messages)])
+
+    def pop_batch(self, size):
+        # LRANGE and LTRIM in one MULTI, so concurrent workers never take the same message.
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.lrange(self.key, 0, size - 1)
+        pipeline.ltrim(self.key, size, -1)
+        messages, _ = pipeline.execute()
+        return [json.loads(message) for message in messages]
+
+    def claim_flush(self, window):
+        if window <= 0:
+            return True
+        return bool(self.client.set(self.flush_key, 1, nx=True, ex=window))
+
+    def __len__(self):
+        return self.client.llen(self.key)
+
+
+_memory_outbox = MemoryOutbox()
+
+
+def get_outbox():
+    """
+    Get outbox by EMAIL_OUTBOX_URL from settings.
+    Returns:
+        MemoryOutbox if url is "memory://", RedisOutbox otherwise.
+    """
+    if settings.EMAIL_OUTBOX_URL == MEMORY_URL:
+        return _memory_outbox
+    return RedisOutbox(get_redis(settings.EMAIL_OUTBOX_URL))
@@ -1,51 +1,39 @@
-from django.template.loader import render_to_string
-from django.utils.translation import gettext_lazy as _
+from django.conf import settings
+from django.utils import translation
 
 from core.models import Token
-from core.tasks import send_email
+from core.services.email.outbox import get_outbox
+from core.tasks import flush_email_outbox
 
 
-def send_template_email(subject, html_message, recipient_list):
-    send_email.delay(subject=subject, html_message=html_message, recipient_list=recipient_list)
+def send_template_email(template, recipient_list, **context):
+    """
+    Queue email to outbox, it is rendered and sent by Celery worker.
+    Flush task is scheduled once per EMAIL_BATCH_WINDOW, or at once when full batch is queued,
+    so messages queued during window are sent together through one connection.
+    Args:
+        template: String - key of EMAIL_TEMPLATES.
+        recipient_list: List of email addresses.
+        **context: JSON serializable template context.
+    """
+    outbox = get_outbox()
+    queued = outbox.push(
+        {
+            "template": template,
+            "recipients": list(recipient_list),
+            "context": context,
+            "language": translation.get_language(),
+        }
+    )
+    if queued % settings.EMAIL_BATCH_SIZE == 0:
+        flush_email_outbox.delay()
+    elif outbox.claim_flush(settings.EMAIL_BATCH_WINDOW):
+        flush_email_outbox.apply_async(countdown=settings.EMAIL_BATCH_WINDOW)
 
 
 def send_email_verification(user, token: Token):
-    # TODO Improvements
-    title = _("Verify your email address.")
-    text = _("Finish your registration with verifying your email.\nClick at link below to complete registration.")
-    organization = "Q&A service."
-    button_link = ""  # TODO button link
-    button_text = _("Confirm.")
-    html_message = render_to_string(
-        "email/base.html",
-        context={
-            "title": title,
-            "text": text,
-            "organization": organization,
-            "button_link": button_link,
-            "button_text": button_text,
-            "token": token.value,
-        },
-    )
-    send_template_email(_("Email Verification"), html_message, [user.email])
+    send_template_email("email_verification", [user.email], token=str(token.value))
 
 
 def send_reset_password_email(user, token: Token):
-    # TODO Improvements
-    title = _("Reset password.")
-    text = _("To reset password click at link below.")
-    organization = "Q&A service."
-    button_link = ""  # TODO button link
-    button_text = _("Reset.")
-    html_message = render_to_string(
-        "email/base.html",
-        context={
-            "title": title,
-            "text": text,
-            "organization": organization,
-            "button_link": button_link,
-            "button_text": button_text,
-            "token": token.value,
-        },
-    )
-    send_template_email(_("Reset password"), html_message, [user.email])
+    send_template_email("reset_password", [user.email], token=str(token.value))
@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives
+from django.template.loader import render_to_string
+from django.utils import translation
+from django.utils.translation import gettext_lazy as _
+
+ORGANIZATION = "Q&A service."
+
+EMAIL_TEMPLATES = {
+    "email_verification": {
+        "subject": _("Email Verification"),
+        "title": _("Verify your email address."),
+        "text": _("Finish your registration with verifying your email.\nClick at link below to complete registration."),
+        "button_text": _("Confirm."),
+    },
+    "reset_password": {
+        "subject": _("Reset password"),
+        "title": _("Reset password."),
+        "text": _("To reset password click at link below."),
+        "button_text": _("Reset."),
+    },
+}
+
+
+def render_email(message, connection=None):
+    """
+    Render queued message into email, runs in Celery worker.
+    Args:
+        message: Dictionary - {"template": key of EMAIL_TEMPLATES, "recipients": list, "context": dict, "language": str}.
+        connection: Email backend instance to send email with.
+    Returns:
+        EmailMultiAlternatives with html alternative.
+    Raises:
+        KeyError if template does not exist.
+    """
+    template = EMAIL_TEMPLATES[message["template"]]
+    with translation.override(message.get("language") or settings.LANGUAGE_CODE):
+        context = {
+            "title": template["title"],
+            "text": template["text"],
+            "organization": ORGANIZATION,
+            "button_link": "",  # TODO button link
+            "button_text": template["button_text"],
+            **message["context"],
+        }
+        subject = str(template["subject"])
+        html_message = render_to_string("email/base.html", context=context)
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body="",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=message["recipients"],
+        connection=connection,
+    )
+    email.attach_alternative(html_message, "text/html")
+    return email
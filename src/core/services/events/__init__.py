@@ -0,0 +1,27 @@
+__all__ = [
+    "TICKET_CLOSED",
+    "TICKET_CREATED",
+    "EventHub",
+    "MemoryEventBroker",
+    "RedisEventBroker",
+    "Subscription",
+    "event_hub",
+    "get_event_broker",
+    "publish_events",
+    "publish_tickets_closed",
+    "publish_tickets_created",
+]
+
+from core.services.events.broker import (
+    MemoryEventBroker,
+    RedisEventBroker,
+    get_event_broker,
+)
+from core.services.events.hub import EventHub, Subscription, event_hub
+from core.services.events.tickets import (
+    TICKET_CLOSED,
+    TICKET_CREATED,
+    publish_events,
+    publish_tickets_closed,
+    publish_tickets_created,
+)
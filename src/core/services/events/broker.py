@@ -0,0 +1,106 @@
+import functools
+import json
+import logging
+import threading
+import time
+from django.conf import settings
+
+import redis
+
+from core.services.events.hub import event_hub
+from core.services.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+MEMORY_URL = "memory://"
+
+
+class MemoryEventBroker:
+    """
+    In-process broker, events reach only clients connected to the same process.
+    Use it for tests and single process servers.
+    """
+
+    def __init__(self, hub):
+        self.hub = hub
+
+    def publish(self, events):
+        for event in events:
+            self.hub.dispatch(event)
+
+    def start(self):
+        pass
+
+
+class RedisEventBroker:
+    """
+    Broker that fans events out to all processes through Redis pub/sub.
+    Every process keeps one subscription in a daemon thread, started with the first client,
+    and passes received events to its EventHub, so Redis load does not depend on number of clients.
+    Attributes:
+        client: redis.Redis client.
+        channel: String - pub/sub channel name.
+        hub: EventHub of this process.
+    """
+
+    reconnect_delay = 1.0
+
+    def __init__(self, client, channel, hub):
+        self.client = client
+        self.channel = channel
+        self.hub = hub
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def publish(self, events):
+        """
+        Publishes events with one round trip.
+        Args:
+            events: List of JSON serializable dicts.
+        """
+        pipeline = self.client.pipeline(transaction=False)
+        for event in events:
+            pipeline.publish(self.channel, json.dumps(event, separators=(",", ":")))
+        pipeline.execute()
+
+    def start(self):
+        """
+        Starts listening thread once per process.
+        """
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._listen, name="event-broker", daemon=True)
+                self._thread.start()
+
+    def _listen(self):
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.hub.dispatch(json.loads(message["data"]))
+            except (redis.RedisError, OSError, ValueError):
+                logger.exception("Event broker lost Redis subscription, reconnecting.")
+                time.sleep(self.reconnect_delay)
+            finally:
+                pubsub.close()
+
+
+_memory_broker = MemoryEventBroker(event_hub)
+
+
+@functools.lru_cache(maxsize=None)
+def _redis_broker(url, channel):
+    return RedisEventBroker(get_redis(url), channel, event_hub)
+
+
+def get_event_broker():
+    """
+    Get broker by EVENTS_BROKER_URL from settings.
+    Returns:
+        MemoryEventBroker if url is "memory://", RedisEventBroker shared by the process otherwise.
+    """
+    if settings.EVENTS_BROKER_URL == MEMORY_URL:
+        return _memory_broker
+    return _redis_broker(settings.EVENTS_BROKER_URL, settings.EVENTS_CHANNEL)
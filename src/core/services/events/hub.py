@@ -0,0 +1,92 @@
+import asyncio
+import threading
+
+
+class Subscription:
+    """
+    Queue of events for one connected client.
+    Staff receives events of all Tickets, other users only events of Tickets they created.
+    Client that does not keep up overflows its queue and is disconnected, it catches up with Ticket changes endpoint.
+    Attributes:
+        user_id: Integer - id of subscribed User.
+        is_staff: Boolean - True if User is staff.
+        queue: asyncio.Queue with events.
+        overflowed: Boolean - True if events were dropped.
+    """
+
+    def __init__(self, user, size):
+        self.user_id = user.id
+        self.is_staff = user.is_staff
+        self.queue = asyncio.Queue(maxsize=size)
+        self.overflowed = False
+
+    def matches(self, user):
+        """
+        Args:
+            user: User authenticated again while subscription is open.
+        Returns:
+            Boolean - False if it is another User or staff status changed, subscription filters events for old one.
+        """
+        return user.id == self.user_id and user.is_staff == self.is_staff
+
+    def accepts(self, event):
+        return self.is_staff or event["ticket"]["creator"] == self.user_id
+
+    def put(self, event):
+        if self.overflowed or not self.accepts(event):
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class EventHub:
+    """
+    In-process fan-out of events to subscriptions of clients connected to this process.
+    Subscriptions live in event loop of ASGI server, events may be dispatched from any thread,
+    e.g. from thread of sync view or from thread that listens to Redis.
+    """
+
+    def __init__(self):
+        self.subscriptions = set()
+        self.loop = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, user, size):
+        """
+        Must be called from event loop.
+        Args:
+            user: Authenticated User.
+            size: Integer - maximum number of events waiting for client.
+        Returns:
+            Subscription.
+        """
+        with self._lock:
+            self.loop = asyncio.get_running_loop()
+            subscription = Subscription(user, size)
+            self.subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self.subscriptions.discard(subscription)
+
+    def dispatch(self, event):
+        """
+        Passes event to all subscriptions, thread-safe.
+        Event is dropped if there are no subscriptions in this process.
+        Args:
+            event: Dict with "type" and "ticket" with at least "id" and "creator".
+        """
+        with self._lock:
+            loop = self.loop if self.subscriptions else None
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._deliver, event)
+
+    def _deliver(self, event):
+        for subscription in list(self.subscriptions):
+            subscription.put(event)
+
+
+event_hub = EventHub()
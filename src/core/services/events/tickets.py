@@ -0,0 +1,60 @@
+import logging
+from django.db import router, transaction
+
+import redis
+
+from core.models import Ticket
+from core.services.events.broker import get_event_broker
+
+logger = logging.getLogger(__name__)
+
+TICKET_CREATED = "ticket.created"
+TICKET_CLOSED = "ticket.closed"
+
+
+def publish_events(events, using=None):
+    """
+    Publishes events after current transaction commits, clients never see Tickets that were rolled back.
+    Events are best effort, if broker is not available they are lost and clients catch up with changes endpoint.
+    Args:
+        events: List of event dicts.
+        using: String - database alias of the transaction.
+    """
+
+    def publish():
+        try:
+            get_event_broker().publish(events)
+        except (redis.RedisError, OSError):
+            logger.exception("Could not publish %s events.", len(events))
+
+    if events:
+        transaction.on_commit(publish, using=using)
+
+
+def publish_tickets_created(tickets):
+    """
+    Args:
+        tickets: List of created Tickets with HashTags.
+    """
+    from core.serializers import TicketValuesSerializer
+
+    events = [{"type": TICKET_CREATED, "ticket": TicketValuesSerializer(ticket).data} for ticket in tickets]
+    publish_events(events, using=router.db_for_write(Ticket))
+
+
+def publish_tickets_closed(ids, creator_id=None):
+    """
+    Args:
+        ids: List of closed Ticket ids.
+        creator_id: Integer - id of creator of all Tickets if known, otherwise creators are read with one query.
+    """
+    if creator_id is None:
+        creators = dict(Ticket.objects.filter(id__in=ids).values_list("id", "creator_id"))
+    else:
+        creators = dict.fromkeys(ids, creator_id)
+    events = [
+        {"type": TICKET_CLOSED, "ticket": {"id": ticket_id, "creator": creators[ticket_id], "is_archived": True}}
+        for ticket_id in ids
+        if ticket_id in creators
+    ]
+    publish_events(events, using=router.db_for_write(Ticket))
@@ -0,0 +1,3 @@
+__all__ = ["HashTagCatalog", "hash_tag_catalog"]
+
+from core.services.hash_tags.catalog import HashTagCatalog, hash_tag_catalog
@@ -0,0 +1,123 @@
+from django.conf import settings
+from django.db import router
+
+from asgiref.sync import sync_to_async
+
+from core.models import HashTag
+from core.services.cache import TieredCache
+from core.services.versions import hash_tag_versions
+
+
+class HashTagCatalog:
+    """
+    Read-through cache of all HashTags, table is small and rarely changes.
+    Catalog is kept in TieredCache, shared copy is keyed by HashTags collection version number read before its rows,
+    so a copy loaded while HashTags were changed is never read after the version is bumped.
+    In-process copy is invalidated by HashTag post_save and post_delete signals and expires in other processes.
+    HashTag instances are shared between requests and must not be changed.
+    Catalog keeps the collection version read before its rows, so validators of responses built from
+    a few seconds stale local copy are stale too and never match validators of fresh data.
+    """
+
+    key = "catalog"
+
+    def __init__(self):
+        self.cache = TieredCache(
+            prefix="hash_tags",
+            timeout=settings.HASH_TAG_CACHE_TIMEOUT,
+            local_timeout=settings.HASH_TAG_LOCAL_CACHE_TIMEOUT,
+            max_size=1,
+        )
+
+    def _load(self, version):
+        #  Catalog is cached for long, it is never loaded from a lagging replica, so its version is settled.
+        hash_tags = tuple(HashTag.objects.db_manager(router.db_for_write(HashTag)).order_by("id"))
+        return {
+            "version": version._replace(settled=True) if version is not None else None,
+            "all": hash_tags,
+            "by_id": {hash_tag.id: hash_tag for hash_tag in hash_tags},
+            "by_name": {hash_tag.name: hash_tag for hash_tag in hash_tags},
+        }
+
+    def _get(self):
+        catalog = self.cache.get_local(self.key)
+        if catalog is None:
+            catalog = self._get_shared()
+            self.cache.local.set(self.key, catalog)
+        return catalog
+
+    def _get_shared(self):
+        version = hash_tag_versions.get()
+        if version is None:
+            return self._load(version)
+        key = self.cache.make_key(f"{self.key}:{version.number}")
+        catalog = self.cache.shared.get(key)
+        if catalog is None:
+            catalog = self._load(version)
+            self.cache.shared.set(key, catalog, self.cache.timeout)
+        return catalog
+
+    async def _aget(self):
+        catalog = self.cache.get_local(self.key)
+        if catalog is None:
+            catalog = await sync_to_async(self._get)()
+        return catalog
+
+    def all(self):
+        """
+        Returns:
+            Tuple with all HashTags ordered by id.
+        """
+        return self._get()["all"]
+
+    def get_by_id(self, hash_tag_id):
+        """
+        Args:
+            hash_tag_id: Integer HashTag id.
+        Returns:
+            HashTag or None if it does not exist.
+        """
+        return self._get()["by_id"].get(hash_tag_id)
+
+    def get_by_name(self, name):
+        """
+        Args:
+            name: String HashTag name.
+        Returns:
+            HashTag or None if it does not exist.
+        """
+        return self._get()["by_name"].get(name)
+
+    async def aall(self):
+        """
+        Async all(), catalog from in-process cache is returned without leaving event loop.
+        Returns:
+            Tuple with all HashTags ordered by id.
+        """
+        return (await self._aget())["all"]
+
+    async def aget_by_id(self, hash_tag_id):
+        """
+        Async get_by_id(), catalog from in-process cache is returned without leaving event loop.
+        Args:
+            hash_tag_id: Integer HashTag id.
+        Returns:
+            HashTag or None if it does not exist.
+        """
+        return (await self._aget())["by_id"].get(hash_tag_id)
+
+    def version(self):
+        """
+        Returns:
+            Version of HashTags collection the catalog was loaded at, None if version store was not available.
+        """
+        return self._get()["version"]
+
+    async def aversion(self):
+        return (await self._aget())["version"]
+
+    def invalidate(self):
+        self.cache.local.delete(self.key)
+
+
+hash_tag_catalog = HashTagCatalog()
@@ -0,0 +1,15 @@
+__all__ = [
+    "check_user_password",
+    "get_hashing_executor",
+    "hash_password",
+    "load_common_passwords",
+    "set_user_password",
+]
+
+from core.services.passwords.passwords import (
+    check_user_password,
+    get_hashing_executor,
+    hash_password,
+    set_user_password,
+)
+from core.services.passwords.validators import load_common_passwords
@@ -0,0 +1,139 @@
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    check_password,
+    get_hasher,
+    identify_hasher,
+    is_password_usable,
+)
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _initialize_worker():
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+
+def _encode(algorithm, password, salt):
+    return get_hasher(algorithm).encode(password, salt)
+
+
+def _verify(password, encoded):
+    return check_password(password, encoded)
+
+
+def get_hashing_executor():
+    """
+    Get process pool for password hashing, it is started on first use.
+    Pool size is PASSWORD_HASHING_POOL_SIZE from settings, it bounds number of concurrent hashes per process,
+    and request threads wait on I/O instead of holding CPU and GIL.
+    Returns:
+        ProcessPoolExecutor or None if pool is turned off.
+    """
+    global _executor
+    if settings.PASSWORD_HASHING_POOL_SIZE <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASHING_POOL_SIZE, initializer=_initialize_worker
+            )
+        return _executor
+
+
+def _run_in_pool(executor, function, *args):
+    """
+    Runs function in hashing pool and waits for result.
+    Pool with a dead worker is broken for good, so it is replaced with a new one and function is retried once.
+    Args:
+        executor: ProcessPoolExecutor from get_hashing_executor.
+        function: Picklable module level function.
+        *args: Function arguments.
+    Returns:
+        Function result.
+    """
+    global _executor
+    try:
+        return executor.submit(function, *args).result()
+    except BrokenProcessPool:
+        logger.warning("Password hashing pool is broken, starting a new one.", exc_info=True)
+        with _executor_lock:
+            # Other threads may have replaced it already.
+            if _executor is executor:
+                _executor = None
+        executor.shutdown(wait=False)
+        return get_hashing_executor().submit(function, *args).result()
+
+
+def hash_password(password):
+    """
+    Hash password with preferred hasher from PASSWORD_HASHERS, in process pool if it is turned on.
+    Args:
+        password: String - raw password.
+    Returns:
+        String - encoded password.
+    """
+    hasher = get_hasher()
+    executor = get_hashing_executor()
+    if executor is None:
+        return hasher.encode(password, hasher.salt())
+    return _run_in_pool(executor, _encode, hasher.algorithm, password, hasher.salt())
+
+
+def set_user_password(user, password):
+    """
+    Same as User.set_password, hashing runs through hash_password.
+    Args:
+        user: User.
+        password: String - raw password.
+    """
+    user.password = hash_password(password)
+    user._password = password
+
+
+def password_must_update(encoded):
+    """
+    Check if password was hashed by other hasher or with other parameters than preferred hasher uses.
+    Args:
+        encoded: String - encoded password.
+    Returns:
+        Boolean.
+    """
+    preferred = get_hasher()
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+def check_user_password(user, password):
+    """
+    Same as User.check_password, verifies password in process pool if it is turned on.
+    Password hashed with outdated hasher or parameters is transparently rehashed with preferred one.
+    Args:
+        user: User.
+        password: String - raw password.
+    Returns:
+        Boolean - True if password is correct.
+    """
+    executor = get_hashing_executor()
+    if executor is None:
+        return user.check_password(password)
+    if password is None or not is_password_usable(user.password):
+        return False
+    is_correct = _run_in_pool(executor, _verify, password, user.password)
+    if is_correct and password_must_update(user.password):
+        user.password = hash_password(password)
+        user.save(update_fields=["password"])
+    return is_correct
@@ -0,0 +1,30 @@
+import functools
+import gzip
+from django.contrib.auth import password_validation
+
+
+@functools.lru_cache(maxsize=None)
+def load_common_passwords(path):
+    """
+    Load list of common passwords once per process.
+    Args:
+        path: String - path to list of lowercased passwords, may be gzipped.
+    Returns:
+        Frozenset of passwords.
+    """
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return frozenset(line.strip() for line in file)
+    except OSError:
+        with open(path) as file:
+            return frozenset(line.strip() for line in file)
+
+
+class CommonPasswordValidator(password_validation.CommonPasswordValidator):
+    """
+    CommonPasswordValidator sharing one frozenset of passwords between all instances,
+    list is loaded by AppConfig.ready(), so no request pays for reading 20k passwords.
+    """
+
+    def __init__(self, password_list_path=password_validation.CommonPasswordValidator.DEFAULT_PASSWORD_LIST_PATH):
+        self.passwords = load_common_passwords(str(password_list_path))
@@ -0,0 +1,3 @@
+__all__ = ["get_redis"]
+
+from core.services.redis.client import get_redis
@@ -0,0 +1,15 @@
+import functools
+
+import redis
+
+
+@functools.lru_cache(maxsize=None)
+def get_redis(url):
+    """
+    Get Redis client shared by the whole process, every client keeps its own connection pool.
+    Args:
+        url: String - Redis url, e.g. "redis://127.0.0.1:6379/0".
+    Returns:
+        redis.Redis client.
+    """
+    return redis.Redis.from_url(url)
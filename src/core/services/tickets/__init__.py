@@ -0,0 +1,28 @@
+__all__ = [
+    "SyncToken",
+    "TicketTransition",
+    "TransitionResult",
+    "bulk_close_tickets",
+    "bulk_create_tickets",
+    "close_ticket",
+    "decode_sync_token",
+    "encode_sync_token",
+    "export_tickets",
+    "get_ticket_changes",
+    "restamp_late_changes",
+]
+
+from core.services.tickets.bulk import bulk_close_tickets, bulk_create_tickets
+from core.services.tickets.changes import (
+    SyncToken,
+    decode_sync_token,
+    encode_sync_token,
+    get_ticket_changes,
+    restamp_late_changes,
+)
+from core.services.tickets.export import export_tickets
+from core.services.tickets.transitions import (
+    TicketTransition,
+    TransitionResult,
+    close_ticket,
+)
@@ -0,0 +1,79 @@
+from django.db import connections, router, transaction
+
+from core.models import Ticket
+from core.services.tickets.changes import restamp_late_changes
+from core.services.tickets.transitions import TransitionResult, close_ticket
+from core.services.versions import ticket_versions
+
+
+def bulk_create_tickets(user, items):
+    """
+    Validates and creates Tickets in one batch.
+    HashTags are resolved from HashTag catalog, valid Tickets are written with bulk INSERT in one transaction,
+    on databases that do not return ids from bulk insert they are read back in the same transaction.
+    Args:
+        user: User - creator of Tickets.
+        items: List of dicts with hash_tag name and question.
+    Returns:
+        Tuple with list of created Tickets and list of per item results in the same order as items,
+        {"index": Integer, "status": "created"} or {"index": Integer, "status": "error", "errors": Dict}.
+    """
+    from core.serializers import TicketCreateSerializer
+
+    results = []
+    tickets = []
+    for index, item in enumerate(items):
+        serializer = TicketCreateSerializer(data=item)
+        if not serializer.is_valid():
+            results.append({"index": index, "status": "error", "errors": serializer.errors})
+            continue
+        tickets.append(
+            Ticket(
+                creator=user,
+                hash_tag=serializer.validated_data["hash_tag"],
+                question=serializer.validated_data["question"],
+            )
+        )
+        results.append({"index": index, "status": "created"})
+
+    using = router.db_for_write(Ticket)
+    with transaction.atomic(using=using):
+        Ticket.objects.db_manager(using).bulk_create(tickets)
+        if tickets and not connections[using].features.can_return_rows_from_bulk_insert:
+            _set_inserted_ids(tickets, using)
+    #  Bulk INSERT sends no post_save signals, Ticket post_save receivers only bump the version and restamp.
+    if tickets:
+        ticket_versions.bump(using=using)
+        restamp_late_changes([ticket.id for ticket in tickets], min(ticket.updated_at for ticket in tickets), using)
+    return tickets, results
+
+
+def _set_inserted_ids(tickets, using):
+    """
+    Sets ids of Tickets just inserted by the current transaction on SQLite, which does not return them.
+    SQLite holds the write lock from the INSERT to commit and assigns increasing ids,
+    so the last len(tickets) ids belong to inserted Tickets in insert order.
+    """
+    ids = list(Ticket.objects.using(using).order_by("-id").values_list("id", flat=True)[: len(tickets)])
+    for ticket, ticket_id in zip(tickets, reversed(ids)):
+        ticket.id = ticket_id
+
+
+def bulk_close_tickets(user, ids):
+    """
+    Marks Tickets as archived in one batch with one SELECT and one UPDATE.
+    User can close only Tickets he created, staff can close any Ticket.
+    Args:
+        user: User who closes Tickets.
+        ids: List of Ticket ids.
+    Returns:
+        List of per id results in the same order as ids without duplicates,
+        {"id": Integer, "status": "closed"} or {"id": Integer, "status": "error", "error": String}.
+    """
+    results = []
+    for ticket_id, result in close_ticket.apply_many(ids, user).items():
+        if result is TransitionResult.APPLIED:
+            results.append({"id": ticket_id, "status": "closed"})
+        else:
+            results.append({"id": ticket_id, "status": "error", "error": close_ticket.get_error_message(result)})
+    return results
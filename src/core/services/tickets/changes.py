@@ -0,0 +1,112 @@
+import binascii
+import datetime
+import logging
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import namedtuple
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import Ticket
+from core.pagination.cursor import MAX_ID
+from core.services.versions import ticket_versions
+
+logger = logging.getLogger(__name__)
+
+SyncToken = namedtuple("SyncToken", ["updated_at", "id"])
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def encode_sync_token(updated_at, ticket_id):
+    """
+    Encodes position in Tickets change order as opaque token.
+    Args:
+        updated_at: Aware datetime - updated_at of the last seen Ticket.
+        ticket_id: Integer - id of the last seen Ticket.
+    Returns:
+        String token.
+    """
+    delta = updated_at - _EPOCH
+    microseconds = (delta.days * 86400 + delta.seconds) * 10**6 + delta.microseconds
+    return urlsafe_b64encode(f"{microseconds}.{ticket_id}".encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_sync_token(token):
+    """
+    Args:
+        token: String token from encode_sync_token.
+    Returns:
+        SyncToken.
+    Raises:
+        ValueError if token is invalid.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        microseconds, ticket_id = urlsafe_b64decode(padded.encode("ascii")).decode("ascii").split(".")
+        sync_token = SyncToken(_EPOCH + datetime.timedelta(microseconds=int(microseconds)), int(ticket_id))
+    except (TypeError, ValueError, UnicodeError, OverflowError, binascii.Error):
+        raise ValueError("Invalid sync token.")
+    #  Ids are 64-bit signed integers, bigger ids overflow database parameters.
+    if not 1 <= sync_token.id <= MAX_ID:
+        raise ValueError("Invalid sync token.")
+    return sync_token
+
+
+def restamp_late_changes(ids, updated_at, using=None):
+    """
+    Enforces TICKET_CHANGES_LAG bound of Ticket write transactions.
+    After commit, Tickets of a transaction that took longer than half of the lag since updated_at was set
+    get updated_at once more, so they come again after sync tokens issued while they were not committed yet.
+    The other half of the lag covers clock difference between servers, clocks must be synchronized.
+    Args:
+        ids: List of changed Ticket ids.
+        updated_at: Aware datetime - the earliest updated_at the transaction has set.
+        using: String - database alias of the transaction.
+    """
+    bound = datetime.timedelta(seconds=settings.TICKET_CHANGES_LAG / 2)
+
+    def restamp():
+        late = timezone.now() - updated_at
+        if late < bound:
+            return
+        logger.warning("Ticket write transaction took %s, over half of TICKET_CHANGES_LAG, restamping.", late)
+        Ticket.objects.using(using).filter(id__in=ids).update(updated_at=timezone.now())
+        ticket_versions.bump(using=using)
+
+    transaction.on_commit(restamp, using=using)
+
+
+def get_ticket_changes(queryset, since=None, limit=None):
+    """
+    Gets Tickets created or changed after sync token, closed Tickets come with is_archived true.
+    Tickets are ordered by (updated_at, id) and read with keyset condition on index of these columns,
+    so the cost depends on the number of changes, not on table size.
+    Changes of the last TICKET_CHANGES_LAG seconds are held back, a transaction that started earlier
+    may still commit a Ticket with older updated_at, and it must not end up behind a token client already has.
+    Transactions that outlive the lag are caught after commit by restamp_late_changes.
+    Args:
+        queryset: Ticket QuerySet with Tickets client may see.
+        since: SyncToken or None to start from the first Ticket.
+        limit: Integer - maximum number of Tickets, TICKET_CHANGES_PAGE_SIZE from settings if None.
+    Returns:
+        Tuple with list of TicketValuesSerializer rows, token to pass next time and Boolean - True if there are more
+        changes right now. Token is the given one if there are no changes.
+    """
+    from core.serializers import TicketValuesSerializer
+
+    limit = limit or settings.TICKET_CHANGES_PAGE_SIZE
+    horizon = timezone.now() - datetime.timedelta(seconds=settings.TICKET_CHANGES_LAG)
+    queryset = queryset.filter(updated_at__lt=horizon)
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since.updated_at).exclude(
+            updated_at=since.updated_at, id__lte=since.id
+        )
+    rows = list(TicketValuesSerializer.values(queryset.order_by("updated_at", "id"))[: limit + 1])
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if not rows:
+        return rows, encode_sync_token(*since) if since is not None else None, has_more
+    updated_at = rows[-1][TicketValuesSerializer.names.index("updated_at")]
+    return rows, encode_sync_token(updated_at, rows[-1][0]), has_more
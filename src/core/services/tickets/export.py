@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+from django.conf import settings
+from rest_framework.fields import DateTimeField
+from rest_framework.utils.encoders import JSONEncoder
+
+#  Same fields and order as TicketSerializer represents.
+EXPORT_FIELDS = ("id", "hash_tag", "question", "is_archived", "created_at", "updated_at", "creator")
+EXPORT_COLUMNS = ("id", "hash_tag__name", "question", "is_archived", "created_at", "updated_at", "creator_id")
+
+#  Datetimes are represented in current time zone, the same as TicketSerializer does.
+_datetime = DateTimeField().to_representation
+
+
+def iter_ticket_chunks(queryset, chunk_size=None):
+    """
+    Iterates Tickets as tuples of EXPORT_FIELDS values with represented datetimes, chunk by chunk.
+    Rows are read with server-side cursor on PostgreSQL (chunked fetch on other databases)
+    and model instances are never created, so memory does not depend on number of Tickets.
+    Args:
+        queryset: Ticket QuerySet, its ordering is replaced with ordering by id.
+        chunk_size: Integer - rows fetched from database at once, TICKET_EXPORT_CHUNK_SIZE from settings if None.
+    Yields:
+        Lists with at most chunk_size tuples.
+    """
+    chunk_size = chunk_size or settings.TICKET_EXPORT_CHUNK_SIZE
+    chunk = []
+    rows = queryset.order_by("id").values_list(*EXPORT_COLUMNS).iterator(chunk_size=chunk_size)
+    for ticket_id, hash_tag, question, is_archived, created_at, updated_at, creator in rows:
+        chunk.append(
+            (ticket_id, hash_tag, question, is_archived, _datetime(created_at), _datetime(updated_at), creator)
+        )
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _dumps(row):
+    return json.dumps(dict(zip(EXPORT_FIELDS, row)), cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"))
+
+
+def export_json(chunks):
+    """
+    Encodes Tickets as one JSON array, the same as unpaginated Ticket list.
+    Args:
+        chunks: Iterable of lists of Ticket tuples from iter_ticket_chunks.
+    Yields:
+        Bytes, one piece for every chunk.
+    """
+    separator = "["
+    for chunk in chunks:
+        yield (separator + ",".join(_dumps(row) for row in chunk)).encode("utf-8")
+        separator = ","
+    yield b"[]" if separator == "[" else b"]"
+
+
+def export_ndjson(chunks):
+    """
+    Encodes Tickets as newline delimited JSON, one Ticket per line.
+    """
+    for chunk in chunks:
+        yield "".join(_dumps(row) + "\n" for row in chunk).encode("utf-8")
+
+
+def export_csv(chunks):
+    """
+    Encodes Tickets as CSV with header row, booleans are written as in JSON.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for chunk in chunks:
+        writer.writerows(
+            (ticket_id, hash_tag, question, "true" if is_archived else "false", created_at, updated_at, creator)
+            for ticket_id, hash_tag, question, is_archived, created_at, updated_at, creator in chunk
+        )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+EXPORT_FORMATS = {
+    "json": (export_json, "application/json"),
+    "ndjson": (export_ndjson, "application/x-ndjson"),
+    "csv": (export_csv, "text/csv; charset=utf-8"),
+}
+
+
+def export_tickets(queryset, export_format, chunk_size=None):
+    """
+    Streams Tickets in given format.
+    Args:
+        queryset: Ticket QuerySet.
+        export_format: String - one of EXPORT_FORMATS keys.
+        chunk_size: Integer - rows fetched from database at once.
+    Returns:
+        Tuple with iterator of bytes and content type.
+    """
+    encoder, content_type = EXPORT_FORMATS[export_format]
+    return encoder(iter_ticket_chunks(queryset, chunk_size)), content_type
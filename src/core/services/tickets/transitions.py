@@ -0,0 +1,134 @@
+import enum
+from django.db import router, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from core.models import Ticket
+from core.services.tickets.changes import restamp_late_changes
+from core.services.versions import ticket_versions
+
+
+class TransitionResult(enum.Enum):
+    """
+    Enum with results of Ticket state transition.
+    """
+
+    APPLIED = "applied"
+    NOT_FOUND = "not_found"
+    FORBIDDEN = "forbidden"
+    INVALID_STATE = "invalid_state"
+
+
+class TicketTransition:
+    """
+    Ticket state transition applied with one conditional UPDATE,
+    Ticket is changed only if it exists, user may change it and it is in source state.
+    Only on failure one more query finds out the reason.
+    UPDATE sends no signals, so it sets updated_at, bumps Tickets collection version and restamps late changes itself.
+    New transitions (reopen, assign, etc.) are new instances with their own source and target states.
+    Attributes:
+        name: String - transition name.
+        source: Dict - lookups Ticket must match before transition, e.g. {"is_archived": False}.
+        target: Dict - fields values Ticket gets after transition, e.g. {"is_archived": True}.
+        invalid_state_message: String - reason why Ticket in other state can not be transitioned.
+    """
+
+    def __init__(self, name, source, target, invalid_state_message):
+        self.name = name
+        self.source = source
+        self.target = target
+        self.invalid_state_message = invalid_state_message
+
+    def get_permission_filter(self, user):
+        """
+        User can change only Tickets he created, staff can change any Ticket.
+        Args:
+            user: User who applies transition.
+        Returns:
+            Q with Tickets user may change.
+        """
+        if user.is_staff:
+            return Q()
+        return Q(creator_id=user.id)
+
+    def get_error_message(self, result):
+        return {
+            TransitionResult.NOT_FOUND: _("Ticket does not exist."),
+            TransitionResult.FORBIDDEN: _("User is not ticket creator."),
+            TransitionResult.INVALID_STATE: self.invalid_state_message,
+        }[result]
+
+    def apply(self, ticket_id, user):
+        """
+        Applies transition to one Ticket.
+        Args:
+            ticket_id: Integer Ticket id.
+            user: User who applies transition.
+        Returns:
+            TransitionResult.
+        """
+        updated_at = timezone.now()
+        updated = Ticket.objects.filter(self.get_permission_filter(user), id=ticket_id, **self.source).update(
+            **self.target, updated_at=updated_at
+        )
+        if updated:
+            using = router.db_for_write(Ticket)
+            ticket_versions.bump(using=using)
+            restamp_late_changes([ticket_id], updated_at, using=using)
+            return TransitionResult.APPLIED
+
+        row = Ticket.objects.filter(id=ticket_id).values("creator_id", *self.source).first()
+        return self._check(row, user)
+
+    def apply_many(self, ids, user):
+        """
+        Applies transition to many Tickets with one locking SELECT and one UPDATE.
+        Args:
+            ids: List of Ticket ids.
+            user: User who applies transition.
+        Returns:
+            Dict with Ticket id as key and TransitionResult as value, in the same order as ids.
+        """
+        ids = list(dict.fromkeys(ids))
+        using = router.db_for_write(Ticket)
+        with transaction.atomic(using=using):
+            rows = {
+                row["id"]: row
+                for row in Ticket.objects.select_for_update()
+                .filter(id__in=ids)
+                .values("id", "creator_id", *self.source)
+            }
+            results = {ticket_id: self._check(rows.get(ticket_id), user) for ticket_id in ids}
+            applicable = [ticket_id for ticket_id, result in results.items() if result is TransitionResult.APPLIED]
+            if applicable:
+                updated_at = timezone.now()
+                Ticket.objects.filter(id__in=applicable, **self.source).update(**self.target, updated_at=updated_at)
+                ticket_versions.bump(using=using)
+                restamp_late_changes(applicable, updated_at, using=using)
+        return results
+
+    def _check(self, row, user):
+        """
+        Finds out if transition can be applied to Ticket.
+        Args:
+            row: Dict with Ticket creator_id and source fields or None if Ticket does not exist.
+            user: User who applies transition.
+        Returns:
+            TransitionResult.
+        """
+        if row is None:
+            return TransitionResult.NOT_FOUND
+        if not user.is_staff and row["creator_id"] != user.id:
+            return TransitionResult.FORBIDDEN
+        if any(row[field] != value for field, value in self.source.items()):
+            return TransitionResult.INVALID_STATE
+        return TransitionResult.APPLIED
+
+
+close_ticket = TicketTransition(
+    name="close",
+    source={"is_archived": False},
+    target={"is_archived": True},
+    invalid_state_message=_("Ticket already marked as archived."),
+)
@@ -0,0 +1,3 @@
+__all__ = ["UserResolver", "get_user_resolver"]
+
+from core.services.users.resolver import UserResolver, get_user_resolver
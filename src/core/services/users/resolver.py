@@ -0,0 +1,48 @@
+from core.models import User
+
+MISSING = object()
+
+
+class UserResolver:
+    """
+    Request scoped users lookup, every email is resolved with one query per request,
+    so validators and view share the same User instance instead of querying users table again.
+    Attributes:
+        fields: Tuple of User fields to fetch, enough to check password and represent User with token.
+    """
+
+    fields = ("id", "email", "password", "is_active", "first_name", "last_name")
+
+    def __init__(self):
+        self._users = {}
+
+    def get_by_email(self, email):
+        """
+        Get User by case-insensitive email.
+        Args:
+            email: String with Email.
+        Returns:
+            User or None if User does not exist.
+        """
+        key = email.lower()
+        user = self._users.get(key, MISSING)
+        if user is MISSING:
+            user = User.objects.by_email(email).only(*self.fields).first()
+            self._users[key] = user
+        return user
+
+
+def get_user_resolver(request):
+    """
+    Get UserResolver of request, it is created with first call.
+    Args:
+        request: Request or None, then new UserResolver is returned.
+    Returns:
+        UserResolver.
+    """
+    if request is None:
+        return UserResolver()
+    resolver = getattr(request, "_user_resolver", None)
+    if resolver is None:
+        resolver = request._user_resolver = UserResolver()
+    return resolver
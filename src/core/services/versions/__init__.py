@@ -0,0 +1,21 @@
+__all__ = [
+    "CollectionVersion",
+    "MemoryVersionStore",
+    "RedisVersionStore",
+    "Version",
+    "get_version_store",
+    "hash_tag_versions",
+    "ticket_versions",
+]
+
+from core.services.versions.collection import (
+    CollectionVersion,
+    hash_tag_versions,
+    ticket_versions,
+)
+from core.services.versions.stores import (
+    MemoryVersionStore,
+    RedisVersionStore,
+    Version,
+    get_version_store,
+)
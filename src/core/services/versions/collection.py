@@ -0,0 +1,53 @@
+from django.conf import settings
+from django.db import transaction
+
+from asgiref.sync import sync_to_async
+
+from core.services.versions.stores import get_version_store
+
+
+class CollectionVersion:
+    """
+    Version counter of a collection (e.g. all Tickets) kept in version store shared by all processes.
+    Every change of the collection bumps the counter after commit, so clients may revalidate
+    their copies of list and detail responses with ETag and Last-Modified without a database query.
+    Counter is seeded with current time in nanoseconds when it is missing (first use or lost store),
+    so a new counter never repeats numbers of the lost one.
+    Reads from replicas may return rows older than the version for up to DATABASE_REPLICA_LAG seconds,
+    so version is not settled for that time after the change, the time is kept in the store with the counter.
+    Validators of responses built while it was not settled stop matching once it is.
+    Attributes:
+        name: String - name of the collection, part of store keys and ETags.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def get(self):
+        """
+        Returns:
+            Version with counter number, unix timestamp of the last change and settled flag,
+            or None if store is not available.
+            Missing counter is initialized, modification time is then the current time.
+        """
+        return get_version_store().get(self.name)
+
+    async def aget(self):
+        return await sync_to_async(self.get)()
+
+    def bump(self, using=None):
+        """
+        Bumps counter after current transaction commits or at once outside of transaction.
+        Readers that see the old number until then get committed rows with an older ETag,
+        which only costs clients one more full response, never a stale 304.
+        Args:
+            using: String - database alias of the transaction.
+        """
+        transaction.on_commit(self._bump, using=using)
+
+    def _bump(self):
+        get_version_store().increment(self.name, settle_after=settings.DATABASE_REPLICA_LAG)
+
+
+ticket_versions = CollectionVersion("tickets")
+hash_tag_versions = CollectionVersion("hash_tags")
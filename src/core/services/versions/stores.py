@@ -0,0 +1,139 @@
+import functools
+import logging
+import threading
+import time
+from collections import namedtuple
+from django.conf import settings
+
+import redis
+
+from core.services.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+MEMORY_URL = "memory://"
+
+# Version is not settled while replicas may still lag behind its last change.
+Version = namedtuple("Version", ["number", "modified_at", "settled"], defaults=(True,))
+
+
+class MemoryVersionStore:
+    """
+    In-process counters, every process has its own versions.
+    Use it for tests and single process servers, other processes would answer 304 to clients with stale copies.
+    """
+
+    def __init__(self):
+        # Number, modification time and time version settles by collection name.
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """
+        Args:
+            name: String - name of the collection.
+        Returns:
+            Version, missing counter is seeded with current time in nanoseconds.
+        """
+        with self._lock:
+            number, modified_at, settled_at = self._versions.setdefault(name, (time.time_ns(), time.time(), 0.0))
+        return Version(number, modified_at, time.time() >= settled_at)
+
+    def increment(self, name, settle_after=0):
+        """
+        Increments counter of the collection and sets its modification time to now.
+        Args:
+            name: String - name of the collection.
+            settle_after: Float - seconds the new version is not settled.
+        """
+        now = time.time()
+        with self._lock:
+            version = self._versions.get(name)
+            number = time.time_ns() if version is None else version[0] + 1
+            self._versions[name] = (number, now, now + settle_after)
+
+    def clear(self):
+        with self._lock:
+            self._versions.clear()
+
+
+# KEYS: version hash. ARGV: seed of missing counter, modification time.
+SEED_SCRIPT = """
+redis.call("HSETNX", KEYS[1], "number", ARGV[1])
+redis.call("HSETNX", KEYS[1], "modified_at", ARGV[2])
+return redis.call("HMGET", KEYS[1], "number", "modified_at", "settled_at")
+"""
+
+# KEYS: version hash. ARGV: seed of missing counter, modification time, time version settles.
+INCREMENT_SCRIPT = """
+if redis.call("HSETNX", KEYS[1], "number", ARGV[1]) == 0 then
+    redis.call("HINCRBY", KEYS[1], "number", 1)
+end
+redis.call("HSET", KEYS[1], "modified_at", ARGV[2], "settled_at", ARGV[3])
+"""
+
+
+class RedisVersionStore:
+    """
+    Counters shared by all processes, one Redis hash with number, modification time and settle time per collection.
+    Reading an existing version is one HMGET, counters are seeded and incremented by atomic Lua scripts.
+    If Redis is not available there is no version, responses go without validators and are never answered with 304.
+    Attributes:
+        client: redis.Redis client.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.seed_script = client.register_script(SEED_SCRIPT)
+        self.increment_script = client.register_script(INCREMENT_SCRIPT)
+
+    @staticmethod
+    def make_key(name):
+        return f"versions:{name}"
+
+    def get(self, name):
+        """
+        Get version the same as MemoryVersionStore.get.
+        Returns:
+            Version or None if Redis is not available.
+        """
+        key = self.make_key(name)
+        try:
+            number, modified_at, settled_at = self.client.hmget(key, "number", "modified_at", "settled_at")
+            if number is None or modified_at is None:
+                number, modified_at, settled_at = self.seed_script(keys=[key], args=[time.time_ns(), repr(time.time())])
+        except (redis.RedisError, OSError):
+            logger.warning("Version store is not available, responses go without validators.", exc_info=True)
+            return None
+        return Version(int(number), float(modified_at), settled_at is None or time.time() >= float(settled_at))
+
+    def increment(self, name, settle_after=0):
+        """
+        Increments counter the same as MemoryVersionStore.increment.
+        """
+        now = time.time()
+        try:
+            self.increment_script(
+                keys=[self.make_key(name)], args=[time.time_ns(), repr(now), repr(now + settle_after)]
+            )
+        except (redis.RedisError, OSError):
+            logger.exception("Version of %s was not incremented, clients may keep stale copies.", name)
+
+
+_memory_store = MemoryVersionStore()
+
+
+@functools.lru_cache(maxsize=None)
+def _redis_store(url):
+    return RedisVersionStore(get_redis(url))
+
+
+def get_version_store():
+    """
+    Get store by VERSION_STORE_URL from settings.
+    Returns:
+        MemoryVersionStore if url is "memory://", RedisVersionStore shared by the process otherwise.
+    """
+    if settings.VERSION_STORE_URL == MEMORY_URL:
+        return _memory_store
+    return _redis_store(settings.VERSION_STORE_URL)
@@ -0,0 +1,18 @@
+__all__ = [
+    "bump_hash_tag_version",
+    "bump_ticket_version",
+    "install_search_index",
+    "invalidate_deleted_auth_token",
+    "invalidate_hash_tag_catalog",
+    "invalidate_user_auth_tokens",
+    "restamp_late_ticket_change",
+]
+
+from core.signals.authentication import (
+    invalidate_deleted_auth_token,
+    invalidate_user_auth_tokens,
+)
+from core.signals.hash_tags import invalidate_hash_tag_catalog
+from core.signals.search import install_search_index
+from core.signals.tickets import restamp_late_ticket_change
+from core.signals.versions import bump_hash_tag_version, bump_ticket_version
@@ -0,0 +1,50 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token as AuthToken
+
+from core.authentication import CachedTokenAuthentication
+from core.models import User
+from core.services import invalidate_auth_token_key
+
+# User fields that are saved without changing what authenticated requests may do.
+UNRELATED_USER_FIELDS = {"last_login"}
+
+
+@receiver(post_delete, sender=AuthToken)
+def invalidate_deleted_auth_token(sender, instance, **kwargs):
+    """
+    Removes deleted authentication token from cache of all processes, again after commit,
+    so it is not cached back by a request that read it before the transaction ended.
+    Args:
+        sender: Token model class.
+        instance: Deleted Token.
+        **kwargs: Extra parameters to match signal signature.
+    """
+    key, user_id = instance.key, instance.user_id
+
+    def invalidate():
+        CachedTokenAuthentication.invalidate(key)
+        invalidate_auth_token_key(user_id)
+
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_auth_tokens(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Removes User authentication tokens from cache of all processes when User is changed,
+    cached tokens keep User, so password, is_active and is_staff changes take effect on the next request.
+    Args:
+        sender: User model class.
+        instance: Saved User.
+        created: Boolean - True if User was created.
+        update_fields: Frozenset with names of saved fields or None if all fields were saved.
+        **kwargs: Extra parameters to match signal signature.
+    """
+    if created or (update_fields and update_fields <= UNRELATED_USER_FIELDS):
+        return
+    keys = list(AuthToken.objects.filter(user_id=instance.pk).values_list("key", flat=True))
+    CachedTokenAuthentication.invalidate(*keys)
+    transaction.on_commit(lambda: CachedTokenAuthentication.invalidate(*keys))
@@ -0,0 +1,21 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import HashTag
+from core.services import hash_tag_catalog
+
+
+@receiver(post_save, sender=HashTag)
+@receiver(post_delete, sender=HashTag)
+def invalidate_hash_tag_catalog(sender, instance, **kwargs):
+    """
+    Invalidates HashTag catalog cache when HashTag is saved or deleted.
+    Catalog is invalidated again after commit, so it is not filled with old rows while transaction is open.
+    Args:
+        sender: HashTag model class.
+        instance: Saved or deleted HashTag.
+        **kwargs: Extra parameters to match signal signature.
+    """
+    hash_tag_catalog.invalidate()
+    transaction.on_commit(hash_tag_catalog.invalidate)
@@ -0,0 +1,20 @@
+from django.db import connections
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+
+from core.search import get_search_backend
+
+
+@receiver(post_migrate)
+def install_search_index(sender, app_config, using, **kwargs):
+    """
+    Makes sure Ticket search index exists after migrations, migrations may rebuild core_ticket table.
+    Args:
+        sender: AppConfig that was migrated.
+        app_config: AppConfig that was migrated.
+        using: Database alias.
+        **kwargs: Extra parameters to match signal signature.
+    """
+    if app_config.name != "core" or "core_ticket" not in connections[using].introspection.table_names():
+        return
+    get_search_backend(using).install()
@@ -0,0 +1,19 @@
+from django.db import router
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from core.models import Ticket
+from core.services import restamp_late_changes
+
+
+@receiver(post_save, sender=Ticket)
+def restamp_late_ticket_change(sender, instance, **kwargs):
+    """
+    Restamps saved Ticket after commit if its transaction outlived the bound of Ticket changes feed.
+    Conditional and bulk writes that do not send signals restamp Tickets themselves.
+    Args:
+        sender: Ticket model class.
+        instance: Saved Ticket.
+        **kwargs: Extra parameters to match signal signature.
+    """
+    restamp_late_changes([instance.id], instance.updated_at, using=router.db_for_write(Ticket))
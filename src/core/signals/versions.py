@@ -0,0 +1,36 @@
+from django.db import router
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import HashTag, Ticket
+from core.services.versions import hash_tag_versions, ticket_versions
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+def bump_ticket_version(sender, instance, **kwargs):
+    """
+    Bumps Tickets collection version after commit when Ticket is saved or deleted.
+    Conditional and bulk writes that do not send signals bump it themselves.
+    Args:
+        sender: Ticket model class.
+        instance: Saved or deleted Ticket.
+        **kwargs: Extra parameters to match signal signature.
+    """
+    ticket_versions.bump(using=router.db_for_write(Ticket))
+
+
+@receiver(post_save, sender=HashTag)
+@receiver(post_delete, sender=HashTag)
+def bump_hash_tag_version(sender, instance, **kwargs):
+    """
+    Bumps HashTags collection version after commit when HashTag is saved or deleted.
+    Tickets are represented with HashTag name, so Tickets collection version is bumped too.
+    Args:
+        sender: HashTag model class.
+        instance: Saved or deleted HashTag.
+        **kwargs: Extra parameters to match signal signature.
+    """
+    using = router.db_for_write(HashTag)
+    hash_tag_versions.bump(using=using)
+    ticket_versions.bump(using=using)
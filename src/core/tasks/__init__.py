@@ -1,3 +1,4 @@
-__all__ = ["send_email"]
+__all__ = ["delete_expired_tokens", "flush_email_outbox", "send_email"]
 
-from .email import send_email
+from .email import flush_email_outbox, send_email
+from .tokens import delete_expired_tokens
@@ -2,12 +2,16 @@ from __future__ import absolute_import, unicode_literals
 
 import django.core.mail as dcm
 from django.conf import settings
+from smtplib import SMTPException
 
 from rest_api.celery import app
 
 
 @app.task
 def send_email(subject, html_message, recipient_list):
+    """
+    Send one prerendered email, kept for tasks queued before outbox was introduced, use send_template_email.
+    """
     dcm.send_mail(
         subject=subject,
         message=None,
@@ -15,3 +19,19 @@ def send_email(subject, html_message, recipient_list):
         from_email=settings.DEFAULT_FROM_EMAIL,
         recipient_list=recipient_list,
     )
+
+
+@app.task(bind=True, ignore_result=True, max_retries=settings.EMAIL_MAX_RETRIES)
+def flush_email_outbox(self):
+    """
+    Send all queued emails, retries with exponential backoff if email server is unavailable.
+    Not sent messages stay in outbox, so they are also picked up by periodic flush after retries are exhausted.
+    """
+    # Services import tasks to schedule them, so they are imported when task runs.
+    from core.services.email import deliver_outbox
+
+    try:
+        return deliver_outbox()
+    except (SMTPException, OSError) as error:
+        countdown = min(settings.EMAIL_RETRY_BACKOFF * 2**self.request.retries, settings.EMAIL_RETRY_BACKOFF_MAX)
+        raise self.retry(exc=error, countdown=countdown)
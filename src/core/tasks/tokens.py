@@ -0,0 +1,29 @@
+from __future__ import absolute_import, unicode_literals
+
+from django.conf import settings
+
+from core.models import Token
+from rest_api.celery import app
+
+
+@app.task(ignore_result=True)
+def delete_expired_tokens(batch_size=None, max_batches=None):
+    """
+    Delete expired tokens in bounded batches, every batch is its own short transaction,
+    so table is never locked for long and run time of one task is bounded too.
+    Args:
+        batch_size: Integer - tokens deleted by one DELETE, TOKEN_REAPER_BATCH_SIZE from settings if None.
+        max_batches: Integer - batches deleted by one run, TOKEN_REAPER_MAX_BATCHES from settings if None,
+            rest is deleted by next run.
+    Returns:
+        Integer - number of deleted tokens.
+    """
+    batch_size = batch_size or settings.TOKEN_REAPER_BATCH_SIZE
+    max_batches = max_batches or settings.TOKEN_REAPER_MAX_BATCHES
+    deleted = 0
+    for _ in range(max_batches):
+        ids = list(Token.objects.expired().order_by("expiration_date").values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+        deleted += Token.objects.filter(id__in=ids).delete()[0]
+    return deleted
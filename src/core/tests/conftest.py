@@ -0,0 +1,71 @@
+from django.core.cache import caches
+from rest_framework.test import APIClient
+
+import pytest
+
+from core.authentication import CachedTokenAuthentication
+from core.benchmarks.factories import HashTagFactory, TicketFactory, UserFactory
+from core.services import hash_tag_catalog, issue_auth_token
+from core.services.auth_token.tokens import token_key_cache
+from core.throttling import get_throttle_store
+from rest_api.celery import app as celery_app
+
+MEMORY_URL = "memory://"
+
+
+@pytest.fixture(autouse=True)
+def in_process_services(settings):
+    """
+    Keeps throttle counters, collection versions, events, metrics, email outbox and cache invalidations in process,
+    so tests run without Redis, sends emails to django.core.mail.outbox and starts every test with empty caches.
+    """
+    settings.THROTTLE_STORE_URL = MEMORY_URL
+    settings.VERSION_STORE_URL = MEMORY_URL
+    settings.EVENTS_BROKER_URL = MEMORY_URL
+    settings.METRICS_STORE_URL = MEMORY_URL
+    settings.EMAIL_OUTBOX_URL = MEMORY_URL
+    settings.CACHE_INVALIDATION_URL = MEMORY_URL
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    celery_app.conf.task_always_eager = True
+    for cache in caches.all():
+        cache.clear()
+    for cache in (CachedTokenAuthentication.cache, token_key_cache, hash_tag_catalog.cache):
+        cache.local.clear()
+    get_throttle_store().clear()
+    yield
+
+
+@pytest.fixture
+def user(db):
+    return UserFactory()
+
+
+@pytest.fixture
+def staff(db):
+    return UserFactory(is_staff=True)
+
+
+@pytest.fixture
+def hash_tag(db):
+    return HashTagFactory()
+
+
+@pytest.fixture
+def tickets(user, hash_tag):
+    return TicketFactory.create_batch(5, creator=user, hash_tag=hash_tag, is_archived=False)
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def user_client(user):
+    # Token is sent in header, async views authenticate it without DRF request.
+    return APIClient(HTTP_AUTHORIZATION=f"Token {issue_auth_token(user)}")
+
+
+@pytest.fixture
+def staff_client(staff):
+    return APIClient(HTTP_AUTHORIZATION=f"Token {issue_auth_token(staff)}")
@@ -0,0 +1,73 @@
+import pytest
+
+from core.benchmarks.factories import BENCHMARK_PASSWORD
+from core.models import Token, TokenTypeEnum
+from core.services import issue_auth_token
+
+
+def token(user, token_type):
+    return str(Token.objects.create(user=user, token_type=token_type).value)
+
+
+def users_reads(queries):
+    return [query["sql"] for query in queries if query["sql"].startswith("SELECT") and '"core_user"' in query["sql"]]
+
+
+@pytest.fixture
+def signed_up_user(user):
+    # Token key is cached when User signs up.
+    issue_auth_token(user)
+    return user
+
+
+@pytest.mark.django_db
+def test_sign_in_queries(django_assert_num_queries, api_client, signed_up_user):
+    data = {"email": signed_up_user.email.upper(), "password": BENCHMARK_PASSWORD}
+    with django_assert_num_queries(1) as queries:
+        response = api_client.post("/api/auth/sign_in/", data)
+
+    assert response.status_code == 200
+    assert len(users_reads(queries)) == 1
+
+
+@pytest.mark.django_db
+def test_confirm_email_queries(django_assert_num_queries, api_client, signed_up_user):
+    data = {"token": token(signed_up_user, TokenTypeEnum.EMAIL_VERIFICATION)}
+    # Token with User, token delete, User update and auth token keys to invalidate.
+    with django_assert_num_queries(4) as queries:
+        response = api_client.post("/api/auth/confirm_email/", data)
+
+    assert response.status_code == 200
+    assert len(users_reads(queries)) == 1
+
+
+@pytest.mark.django_db
+def test_reset_password_queries(django_assert_num_queries, api_client, signed_up_user):
+    data = {"token": token(signed_up_user, TokenTypeEnum.RESET_PASSWORD), "password": "Another-password-2021"}
+    with django_assert_num_queries(4) as queries:
+        response = api_client.post("/api/auth/reset_password/", data)
+
+    assert response.status_code == 200
+    assert len(users_reads(queries)) == 1
+
+
+@pytest.mark.django_db
+def test_forgot_password_queries(django_assert_num_queries, api_client, signed_up_user):
+    # User and reset password token insert.
+    with django_assert_num_queries(2) as queries:
+        response = api_client.post("/api/auth/forgot_password/", {"email": signed_up_user.email.upper()})
+
+    assert response.status_code == 200
+    assert len(users_reads(queries)) == 1
+
+
+@pytest.mark.django_db
+def test_sign_up_queries(django_assert_num_queries, api_client):
+    data = {"email": "new@example.com", "password": BENCHMARK_PASSWORD, "first_name": "New", "last_name": "User"}
+    # Existence check, then savepoint with User, auth token and verification token inserts.
+    with django_assert_num_queries(6) as queries:
+        response = api_client.post("/api/auth/sign_up/", data)
+
+    assert response.status_code == 201
+    assert users_reads(queries) == [queries[0]["sql"]]
+    assert queries[0]["sql"].startswith('SELECT (1) AS "a" FROM "core_user"')
@@ -0,0 +1,94 @@
+import json
+import time
+
+import fakeredis
+import pytest
+
+from core.authentication import CachedTokenAuthentication
+from core.services.cache import TieredCache
+from core.services.cache.invalidation import RedisInvalidationBus
+
+STAFF_ONLY_URLS = ["/api/hash_tag/", "/api/async/hash_tag/"]
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Condition was not met in time."
+        time.sleep(0.01)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", STAFF_ONLY_URLS)
+def test_demoted_staff_loses_access_on_next_request(django_capture_on_commit_callbacks, staff, staff_client, url):
+    assert staff_client.get(url).status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        staff.is_staff = False
+        staff.save()
+
+    assert staff_client.get(url).status_code == 403
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", STAFF_ONLY_URLS)
+def test_deactivated_user_is_rejected(django_capture_on_commit_callbacks, staff, staff_client, url):
+    assert staff_client.get(url).status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        staff.is_active = False
+        staff.save()
+
+    assert staff_client.get(url).status_code == 401
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", STAFF_ONLY_URLS)
+def test_deleted_token_is_rejected(django_capture_on_commit_callbacks, staff, staff_client, url):
+    assert staff_client.get(url).status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        staff.auth_token.delete()
+
+    assert staff_client.get(url).status_code == 401
+
+
+@pytest.mark.django_db
+def test_last_login_update_keeps_cached_token(django_assert_num_queries, staff, staff_client):
+    staff_client.get("/api/hash_tag/")
+
+    with django_assert_num_queries(1):
+        staff.save(update_fields=["last_login"])
+
+    assert CachedTokenAuthentication.cache.get_local(staff.auth_token.key) is not None
+
+
+def test_value_loaded_before_delete_is_not_cached_back():
+    cache = TieredCache(prefix="test_tombstone", timeout=60, local_timeout=60)
+    cache.set("key", "old")
+
+    cache.delete("key")
+    # A request that read "old" from database before the change caches it after invalidation.
+    cache.add("key", "old")
+    cache.local.clear()
+
+    assert cache.get("key") is None
+
+
+def test_invalidation_from_another_process_drops_local_key():
+    server = fakeredis.FakeServer()
+    bus = RedisInvalidationBus(fakeredis.FakeRedis(server=server), "test:invalidations")
+    other_process = fakeredis.FakeRedis(server=server)
+    cache = CachedTokenAuthentication.cache
+
+    def invalidate(key):
+        return other_process.publish("test:invalidations", json.dumps({"prefix": cache.prefix, "keys": [key]}))
+
+    bus.start()
+    # Subscription clears local levels, probe is dropped one way or another once the listener runs.
+    cache.local.set("probe", "cached token")
+    wait_for(lambda: invalidate("probe") and cache.get_local("probe") is None)
+    cache.local.set("token-key", "cached token")
+
+    assert invalidate("token-key") == 1
+    wait_for(lambda: cache.get_local("token-key") is None)
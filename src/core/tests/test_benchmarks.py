@@ -0,0 +1,46 @@
+from django.db.models import Count
+
+import pytest
+
+from core.benchmarks import compare_results, run_benchmark
+from core.benchmarks.factories import seed_database
+from core.models import HashTag, Ticket, User
+
+
+@pytest.mark.django_db
+def test_seed_database_spreads_tickets_and_grows_database():
+    assert seed_database(25, users=3, hash_tags=2, batch_size=10) == {"users": 3, "hash_tags": 2, "tickets": 25}
+    seed_database(5, batch_size=10)
+
+    assert (User.objects.count(), HashTag.objects.count(), Ticket.objects.count()) == (4, 3, 30)
+    assert Ticket.objects.values("question").distinct().count() == 30
+    # Round robin over Users of each run, the second run seeds one more User.
+    counts = Ticket.objects.values("creator").annotate(count=Count("id")).values_list("count", flat=True)
+    assert sorted(counts) == [5, 8, 8, 9]
+
+
+def test_compare_results_reports_change_of_common_numbers():
+    baseline = [{"benchmark": "endpoints", "cases": {"list": {"p50_ms": 10, "queries": 0, "ok": True}}}]
+    current = [
+        {"benchmark": "endpoints", "cases": {"list": {"p50_ms": 12.5, "queries": 2, "ok": True}, "new": {"p50_ms": 1}}}
+    ]
+
+    assert compare_results(baseline, current) == {
+        "endpoints/cases/list/p50_ms": {"baseline": 10, "current": 12.5, "change_percent": 25.0},
+        "endpoints/cases/list/queries": {"baseline": 0, "current": 2, "change_percent": None},
+    }
+
+
+@pytest.mark.django_db
+def test_endpoints_benchmark_covers_every_url_with_test_client():
+    tickets = Ticket.objects.count()
+
+    result = run_benchmark("endpoints", iterations=1)
+
+    assert (result["benchmark"], result["server"], result["not_covered"]) == ("endpoints", "test client", [])
+    for case, measured in result["endpoints"].items():
+        assert measured["p50_ms"] is not None, case
+        assert sum(measured["statuses"].values()) == 1, case
+        assert all(status < "500" for status in measured["statuses"]), case
+    # Benchmark data is rolled back.
+    assert Ticket.objects.count() == tickets
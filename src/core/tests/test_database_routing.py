@@ -0,0 +1,73 @@
+from django.db import router as django_router
+
+import pytest
+
+from core.db import PrimaryReplicaRouter, replica_reads
+from core.models import Ticket
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """
+    Pretends "replica_1" is configured and records where every read is routed.
+    Queries still run on the test database, only routing decisions are checked.
+    Returns:
+        List of (model name, alias) tuples.
+    """
+    router = next(router for router in django_router.routers if isinstance(router, PrimaryReplicaRouter))
+    monkeypatch.setattr(router, "replicas", ["replica_1"])
+    routed = []
+    db_for_read = router.db_for_read
+
+    def record_read(model, **hints):
+        routed.append((model._meta.model_name, db_for_read(model, **hints) or "default"))
+
+    monkeypatch.setattr(router, "db_for_read", record_read)
+    return routed
+
+
+def aliases(reads, model_name):
+    return {alias for name, alias in reads if name == model_name}
+
+
+def test_reads_go_to_primary_outside_replica_reads(reads):
+    assert django_router.db_for_read(Ticket) == "default"
+
+    with replica_reads():
+        django_router.db_for_read(Ticket)
+
+    assert reads == [("ticket", "default"), ("ticket", "replica_1")]
+    assert django_router.db_for_write(Ticket) == "default"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/api/ticket/", "/api/async/ticket/"])
+def test_list_reads_from_replica_and_authenticates_on_primary(reads, staff_client, tickets, url):
+    assert staff_client.get(url).status_code == 200
+
+    assert aliases(reads, "ticket") == {"replica_1"}
+    assert aliases(reads, "token") == {"default"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/api/ticket/{}/", "/api/async/ticket/{}/"])
+def test_retrieve_reads_from_replica(reads, staff_client, tickets, url):
+    assert staff_client.get(url.format(tickets[0].id)).status_code == 200
+
+    assert aliases(reads, "ticket") == {"replica_1"}
+
+
+@pytest.mark.django_db
+def test_changes_read_from_primary(reads, staff_client, tickets):
+    assert staff_client.get("/api/ticket/changes/").status_code == 200
+
+    assert aliases(reads, "ticket") == {"default"}
+
+
+@pytest.mark.django_db
+def test_writes_read_from_primary(reads, user_client, tickets, hash_tag):
+    assert user_client.post("/api/ticket/", {"hash_tag": hash_tag.name, "question": "Routed?"}).status_code == 200
+    assert user_client.post("/api/ticket/close/", {"id": tickets[0].id}).status_code == 200
+
+    assert reads
+    assert {alias for _, alias in reads} == {"default"}
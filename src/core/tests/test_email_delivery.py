@@ -0,0 +1,56 @@
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from smtplib import SMTPDataError, SMTPSenderRefused
+
+import pytest
+
+from core.services.email import deliver_outbox, email_connection_pool
+from core.services.email.outbox import MemoryOutbox
+
+REJECTED = "rejected@example.com"
+DEFERRED = "deferred@example.com"
+
+
+class RejectingBackend(EmailBackend):
+    """
+    Rejects emails to REJECTED permanently and to DEFERRED temporarily, sends the rest to mail.outbox.
+    """
+
+    def send_messages(self, messages):
+        for message in messages:
+            if REJECTED in message.to:
+                raise SMTPDataError(554, b"Message rejected")
+            if DEFERRED in message.to:
+                raise SMTPSenderRefused(451, b"Try again later", message.from_email)
+        return super().send_messages(messages)
+
+
+@pytest.fixture
+def outbox(settings):
+    settings.EMAIL_BACKEND = "core.tests.test_email_delivery.RejectingBackend"
+    email_connection_pool.close()
+    yield MemoryOutbox()
+    email_connection_pool.close()
+
+
+def queue(outbox, *recipients):
+    for recipient in recipients:
+        outbox.push({"template": "reset_password", "recipients": [recipient], "context": {"token": "1"}})
+
+
+def test_permanently_rejected_email_is_dropped(outbox):
+    queue(outbox, "first@example.com", REJECTED, "second@example.com")
+
+    assert deliver_outbox(outbox, batch_size=2) == 2
+    assert [message.to for message in mail.outbox] == [["first@example.com"], ["second@example.com"]]
+    assert len(outbox) == 0
+
+
+def test_temporarily_rejected_email_is_returned_to_outbox(outbox):
+    queue(outbox, "first@example.com", DEFERRED, "second@example.com")
+
+    with pytest.raises(SMTPSenderRefused):
+        deliver_outbox(outbox, batch_size=2)
+
+    assert [message.to for message in mail.outbox] == [["first@example.com"]]
+    assert [message["recipients"] for message in outbox.pop_batch(10)] == [[DEFERRED], ["second@example.com"]]
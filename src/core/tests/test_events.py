@@ -0,0 +1,211 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from asgiref.testing import ApplicationCommunicator
+
+from core.services import issue_auth_token
+from core.services.events import (
+    TICKET_CREATED,
+    EventHub,
+    RedisEventBroker,
+    get_event_broker,
+)
+from rest_api.asgi import application
+
+URL = "/api/events/ticket/"
+
+
+def ticket_event(ticket_id, creator_id):
+    return {"type": TICKET_CREATED, "ticket": {"id": ticket_id, "creator": creator_id}}
+
+
+def stream_scope(token):
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": URL,
+        "raw_path": URL.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver"), (b"authorization", f"Token {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+
+async def open_stream(token):
+    stream = ApplicationCommunicator(application, stream_scope(token))
+    await stream.send_input({"type": "http.request", "body": b""})
+    start = await stream.receive_output(timeout=5)
+    assert start["status"] == 200
+    assert (await stream.receive_output(timeout=5))["body"] == b": connected\n\n"
+    return stream
+
+
+async def read_event(stream):
+    """
+    Returns:
+        Body of the next message that is not a heartbeat.
+    """
+    while True:
+        message = await stream.receive_output(timeout=5)
+        if message["body"] != b": heartbeat\n\n":
+            return message
+
+
+async def close_stream(stream):
+    await stream.send_input({"type": "http.disconnect"})
+    await stream.wait(timeout=5)
+
+
+def test_hub_filters_events_by_subscriber():
+    hub = EventHub()
+    staff = SimpleNamespace(id=1, is_staff=True)
+    user = SimpleNamespace(id=2, is_staff=False)
+
+    async def scenario():
+        staff_subscription = hub.subscribe(staff, 10)
+        user_subscription = hub.subscribe(user, 10)
+        # Events come from threads of sync views and of broker.
+        thread = threading.Thread(target=hub.dispatch, args=(ticket_event(1, 3),))
+        thread.start()
+        thread.join()
+        hub.dispatch(ticket_event(2, 2))
+        await asyncio.sleep(0.01)
+        return staff_subscription, user_subscription
+
+    staff_subscription, user_subscription = async_to_sync(scenario)()
+
+    assert [staff_subscription.queue.get_nowait()["ticket"]["id"] for _ in range(2)] == [1, 2]
+    assert user_subscription.queue.get_nowait()["ticket"]["id"] == 2
+    assert user_subscription.queue.empty()
+
+
+def test_slow_subscriber_overflows():
+    hub = EventHub()
+    user = SimpleNamespace(id=1, is_staff=False)
+
+    async def scenario():
+        subscription = hub.subscribe(user, 2)
+        for ticket_id in range(3):
+            hub.dispatch(ticket_event(ticket_id, user.id))
+        await asyncio.sleep(0.01)
+        return subscription
+
+    subscription = async_to_sync(scenario)()
+
+    assert subscription.overflowed
+    assert subscription.queue.qsize() == 2
+
+
+def test_redis_broker_fans_events_out_to_all_processes():
+    server = fakeredis.FakeServer()
+    hubs = [EventHub(), EventHub()]
+    brokers = [RedisEventBroker(fakeredis.FakeRedis(server=server), "test:events", hub) for hub in hubs]
+    user = SimpleNamespace(id=1, is_staff=True)
+
+    async def scenario():
+        subscriptions = [hub.subscribe(user, 100) for hub in hubs]
+        for broker in brokers:
+            broker.start()
+        # Listening threads subscribe in background, probe until both processes get events.
+        for subscription in subscriptions:
+            while subscription.queue.empty():
+                brokers[0].publish([ticket_event(0, user.id)])
+                await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        for subscription in subscriptions:
+            while not subscription.queue.empty():
+                subscription.queue.get_nowait()
+
+        brokers[1].publish([ticket_event(1, user.id)])
+        return [(await asyncio.wait_for(subscription.queue.get(), 5))["ticket"]["id"] for subscription in subscriptions]
+
+    assert async_to_sync(scenario)() == [1, 1]
+
+
+@pytest.mark.django_db
+def test_stream_sends_events_user_may_see(staff, user):
+    tokens = issue_auth_token(staff), issue_auth_token(user)
+
+    async def scenario():
+        staff_stream, user_stream = [await open_stream(token) for token in tokens]
+        get_event_broker().publish([ticket_event(1, staff.id), ticket_event(2, user.id)])
+        bodies = [await read_event(staff_stream) for _ in range(2)] + [await read_event(user_stream)]
+        for stream in (staff_stream, user_stream):
+            await close_stream(stream)
+        return [message["body"] for message in bodies]
+
+    assert async_to_sync(scenario)() == [
+        b'event: ticket.created\ndata: {"id":1,"creator":%d}\n\n' % staff.id,
+        b'event: ticket.created\ndata: {"id":2,"creator":%d}\n\n' % user.id,
+        b'event: ticket.created\ndata: {"id":2,"creator":%d}\n\n' % user.id,
+    ]
+
+
+@pytest.mark.django_db
+def test_created_ticket_is_streamed_after_commit(django_capture_on_commit_callbacks, user_client, user, hash_tag):
+    token = user.auth_token.key
+
+    def create_ticket():
+        with django_capture_on_commit_callbacks(execute=True):
+            response = user_client.post("/api/ticket/", {"hash_tag": hash_tag.name, "question": "Streamed?"})
+        return response.json()["id"]
+
+    async def scenario():
+        stream = await open_stream(token)
+        ticket_id = await sync_to_async(create_ticket)()
+        message = await read_event(stream)
+        await close_stream(stream)
+        return ticket_id, message["body"]
+
+    ticket_id, body = async_to_sync(scenario)()
+
+    assert body.startswith(b'event: ticket.created\ndata: {"id":%d,' % ticket_id)
+
+
+@pytest.mark.django_db
+def test_stream_sends_heartbeats(settings, user):
+    settings.EVENTS_HEARTBEAT = 0.05
+    token = issue_auth_token(user)
+
+    async def scenario():
+        stream = await open_stream(token)
+        message = await stream.receive_output(timeout=5)
+        await close_stream(stream)
+        return message
+
+    assert async_to_sync(scenario)() == {"type": "http.response.body", "body": b": heartbeat\n\n", "more_body": True}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("change", [{"is_staff": False}, {"is_active": False}])
+def test_stream_ends_when_user_changes(django_capture_on_commit_callbacks, settings, staff, change):
+    settings.EVENTS_HEARTBEAT = 0.05
+    token = issue_auth_token(staff)
+
+    def change_staff():
+        with django_capture_on_commit_callbacks(execute=True):
+            for field, value in change.items():
+                setattr(staff, field, value)
+            staff.save()
+
+    async def read_until_end(stream):
+        while (await stream.receive_output(timeout=5)).get("more_body"):
+            pass
+
+    async def scenario():
+        stream = await open_stream(token)
+        await sync_to_async(change_staff)()
+        # Heartbeats go on forever if stream is not closed.
+        await asyncio.wait_for(read_until_end(stream), 2)
+        await stream.wait(timeout=5)
+
+    async_to_sync(scenario)()
@@ -0,0 +1,51 @@
+import pytest
+
+from core.benchmarks.factories import HashTagFactory
+from core.services import hash_tag_catalog
+
+
+def forget_local_copy():
+    # Another process has no in-process copy and reads the shared one.
+    hash_tag_catalog.cache.local.clear()
+
+
+@pytest.mark.django_db
+def test_catalog_is_reloaded_after_change(django_capture_on_commit_callbacks, hash_tag):
+    assert hash_tag_catalog.get_by_name(hash_tag.name) == hash_tag
+
+    with django_capture_on_commit_callbacks(execute=True):
+        new = HashTagFactory()
+    forget_local_copy()
+
+    assert hash_tag_catalog.get_by_name(new.name) == new
+
+
+@pytest.mark.django_db
+def test_catalog_loaded_before_change_is_not_served_after_it(monkeypatch, django_capture_on_commit_callbacks, hash_tag):
+    load = hash_tag_catalog._load
+    created = []
+
+    def load_then_change(version):
+        catalog = load(version)
+        # Another request commits a new HashTag after rows were read and before the catalog is cached.
+        with django_capture_on_commit_callbacks(execute=True):
+            created.append(HashTagFactory())
+        return catalog
+
+    monkeypatch.setattr(hash_tag_catalog, "_load", load_then_change)
+    assert [tag.name for tag in hash_tag_catalog.all()] == [hash_tag.name]
+    monkeypatch.setattr(hash_tag_catalog, "_load", load)
+    forget_local_copy()
+
+    assert [tag.name for tag in hash_tag_catalog.all()] == [hash_tag.name, created[0].name]
+
+
+@pytest.mark.django_db
+def test_deleted_hash_tag_leaves_catalog(django_capture_on_commit_callbacks, hash_tag):
+    assert hash_tag_catalog.get_by_id(hash_tag.id) == hash_tag
+
+    with django_capture_on_commit_callbacks(execute=True):
+        hash_tag.delete()
+    forget_local_copy()
+
+    assert hash_tag_catalog.all() == ()
@@ -0,0 +1,50 @@
+import time
+
+import fakeredis
+import pytest
+
+from core.metrics.registry import MetricsRegistry
+from core.metrics.stores import RedisMetricsStore
+
+REQUESTS_TOTAL = 'qna_http_requests_total{view="ticket-list",method="GET",status="200"}'
+
+
+def redis_store(server, flush_interval):
+    return RedisMetricsStore(fakeredis.FakeRedis(server=server), MetricsRegistry(), "test:metrics", flush_interval)
+
+
+def test_record_does_not_call_redis():
+    server = fakeredis.FakeServer()
+    store = redis_store(server, 60)
+
+    for _ in range(3):
+        store.record("ticket-list", "GET", 200, 0.01, 100)
+
+    assert not store.client.exists(store.key)
+    server.connected = False
+    assert f"{REQUESTS_TOTAL} 3" in store.render()
+
+
+def test_metrics_are_flushed_in_background():
+    server = fakeredis.FakeServer()
+    store = redis_store(server, 0.05)
+
+    store.record("ticket-list", "GET", 200, 0.01, 100)
+    store.record("ticket-list", "GET", 200, 0.01, 100)
+    deadline = time.monotonic() + 5
+    while not store.client.exists(store.key) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Another process renders metrics flushed by this one.
+    assert f"{REQUESTS_TOTAL} 2" in redis_store(server, 60).render()
+    assert store._thread.name == "metrics-flush"
+
+
+@pytest.mark.django_db
+def test_server_timing_is_off_by_default(settings, staff_client, tickets):
+    settings.METRICS_SAMPLE_RATE = 1
+
+    assert "Server-Timing" not in staff_client.get("/api/ticket/")
+
+    settings.METRICS_SERVER_TIMING = True
+    assert staff_client.get("/api/ticket/")["Server-Timing"].startswith("app;dur=")
@@ -0,0 +1,47 @@
+from base64 import urlsafe_b64encode
+
+import pytest
+
+from core.pagination.cursor import MAX_ID, IdCursorPagination
+
+
+def cursor(value):
+    return urlsafe_b64encode(str(value).encode("ascii")).decode("ascii").rstrip("=")
+
+
+@pytest.mark.django_db
+def test_pages_follow_next_cursor(user_client, tickets):
+    first = user_client.get("/api/ticket/", {"page_size": 3}).json()
+    second = user_client.get(first["next"]).json()
+
+    ids = [ticket["id"] for ticket in first["results"] + second["results"]]
+    assert ids == sorted(ticket.id for ticket in tickets)
+    assert second["next"] is None
+
+
+@pytest.mark.django_db
+def test_total_is_counted_only_when_asked(user_client, tickets):
+    assert "total" not in user_client.get("/api/ticket/").json()
+    assert user_client.get("/api/ticket/", {"total": "true"}).json()["total"] == len(tickets)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/api/ticket/", "/api/async/ticket/"])
+@pytest.mark.parametrize("value", ["not-a-number", 0, -1, MAX_ID + 1, 10**30])
+def test_invalid_cursor_is_not_found(staff_client, tickets, url, value):
+    assert staff_client.get(url, {"cursor": cursor(value)}).status_code == 404
+
+
+@pytest.mark.django_db
+def test_max_id_cursor_gives_empty_page(staff_client, tickets):
+    response = staff_client.get("/api/ticket/", {"cursor": cursor(MAX_ID)})
+
+    assert response.status_code == 200
+    assert response.json()["results"] == []
+
+
+def test_encoded_cursor_is_decoded(rf):
+    request = rf.get("/", {"cursor": IdCursorPagination.encode_cursor(42)})
+    request.query_params = request.GET
+
+    assert IdCursorPagination().decode_cursor(request) == 42
@@ -0,0 +1,48 @@
+import os
+import signal
+
+import pytest
+
+from core.benchmarks.factories import BENCHMARK_PASSWORD
+from core.services import check_user_password, hash_password
+from core.services.passwords import get_hashing_executor, passwords
+
+
+@pytest.fixture
+def hashing_pool(settings):
+    settings.PASSWORD_HASHING_POOL_SIZE = 1
+    yield
+    executor = passwords._executor
+    passwords._executor = None
+    if executor is not None:
+        executor.shutdown()
+
+
+def kill_workers(executor):
+    # Worker is started with the first task.
+    executor.submit(abs, 1).result()
+    for pid in list(executor._processes):
+        os.kill(pid, signal.SIGKILL)
+
+
+@pytest.mark.django_db
+def test_pool_checks_password(hashing_pool, user):
+    assert check_user_password(user, BENCHMARK_PASSWORD)
+    assert not check_user_password(user, "Wrong-password-2021")
+
+
+@pytest.mark.django_db
+def test_broken_pool_is_replaced_on_check(hashing_pool, user):
+    broken = get_hashing_executor()
+    kill_workers(broken)
+
+    assert check_user_password(user, BENCHMARK_PASSWORD)
+    assert get_hashing_executor() is not broken
+
+
+def test_broken_pool_is_replaced_on_hash(hashing_pool):
+    broken = get_hashing_executor()
+    kill_workers(broken)
+
+    assert hash_password(BENCHMARK_PASSWORD).startswith("scrypt$")
+    assert get_hashing_executor() is not broken
@@ -0,0 +1,57 @@
+from django.contrib.auth.signals import user_login_failed
+
+import pytest
+
+from core.benchmarks.factories import BENCHMARK_PASSWORD
+
+SIGN_IN_URL = "/api/auth/sign_in/"
+
+
+@pytest.mark.django_db
+def test_sign_in_with_any_email_case(api_client, user):
+    response = api_client.post(SIGN_IN_URL, {"email": user.email.upper(), "password": BENCHMARK_PASSWORD})
+
+    assert response.status_code == 200
+    assert response.json()["id"] == user.id
+    assert response.json()["token"]
+
+
+@pytest.mark.django_db
+def test_wrong_password_sends_login_failed_signal(api_client, user):
+    failed = []
+
+    def receiver(sender, credentials, **kwargs):
+        failed.append(credentials)
+
+    user_login_failed.connect(receiver)
+    try:
+        response = api_client.post(SIGN_IN_URL, {"email": user.email, "password": "Wrong-password-2021"})
+    finally:
+        user_login_failed.disconnect(receiver)
+
+    assert response.status_code == 400
+    assert failed == [{"email": user.email, "password": "********************"}]
+
+
+@pytest.mark.django_db
+def test_inactive_user_can_not_sign_in(api_client, user):
+    user.is_active = False
+    user.save()
+
+    assert api_client.post(SIGN_IN_URL, {"email": user.email, "password": BENCHMARK_PASSWORD}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_authentication_backends_setting_is_used(settings, api_client, user):
+    settings.AUTHENTICATION_BACKENDS = ["django.contrib.auth.backends.AllowAllUsersModelBackend"]
+    user.is_active = False
+    user.save()
+
+    assert api_client.post(SIGN_IN_URL, {"email": user.email, "password": BENCHMARK_PASSWORD}).status_code == 200
+
+
+@pytest.mark.django_db
+def test_unknown_email_is_rejected(api_client, user):
+    assert (
+        api_client.post(SIGN_IN_URL, {"email": "nobody@example.com", "password": BENCHMARK_PASSWORD}).status_code == 400
+    )
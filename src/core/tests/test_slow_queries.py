@@ -0,0 +1,41 @@
+from django.db import connection
+
+import pytest
+
+from core.db import slow_queries
+from core.models import Ticket
+
+
+@pytest.fixture
+def submitted(settings, monkeypatch):
+    """
+    Collects every query as slow.
+    Returns:
+        List of submit arguments.
+    """
+    settings.SLOW_QUERY_THRESHOLD = 0
+    calls = []
+    monkeypatch.setattr(slow_queries.slow_query_log, "submit", lambda *args: calls.append(args))
+    return calls
+
+
+@pytest.mark.django_db
+def test_example_has_quoted_parameters(submitted):
+    with connection.execute_wrapper(slow_queries.log_slow_query):
+        list(Ticket.objects.filter(question="It's slow", id__in=[1, 2]))
+
+    alias, sql, params, many, duration, example = submitted[-1]
+    assert (alias, many) == ("default", False)
+    assert "%s" in sql and "%s" not in example
+    assert "'It''s slow'" in example
+    assert "IN (1, 2)" in example
+
+
+@pytest.mark.django_db
+def test_example_of_executemany_keeps_placeholders(submitted):
+    with connection.execute_wrapper(slow_queries.log_slow_query), connection.cursor() as cursor:
+        cursor.executemany("UPDATE core_ticket SET question = %s WHERE id = %s", [("First", 1), ("Second", 2)])
+
+    *_, many, _, example = submitted[-1]
+    assert many
+    assert example == "UPDATE core_ticket SET question = %s WHERE id = %s"
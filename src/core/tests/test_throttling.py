@@ -0,0 +1,97 @@
+import fakeredis
+import pytest
+
+from core.benchmarks.factories import BENCHMARK_PASSWORD
+from core.throttling import MemoryThrottleStore, RedisThrottleStore, throttles
+
+SIGN_IN_URL = "/api/auth/sign_in/"
+FORGOT_PASSWORD_URL = "/api/auth/forgot_password/"
+
+
+@pytest.fixture(params=["memory", "redis"])
+def throttle_store(request, monkeypatch):
+    """
+    Every test runs with in-process counters and with Lua script of Redis store.
+    """
+    if request.param == "memory":
+        store = MemoryThrottleStore()
+    else:
+        store = RedisThrottleStore(fakeredis.FakeRedis(server=fakeredis.FakeServer()), MemoryThrottleStore())
+    monkeypatch.setattr(throttles, "get_throttle_store", lambda: store)
+    yield store
+    if request.param == "redis":
+        # Requests were counted by the script, not by in-process fallback.
+        assert store.client.keys("throttle:*")
+        assert not store.fallback._counters
+
+
+@pytest.fixture
+def rates(monkeypatch):
+    # Throttles read rates from settings once, on import.
+    rates = dict(throttles.SlidingWindowRateThrottle.THROTTLE_RATES, sign_in="3/min", forgot_password_email="2/hour")
+    monkeypatch.setattr(throttles.SlidingWindowRateThrottle, "THROTTLE_RATES", rates)
+    return rates
+
+
+@pytest.mark.django_db
+def test_sign_in_is_limited_per_client(throttle_store, rates, api_client, user):
+    data = {"email": user.email, "password": BENCHMARK_PASSWORD}
+
+    statuses = [api_client.post(SIGN_IN_URL, data).status_code for _ in range(4)]
+
+    assert statuses == [200, 200, 200, 429]
+    assert api_client.post(SIGN_IN_URL, data, REMOTE_ADDR="10.0.0.2").status_code == 200
+
+
+@pytest.mark.django_db
+def test_rotating_forwarded_for_does_not_bypass_limit(throttle_store, rates, api_client, user):
+    data = {"email": user.email, "password": BENCHMARK_PASSWORD}
+
+    statuses = [
+        api_client.post(SIGN_IN_URL, data, HTTP_X_FORWARDED_FOR=f"10.1.0.{index}").status_code for index in range(4)
+    ]
+
+    assert statuses == [200, 200, 200, 429]
+
+
+@pytest.mark.django_db
+def test_client_behind_trusted_proxy_is_identified_by_forwarded_for(throttle_store, rates, settings, api_client, user):
+    settings.REST_FRAMEWORK = dict(settings.REST_FRAMEWORK, NUM_PROXIES=1)
+    data = {"email": user.email, "password": BENCHMARK_PASSWORD}
+
+    statuses = [
+        api_client.post(SIGN_IN_URL, data, HTTP_X_FORWARDED_FOR="10.1.0.1, 10.2.0.1").status_code for _ in range(4)
+    ]
+
+    assert statuses == [200, 200, 200, 429]
+    assert api_client.post(SIGN_IN_URL, data, HTTP_X_FORWARDED_FOR="10.1.0.1, 10.2.0.2").status_code == 200
+
+
+@pytest.mark.django_db
+def test_forgot_password_is_limited_per_email(throttle_store, rates, api_client, user):
+    # Every request comes from another client, per client limit does not apply.
+    statuses = [
+        api_client.post(FORGOT_PASSWORD_URL, {"email": email}, REMOTE_ADDR=f"10.1.0.{index}").status_code
+        for index, email in enumerate([user.email, user.email.upper(), f" {user.email} "])
+    ]
+
+    assert statuses == [200, 200, 429]
+
+
+def test_redis_store_falls_back_to_process_counters():
+    server = fakeredis.FakeServer()
+    store = RedisThrottleStore(fakeredis.FakeRedis(server=server), MemoryThrottleStore())
+    server.connected = False
+
+    assert [store.hit("client", 2, 60)[0] for _ in range(3)] == [True, True, False]
+
+
+@pytest.mark.django_db
+def test_async_endpoints_count_toward_user_limit(throttle_store, rates, user_client):
+    rates["user"] = "2/min"
+
+    responses = [user_client.get(url) for url in ("/api/async/ticket/", "/api/ticket/", "/api/async/ticket/")]
+
+    assert [response.status_code for response in responses] == [200, 200, 429]
+    assert int(responses[-1]["Retry-After"]) > 0
+    assert "detail" in responses[-1].json()
@@ -0,0 +1,63 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from core.benchmarks.factories import TicketFactory
+from core.models import Ticket
+from core.pagination.cursor import MAX_ID
+from core.services import bulk_create_tickets, ticket_versions
+
+
+def items(hash_tag, count):
+    return [{"hash_tag": hash_tag.name, "question": f"Bulk question {index}"} for index in range(count)]
+
+
+@pytest.mark.django_db
+def test_created_tickets_get_their_ids(user, hash_tag):
+    # Rows of another creator before the batch must not be taken for its ids.
+    TicketFactory.create_batch(3, hash_tag=hash_tag)
+
+    tickets, results = bulk_create_tickets(user, items(hash_tag, 5) + [{"hash_tag": "missing", "question": "?"}])
+
+    assert [result["status"] for result in results] == ["created"] * 5 + ["error"]
+    stored = dict(Ticket.objects.filter(creator=user).values_list("id", "question"))
+    assert {ticket.id: ticket.question for ticket in tickets} == stored
+    assert [ticket.question for ticket in tickets] == [f"Bulk question {index}" for index in range(5)]
+
+
+@pytest.mark.django_db
+def test_insert_count_does_not_depend_on_batch_size(user, hash_tag):
+    inserts = []
+    for count in (2, 20):
+        with CaptureQueriesContext(connection) as queries:
+            bulk_create_tickets(user, items(hash_tag, count))
+        inserts.append(sum(query["sql"].startswith("INSERT") for query in queries))
+
+    assert inserts == [1, 1]
+
+
+@pytest.mark.django_db
+def test_version_is_bumped_once(django_capture_on_commit_callbacks, user, hash_tag):
+    before = ticket_versions.get().number
+
+    with django_capture_on_commit_callbacks(execute=True):
+        bulk_create_tickets(user, items(hash_tag, 3))
+
+    assert ticket_versions.get().number == before + 1
+
+
+@pytest.mark.django_db
+def test_bulk_create_endpoint_returns_created_tickets(user_client, user, hash_tag):
+    response = user_client.post("/api/ticket/bulk_create/", {"tickets": items(hash_tag, 3)}, format="json")
+
+    assert response.status_code == 200
+    assert [ticket["id"] for ticket in response.json()["tickets"]] == list(
+        Ticket.objects.filter(creator=user).order_by("id").values_list("id", flat=True)
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ticket_id", [0, MAX_ID + 1, 10**20])
+def test_bulk_close_id_out_of_range_is_bad_request(user_client, ticket_id):
+    assert user_client.post("/api/ticket/bulk_close/", {"ids": [ticket_id]}, format="json").status_code == 400
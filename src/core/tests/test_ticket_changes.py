@@ -0,0 +1,124 @@
+import datetime
+from base64 import urlsafe_b64encode
+from django.utils import timezone
+
+import pytest
+
+from core.models import Ticket
+from core.services.tickets import (
+    decode_sync_token,
+    encode_sync_token,
+    restamp_late_changes,
+)
+
+URL = "/api/ticket/changes/"
+
+
+def raw_token(text):
+    return urlsafe_b64encode(text.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def age(tickets, seconds):
+    """
+    Moves updated_at of Tickets into the past, one microsecond apart in the given order.
+    """
+    start = timezone.now() - datetime.timedelta(seconds=seconds)
+    for index, ticket in enumerate(tickets):
+        Ticket.objects.filter(id=ticket.id).update(updated_at=start + datetime.timedelta(microseconds=index))
+
+
+def sync(client, since=None, page_size=2):
+    """
+    Reads all available changes page by page.
+    Returns:
+        Tuple with list of changed Ticket ids and the last sync token.
+    """
+    ids = []
+    while True:
+        data = client.get(URL, {"page_size": page_size, **({"since": since} if since else {})}).json()
+        ids += [ticket["id"] for ticket in data["results"]]
+        since = data["sync_token"]
+        if not data["has_more"]:
+            return ids, since
+
+
+def test_sync_token_round_trip():
+    updated_at = datetime.datetime(2021, 6, 14, 20, 52, 1, 123456, tzinfo=datetime.timezone.utc)
+
+    assert decode_sync_token(encode_sync_token(updated_at, 42)) == (updated_at, 42)
+
+
+@pytest.mark.parametrize("token", ["", "not a token", raw_token("1.0"), raw_token("1.-5"), raw_token(f"1.{2**63}")])
+def test_invalid_sync_token_is_rejected(token):
+    with pytest.raises(ValueError):
+        decode_sync_token(token)
+
+
+@pytest.mark.django_db
+def test_invalid_sync_token_is_bad_request(staff_client):
+    assert staff_client.get(URL, {"since": raw_token(f"1.{2**63}")}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_changes_are_ordered_by_change_time(staff_client, tickets):
+    changed = [tickets[3], tickets[0], tickets[4], tickets[1], tickets[2]]
+    age(changed, 10)
+
+    ids, since = sync(staff_client)
+
+    assert ids == [ticket.id for ticket in changed]
+    assert sync(staff_client, since) == ([], since)
+
+
+@pytest.mark.django_db
+def test_closed_ticket_comes_again_archived(staff_client, tickets):
+    age(tickets, 10)
+    _, since = sync(staff_client)
+
+    assert staff_client.post("/api/ticket/close/", {"id": tickets[2].id}).status_code == 200
+    age([tickets[2]], 5)
+    data = staff_client.get(URL, {"since": since}).json()
+
+    assert [(ticket["id"], ticket["is_archived"]) for ticket in data["results"]] == [(tickets[2].id, True)]
+
+
+@pytest.mark.django_db
+def test_recent_changes_are_held_back(settings, staff_client, tickets):
+    settings.TICKET_CHANGES_LAG = 5
+    age(tickets[:2], 10)
+    age(tickets[2:], 1)
+
+    ids, since = sync(staff_client)
+    assert ids == [ticket.id for ticket in tickets[:2]]
+
+    settings.TICKET_CHANGES_LAG = 0.5
+    assert sync(staff_client, since)[0] == [ticket.id for ticket in tickets[2:]]
+
+
+@pytest.mark.django_db
+def test_ticket_of_late_transaction_is_restamped(django_capture_on_commit_callbacks, settings, tickets):
+    settings.TICKET_CHANGES_LAG = 1
+    age(tickets, 10)
+    written_at = timezone.now() - datetime.timedelta(seconds=10)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        restamp_late_changes([tickets[0].id], written_at)
+        restamp_late_changes([tickets[1].id], timezone.now())
+
+    updated_at = dict(Ticket.objects.values_list("id", "updated_at"))
+    assert updated_at[tickets[0].id] > timezone.now() - datetime.timedelta(seconds=1)
+    assert updated_at[tickets[1].id] < written_at
+
+
+@pytest.mark.django_db
+def test_saved_ticket_is_restamped_after_slow_transaction(django_capture_on_commit_callbacks, settings, tickets):
+    settings.TICKET_CHANGES_LAG = 0
+    ticket = tickets[0]
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        ticket.question = "Changed question"
+        ticket.save()
+        saved_at = ticket.updated_at
+
+    assert len(callbacks) == 2
+    assert Ticket.objects.get(id=ticket.id).updated_at > saved_at
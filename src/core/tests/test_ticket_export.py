@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+
+from core.benchmarks.factories import TicketFactory
+from core.services import issue_auth_token
+from rest_api.asgi import application
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(settings):
+    settings.TICKET_EXPORT_CHUNK_SIZE = 2
+
+
+async def asgi_get(path, query_string, token):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"testserver"), (b"authorization", f"Token {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    communicator = ApplicationCommunicator(application, scope)
+    await communicator.send_input({"type": "http.request", "body": b""})
+    start = await communicator.receive_output(timeout=5)
+    parts = []
+    while True:
+        message = await communicator.receive_output(timeout=5)
+        parts.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    await communicator.wait(timeout=5)
+    return start, parts
+
+
+def exported_ids(tickets):
+    return [ticket.id for ticket in sorted(tickets, key=lambda ticket: ticket.id)]
+
+
+@pytest.mark.django_db
+def test_export_json(staff_client, tickets):
+    response = staff_client.get("/api/ticket/export/")
+
+    assert response.status_code == 200
+    assert [ticket["id"] for ticket in json.loads(b"".join(response.streaming_content))] == exported_ids(tickets)
+
+
+@pytest.mark.django_db
+def test_export_ndjson(staff_client, tickets):
+    response = staff_client.get("/api/ticket/export/", {"export_format": "ndjson"})
+
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == exported_ids(tickets)
+
+
+@pytest.mark.django_db
+def test_export_csv(staff_client, tickets):
+    response = staff_client.get("/api/ticket/export/", {"export_format": "csv"})
+
+    rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert [int(row["id"]) for row in rows] == exported_ids(tickets)
+    assert {row["is_archived"] for row in rows} == {"false"}
+
+
+@pytest.mark.django_db
+def test_export_of_user_has_only_own_tickets(user_client, tickets, hash_tag):
+    TicketFactory.create_batch(2, hash_tag=hash_tag)
+
+    response = user_client.get("/api/ticket/export/")
+
+    assert [ticket["id"] for ticket in json.loads(b"".join(response.streaming_content))] == exported_ids(tickets)
+
+
+@pytest.mark.django_db
+def test_export_under_asgi_reads_chunks_in_thread(staff, tickets):
+    start, parts = async_to_sync(asgi_get)("/api/ticket/export/", "export_format=ndjson", issue_auth_token(staff))
+
+    assert start["status"] == 200
+    assert (b"Content-Type", b"application/x-ndjson") in start["headers"]
+    # One part per chunk of two Tickets, then closing message.
+    assert len(parts) == 4
+    assert [json.loads(line)["id"] for line in b"".join(parts).decode().splitlines()] == exported_ids(tickets)
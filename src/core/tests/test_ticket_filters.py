@@ -0,0 +1,46 @@
+import pytest
+
+from core.benchmarks.factories import HashTagFactory, TicketFactory
+from core.pagination.cursor import MAX_ID
+
+
+@pytest.fixture
+def mixed_tickets(user, hash_tag):
+    other = HashTagFactory()
+    return {
+        "open": TicketFactory(creator=user, hash_tag=hash_tag, is_archived=False),
+        "archived": TicketFactory(creator=user, hash_tag=hash_tag, is_archived=True),
+        "other": TicketFactory(creator=user, hash_tag=other, is_archived=False),
+    }
+
+
+def listed(client, **params):
+    response = client.get("/api/ticket/", params)
+    assert response.status_code == 200
+    return {ticket["id"] for ticket in response.json()["results"]}
+
+
+@pytest.mark.django_db
+def test_without_filters_lists_all_tickets(user_client, mixed_tickets):
+    assert listed(user_client) == {ticket.id for ticket in mixed_tickets.values()}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("value, expected", [("true", {"archived"}), ("false", {"open", "other"})])
+def test_is_archived_filter(user_client, mixed_tickets, value, expected):
+    assert listed(user_client, is_archived=value) == {mixed_tickets[name].id for name in expected}
+
+
+@pytest.mark.django_db
+def test_hash_tag_filter(user_client, mixed_tickets, hash_tag):
+    expected = {mixed_tickets["open"].id, mixed_tickets["archived"].id}
+
+    assert listed(user_client, hash_tag=hash_tag.name) == expected
+    assert listed(user_client, filter=hash_tag.name) == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", ["creator", "min_id", "max_id"])
+@pytest.mark.parametrize("value", [0, MAX_ID + 1, 10**20])
+def test_id_filter_out_of_range_is_bad_request(user_client, mixed_tickets, name, value):
+    assert user_client.get("/api/ticket/", {name: value}).status_code == 400
@@ -0,0 +1,47 @@
+import pytest
+
+from core.benchmarks.factories import TicketFactory
+from core.models import Ticket
+from core.serializers import TicketSerializer
+
+
+@pytest.fixture(params=[1, 20], ids=["1-ticket", "20-tickets"])
+def read_tickets(request, user, hash_tag):
+    return TicketFactory.create_batch(request.param, creator=user, hash_tag=hash_tag, is_archived=False)
+
+
+def get_warm(client, url):
+    # The first request caches the token, queries of later requests do not depend on authentication.
+    client.get(url)
+    return url
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/api/ticket/", "/api/async/ticket/", "/api/ticket/search/?q=question"])
+def test_list_is_one_query(django_assert_num_queries, user_client, read_tickets, url):
+    get_warm(user_client, url)
+    with django_assert_num_queries(1):
+        response = user_client.get(url)
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == len(read_tickets)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("prefix", ["/api/ticket/", "/api/async/ticket/"])
+def test_retrieve_is_one_query(django_assert_num_queries, user_client, read_tickets, prefix):
+    ticket = read_tickets[-1]
+    url = get_warm(user_client, f"{prefix}{ticket.id}/")
+    with django_assert_num_queries(1):
+        response = user_client.get(url)
+
+    assert response.status_code == 200
+    assert response.json()["hash_tag"] == ticket.hash_tag.name
+
+
+@pytest.mark.django_db
+def test_serializer_over_for_read_is_one_query(django_assert_num_queries, read_tickets):
+    with django_assert_num_queries(1):
+        data = TicketSerializer(Ticket.objects.for_read(), many=True).data
+
+    assert [ticket["id"] for ticket in data] == [ticket.id for ticket in read_tickets]
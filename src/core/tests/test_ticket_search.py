@@ -0,0 +1,101 @@
+from django.db import connection
+
+import pytest
+
+from core.benchmarks.factories import TicketFactory
+from core.models import Ticket
+
+URL = "/api/ticket/search/"
+BASE_BACKEND = "core.search.backends.BaseSearchBackend"
+
+
+@pytest.fixture
+def questions(user, hash_tag):
+    """
+    Returns:
+        Dict with Tickets by short name, created in the order of names.
+    """
+    texts = {
+        "often": "Password, password and password again",
+        "once": "How do I reset my password?",
+        "other": "Where are hashtags listed?",
+        "accented": "Café opening hours",
+    }
+    return {
+        name: TicketFactory(creator=user, hash_tag=hash_tag, question=text, is_archived=False)
+        for name, text in texts.items()
+    }
+
+
+@pytest.fixture(params=["index", "icontains"])
+def search_backend(request, settings):
+    """
+    Every test runs with index of test database and with icontains fallback of databases without index.
+    """
+    if request.param == "index" and connection.vendor not in ("sqlite", "postgresql"):
+        pytest.skip("Test database has no search index.")
+    if request.param == "icontains":
+        settings.TICKET_SEARCH_BACKEND = BASE_BACKEND
+    return request.param
+
+
+def found(client, q, **params):
+    response = client.get(URL, {"q": q, **params})
+    assert response.status_code == 200
+    return [ticket["id"] for ticket in response.json()["results"]]
+
+
+def ids(questions, *names):
+    return [questions[name].id for name in names]
+
+
+@pytest.mark.django_db
+def test_search_ranks_matches(search_backend, user_client, questions):
+    # Index ranks by relevance, fallback puts the newest Ticket first.
+    expected = ("often", "once") if search_backend == "index" else ("once", "often")
+
+    assert found(user_client, "password") == ids(questions, *expected)
+    assert found(user_client, "reset PASSWORD") == ids(questions, "once")
+    assert found(user_client, "password hashtags") == []
+
+
+@pytest.mark.django_db
+def test_search_without_words_finds_nothing(search_backend, user_client, questions):
+    assert found(user_client, "?!") == []
+
+
+@pytest.mark.django_db
+def test_user_finds_own_tickets_only(search_backend, staff_client, staff, user_client, questions, hash_tag):
+    staff_ticket = TicketFactory(creator=staff, hash_tag=hash_tag, question="Staff password question")
+
+    assert staff_ticket.id not in found(user_client, "password")
+    assert staff_ticket.id in found(staff_client, "password")
+
+
+@pytest.mark.django_db
+def test_search_applies_list_filters(search_backend, user_client, questions):
+    assert user_client.post("/api/ticket/close/", {"id": questions["once"].id}).status_code == 200
+
+    assert found(user_client, "password", is_archived="false") == ids(questions, "often")
+    assert found(user_client, "password", is_archived="true") == ids(questions, "once")
+
+
+@pytest.mark.django_db
+def test_changed_question_is_indexed_again(search_backend, user_client, questions):
+    ticket = questions["other"]
+    ticket.question = "Password of hashtags"
+    ticket.save()
+    Ticket.objects.filter(id=questions["once"].id).update(question="Nothing to see")
+    questions["often"].delete()
+
+    assert found(user_client, "password") == ids(questions, "other")
+    assert found(user_client, "listed") == []
+    assert found(user_client, "nothing") == ids(questions, "once")
+
+
+@pytest.mark.django_db
+def test_index_ignores_diacritics(user_client, questions):
+    if connection.vendor != "sqlite":
+        pytest.skip("Only SQLite index removes diacritics.")
+
+    assert found(user_client, "cafe") == ids(questions, "accented")
@@ -0,0 +1,125 @@
+import time
+
+import fakeredis
+import pytest
+
+from core.services import ticket_versions
+from core.services.versions import RedisVersionStore, collection
+
+LIST_URLS = ["/api/ticket/", "/api/async/ticket/"]
+
+
+@pytest.fixture
+def redis_server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def process_store(monkeypatch, redis_server):
+    """
+    Version store of the current process, other processes connect to the same server with their own clients.
+    """
+    store = RedisVersionStore(fakeredis.FakeRedis(server=redis_server))
+    monkeypatch.setattr(collection, "get_version_store", lambda: store)
+    return store
+
+
+def revalidate(client, url):
+    etag = client.get(url)["ETag"]
+    return client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", LIST_URLS)
+def test_not_modified_list_is_answered_with_304(staff_client, tickets, url):
+    assert revalidate(staff_client, url).status_code == 304
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", LIST_URLS)
+def test_list_is_sent_again_after_write(django_capture_on_commit_callbacks, staff_client, tickets, url):
+    etag = staff_client.get(url)["ETag"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tickets[0].question = "Changed question"
+        tickets[0].save()
+
+    response = staff_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", LIST_URLS)
+def test_write_in_another_process_is_seen(process_store, redis_server, staff_client, tickets, url):
+    response = revalidate(staff_client, url)
+    assert response.status_code == 304
+
+    RedisVersionStore(fakeredis.FakeRedis(server=redis_server)).increment(ticket_versions.name)
+
+    assert staff_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", LIST_URLS)
+def test_no_validators_without_version_store(process_store, redis_server, staff_client, tickets, url):
+    redis_server.connected = False
+
+    response = staff_client.get(url)
+
+    assert response.status_code == 200
+    assert not response.has_header("ETag")
+    assert not response.has_header("Last-Modified")
+
+
+def test_redis_counter_is_seeded_and_incremented(redis_server):
+    store = RedisVersionStore(fakeredis.FakeRedis(server=redis_server))
+    other_process = RedisVersionStore(fakeredis.FakeRedis(server=redis_server))
+
+    seeded = store.get("collection")
+    other_process.increment("collection")
+
+    version = store.get("collection")
+    assert version.number == seeded.number + 1
+    assert version.modified_at >= seeded.modified_at
+
+
+def test_lost_redis_counter_does_not_repeat_numbers(redis_server):
+    client = fakeredis.FakeRedis(server=redis_server)
+    store = RedisVersionStore(client)
+    store.increment("collection")
+    lost = store.get("collection")
+
+    client.flushall()
+    store.increment("collection")
+
+    assert store.get("collection").number > lost.number
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", LIST_URLS)
+def test_copy_read_while_replicas_lag_is_not_revalidated_after(
+    django_capture_on_commit_callbacks, settings, staff_client, tickets, url
+):
+    settings.DATABASE_REPLICA_LAG = 0.5
+    with django_capture_on_commit_callbacks(execute=True):
+        tickets[0].save()
+
+    response = revalidate(staff_client, url)
+    assert response.status_code == 304
+    assert not response.has_header("Last-Modified")
+    time.sleep(0.5)
+
+    assert staff_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 200
+    assert revalidate(staff_client, url).status_code == 304
+
+
+def test_settle_time_is_kept_with_redis_counter(redis_server):
+    store = RedisVersionStore(fakeredis.FakeRedis(server=redis_server))
+    other_process = RedisVersionStore(fakeredis.FakeRedis(server=redis_server))
+
+    store.increment("collection", settle_after=0.1)
+
+    assert not other_process.get("collection").settled
+    time.sleep(0.1)
+    assert other_process.get("collection").settled
@@ -0,0 +1,21 @@
+__all__ = [
+    "ActionSlidingWindowThrottle",
+    "FieldSlidingWindowThrottle",
+    "MemoryThrottleStore",
+    "RedisThrottleStore",
+    "SlidingWindowRateThrottle",
+    "UserSlidingWindowThrottle",
+    "get_throttle_store",
+]
+
+from core.throttling.stores import (
+    MemoryThrottleStore,
+    RedisThrottleStore,
+    get_throttle_store,
+)
+from core.throttling.throttles import (
+    ActionSlidingWindowThrottle,
+    FieldSlidingWindowThrottle,
+    SlidingWindowRateThrottle,
+    UserSlidingWindowThrottle,
+)
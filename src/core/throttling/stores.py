@@ -0,0 +1,150 @@
+import functools
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+
+import redis
+
+from core.services.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+MEMORY_URL = "memory://"
+
+
+def sliding_window(previous, current, limit, duration, now):
+    """
+    Sliding window counter: requests of the previous fixed window are weighted by the part of it
+    that is still inside the sliding window, so only two counters per key are kept.
+    Args:
+        previous: Integer - requests in the previous fixed window.
+        current: Integer - requests in the current fixed window.
+        limit: Integer - allowed requests per window.
+        duration: Integer - window length in seconds.
+        now: Float - unix time.
+    Returns:
+        Tuple with Boolean - True if one more request is allowed, and Float - seconds to wait if it is not.
+    """
+    elapsed = now % duration / duration
+    if previous * (1 - elapsed) + current + 1 <= limit:
+        return True, 0.0
+    if current + 1 > limit:
+        # Previous window is out of sight after the current one ends.
+        return False, duration * (1 - elapsed)
+    # Weight of the previous window must fall so that one more request fits.
+    free_at = 1 - (limit - current - 1) / previous
+    return False, duration * (free_at - elapsed)
+
+
+class MemoryThrottleStore:
+    """
+    In-process counters, every process counts its own requests.
+    Keys are evicted least recently used first when there are more than max_size of them.
+    """
+
+    def __init__(self, max_size=100000):
+        self.max_size = max_size
+        self._counters = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key, limit, duration):
+        """
+        Counts request if it is allowed.
+        Args:
+            key: String - client and scope key.
+            limit: Integer - allowed requests per window.
+            duration: Integer - window length in seconds.
+        Returns:
+            Tuple with Boolean - True if request is allowed, and Float - seconds to wait if it is not.
+        """
+        now = time.time()
+        window = int(now // duration)
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None or counter[0] < window - 1:
+                counter = [window, 0, 0]
+            elif counter[0] == window - 1:
+                counter = [window, 0, counter[1]]
+            allowed, wait = sliding_window(counter[2], counter[1], limit, duration, now)
+            if allowed:
+                counter[1] += 1
+            self._counters[key] = counter
+            self._counters.move_to_end(key)
+            if len(self._counters) > self.max_size:
+                self._counters.popitem(last=False)
+        return allowed, wait
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+
+
+# KEYS: current window counter, previous window counter.
+# ARGV: limit, weight of the previous window, counter time to live in seconds.
+SLIDING_WINDOW_SCRIPT = """
+local current = tonumber(redis.call("GET", KEYS[1]) or "0")
+local previous = tonumber(redis.call("GET", KEYS[2]) or "0")
+if previous * tonumber(ARGV[2]) + current + 1 > tonumber(ARGV[1]) then
+    return {0, current, previous}
+end
+current = redis.call("INCR", KEYS[1])
+if current == 1 then
+    redis.call("EXPIRE", KEYS[1], ARGV[3])
+end
+return {1, current, previous}
+"""
+
+
+class RedisThrottleStore:
+    """
+    Counters shared by all processes, every check is one atomic Lua script call with two keys.
+    If Redis is not available requests are counted by in-process fallback store, so they are still limited per process.
+    Attributes:
+        client: redis.Redis client.
+        fallback: MemoryThrottleStore.
+    """
+
+    def __init__(self, client, fallback):
+        self.client = client
+        self.fallback = fallback
+        self.script = client.register_script(SLIDING_WINDOW_SCRIPT)
+
+    def hit(self, key, limit, duration):
+        """
+        Counts request if it is allowed, the same as MemoryThrottleStore.hit.
+        """
+        now = time.time()
+        window = int(now // duration)
+        weight = 1 - now % duration / duration
+        # Hash tag keeps both counters of a client in one Redis Cluster slot.
+        keys = [f"throttle:{{{key}}}:{window}", f"throttle:{{{key}}}:{window - 1}"]
+        try:
+            allowed, current, previous = self.script(keys=keys, args=[limit, repr(weight), math.ceil(duration * 2)])
+        except (redis.RedisError, OSError):
+            logger.warning("Throttle store is not available, counting requests in process.", exc_info=True)
+            return self.fallback.hit(key, limit, duration)
+        if allowed:
+            return True, 0.0
+        return sliding_window(previous, current, limit, duration, now)
+
+
+_memory_store = MemoryThrottleStore()
+
+
+@functools.lru_cache(maxsize=None)
+def _redis_store(url):
+    return RedisThrottleStore(get_redis(url), _memory_store)
+
+
+def get_throttle_store():
+    """
+    Get store by THROTTLE_STORE_URL from settings.
+    Returns:
+        MemoryThrottleStore if url is "memory://", RedisThrottleStore shared by the process otherwise.
+    """
+    if settings.THROTTLE_STORE_URL == MEMORY_URL:
+        return _memory_store
+    return _redis_store(settings.THROTTLE_STORE_URL)
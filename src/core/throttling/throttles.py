@@ -0,0 +1,96 @@
+import hashlib
+from rest_framework.throttling import SimpleRateThrottle
+
+from core.throttling.stores import get_throttle_store
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    SimpleRateThrottle with sliding window counter in throttle store instead of request history in cache,
+    check is O(1) and atomic, history of SimpleRateThrottle grows with the rate and is read and written racily.
+    Rates are set in REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"] by scope, e.g. "5/min", None turns throttle off.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        allowed, self.retry_after = get_throttle_store().hit(self.key, self.num_requests, self.duration)
+        return allowed
+
+    def wait(self):
+        return self.retry_after
+
+
+class UserSlidingWindowThrottle(SlidingWindowRateThrottle):
+    """
+    Limits requests of authenticated User to all endpoints, anonymous requests are limited per endpoint only.
+    """
+
+    scope = "user"
+
+    def get_cache_key(self, request, view):
+        if not (request.user and request.user.is_authenticated):
+            return None
+        return self.cache_format % {"scope": self.scope, "ident": request.user.pk}
+
+
+class ActionSlidingWindowThrottle(SlidingWindowRateThrottle):
+    """
+    Limits requests to viewset actions by scope from view throttle_scope_by_action, e.g. {"sign_in": "sign_in"},
+    actions without scope are not limited. Authenticated User is identified by id, anonymous client by IP address,
+    X-Forwarded-For is trusted only for REST_FRAMEWORK["NUM_PROXIES"] proxies in front of the server.
+    """
+
+    def __init__(self):
+        # Rate depends on view action, it is resolved in allow_request.
+        pass
+
+    def allow_request(self, request, view):
+        self.scope = getattr(view, "throttle_scope_by_action", {}).get(getattr(view, "action", None))
+        if not self.scope:
+            return True
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+
+class FieldSlidingWindowThrottle(SlidingWindowRateThrottle):
+    """
+    Limits requests to viewset actions by value of request data field, whichever client sends them,
+    e.g. reset password emails to one address from clients with rotating addresses.
+    Scope and field are set by view throttle_field_by_action, e.g. {"forgot_password": ("forgot_password_email", "email")}.
+    Values are compared case-insensitively and hashed, so they are not kept in throttle store.
+    Requests without the field are limited by other throttles only.
+    """
+
+    def __init__(self):
+        # Rate depends on view action, it is resolved in allow_request.
+        pass
+
+    def allow_request(self, request, view):
+        scope_and_field = getattr(view, "throttle_field_by_action", {}).get(getattr(view, "action", None))
+        if not scope_and_field:
+            return True
+        self.scope, self.field = scope_and_field
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view):
+        value = request.data.get(self.field) if hasattr(request.data, "get") else None
+        if not isinstance(value, str) or not value.strip():
+            return None
+        ident = hashlib.blake2b(value.strip().lower().encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
@@ -1,6 +1,12 @@
+from django.urls import path
 from rest_framework.routers import SimpleRouter
 
-from core.views import AuthenticationViewSet, HashTagViewSet, TicketViewSet
+from core.views import (
+    AuthenticationViewSet,
+    HashTagViewSet,
+    TicketViewSet,
+    asynchronous,
+)
 
 app_name = "core"
 
@@ -8,6 +14,12 @@ router = SimpleRouter()
 router.register("auth", AuthenticationViewSet, basename="auth")
 router.register("ticket", TicketViewSet, basename="ticket")
 router.register("hash_tag", HashTagViewSet, basename="hash_tag")
-urlpatterns = []
+urlpatterns = [
+    # Async read endpoints for ASGI deployment, same responses as ticket and hash_tag list and retrieve.
+    path("async/ticket/", asynchronous.ticket_list, name="async-ticket-list"),
+    path("async/ticket/<int:pk>/", asynchronous.ticket_detail, name="async-ticket-detail"),
+    path("async/hash_tag/", asynchronous.hash_tag_list, name="async-hash_tag-list"),
+    path("async/hash_tag/<int:pk>/", asynchronous.hash_tag_detail, name="async-hash_tag-detail"),
+]
 
 urlpatterns += router.urls
@@ -1,5 +1,6 @@
-__all__ = ["AuthenticationViewSet", "TicketViewSet", "HashTagViewSet"]
+__all__ = ["AuthenticationViewSet", "TicketViewSet", "HashTagViewSet", "asynchronous", "events", "metrics"]
 
+from core.views import asynchronous, events, metrics
 from core.views.authentication import AuthenticationViewSet
 from core.views.hash_tag import HashTagViewSet
 from core.views.ticket import TicketViewSet
@@ -0,0 +1,159 @@
+import functools
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+
+from asgiref.sync import sync_to_async
+
+from core.authentication import CachedTokenAuthentication
+from core.db import replica_reads
+from core.filters import TicketFilterBackend
+from core.models import Ticket
+from core.pagination import IdCursorPagination
+from core.renderers import render_json
+from core.serializers import HashTagValuesSerializer, TicketValuesSerializer
+from core.services import hash_tag_catalog, ticket_versions
+from core.throttling import UserSlidingWindowThrottle
+from core.views.conditional import get_validators, set_validators
+
+
+def json_response(data, status_code=status.HTTP_200_OK):
+    """
+    Render data with the same renderer as DRF views, so async and sync endpoints return identical bodies.
+    Args:
+        data: JSON serializable data.
+        status_code: Integer HTTP status.
+    Returns:
+        HttpResponse with JSON body.
+    """
+    return HttpResponse(render_json(data), status=status_code, content_type="application/json")
+
+
+def async_api_view(staff_only=False, get_version=None):
+    """
+    Decorator for async read only views under ASGI.
+    It authenticates request with CachedTokenAuthentication.aauthenticate, limits requests of User
+    with UserSlidingWindowThrottle as DEFAULT_THROTTLE_CLASSES limit sync views, wraps request with DRF Request
+    for query parameters and absolute urls, and turns DRF APIExceptions into JSON responses.
+    Session authentication is not supported, async endpoints are meant for API clients with tokens.
+    Args:
+        staff_only: Boolean - if True only staff users get access, as with IsAdminUser permission.
+        get_version: Coroutine function that returns Version of the collection or None, if given conditional
+            requests are answered with 304 before the view runs, the same as sync views decorated with conditional.
+    Returns:
+        Decorator, decorated coroutine function takes DRF Request, User and url kwargs.
+    """
+
+    def decorator(view):
+        @functools.wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            authentication = CachedTokenAuthentication()
+            try:
+                if request.method != "GET":
+                    raise exceptions.MethodNotAllowed(request.method)
+                user_and_token = await authentication.aauthenticate(request)
+                if user_and_token is None:
+                    raise exceptions.NotAuthenticated()
+                user = user_and_token[0]
+                if staff_only and not user.is_staff:
+                    raise exceptions.PermissionDenied()
+                api_request = Request(request)
+                api_request.user = user
+                throttle = UserSlidingWindowThrottle()
+                # Throttle store may go to Redis, it is not called at all if the limit is off.
+                if throttle.rate is not None and not await sync_to_async(throttle.allow_request)(api_request, None):
+                    raise exceptions.Throttled(throttle.wait())
+                version = await get_version() if get_version is not None else None
+                if version is None:
+                    return await view(api_request, user, *args, **kwargs)
+                etag, last_modified = get_validators(request, user, version)
+                response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+                if response is None:
+                    response = await view(api_request, user, *args, **kwargs)
+                return set_validators(response, etag, last_modified)
+            except exceptions.APIException as error:
+                data = error.detail if isinstance(error.detail, (list, dict)) else {"detail": error.detail}
+                response = json_response(data, error.status_code)
+                if getattr(error, "wait", None):
+                    response["Retry-After"] = "%d" % error.wait
+                if isinstance(error, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+                    response.status_code = status.HTTP_401_UNAUTHORIZED
+                    response["WWW-Authenticate"] = authentication.authenticate_header(request)
+                return response
+
+        return wrapper
+
+    return decorator
+
+
+@replica_reads()
+def _list_tickets(request, user):
+    queryset = TicketFilterBackend().filter_queryset(request, Ticket.objects.all(), None)
+    if not user.is_staff:
+        queryset = queryset.filter(creator=user)
+    paginator = IdCursorPagination()
+    page = paginator.paginate_queryset(TicketValuesSerializer.values(queryset), request)
+    return paginator.get_paginated_response(TicketValuesSerializer(page, many=True).data).data
+
+
+@replica_reads()
+def _retrieve_ticket(pk):
+    ticket = Ticket.objects.for_read().filter(id=pk).first()
+    return ticket, TicketValuesSerializer(ticket).data if ticket is not None else None
+
+
+@async_api_view(get_version=ticket_versions.aget)
+async def ticket_list(request, user):
+    """
+    Async TicketViewSet.list, filtering, pagination and serialization run in one sync_to_async call,
+    Django ORM has no async query API yet.
+    Returns:
+        Page of Tickets - {"next": link, "total": count if asked, "results": list of Tickets}.
+    """
+    return json_response(await sync_to_async(_list_tickets)(request, user))
+
+
+@async_api_view(get_version=ticket_versions.aget)
+async def ticket_detail(request, user, pk):
+    """
+    Async TicketViewSet.retrieve, User can retrieve only his Ticket, staff can retrieve any Ticket.
+    Returns:
+        200 - Serialized Ticket,
+        401 - If user is not authenticated,
+        403 - If user is not ticket creator,
+        404 - If ticket does not exist.
+    """
+    ticket, data = await sync_to_async(_retrieve_ticket)(pk)
+    if ticket is None:
+        raise exceptions.NotFound()
+    if not user.is_staff and ticket.creator_id != user.id:
+        return HttpResponse(status=status.HTTP_403_FORBIDDEN)
+    return json_response(data)
+
+
+@async_api_view(staff_only=True, get_version=hash_tag_catalog.aversion)
+async def hash_tag_list(request, user):
+    """
+    Async HashTagViewSet.list, HashTags from in-process catalog are served without leaving event loop.
+    Returns:
+        Page of HashTags - {"next": link, "total": count if asked, "results": list of HashTags}.
+    """
+    paginator = IdCursorPagination()
+    page = paginator.paginate_queryset(await hash_tag_catalog.aall(), request)
+    return json_response(paginator.get_paginated_response(HashTagValuesSerializer(page, many=True).data).data)
+
+
+@async_api_view(staff_only=True, get_version=hash_tag_catalog.aversion)
+async def hash_tag_detail(request, user, pk):
+    """
+    Async HashTagViewSet.retrieve.
+    Returns:
+        200 - Serialized HashTag,
+        404 - If HashTag does not exist.
+    """
+    hash_tag = await hash_tag_catalog.aget_by_id(pk)
+    if hash_tag is None:
+        return json_response(_("HashTag does not exist."), status.HTTP_404_NOT_FOUND)
+    return json_response(HashTagValuesSerializer(hash_tag).data)
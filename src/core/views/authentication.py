@@ -1,6 +1,6 @@
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
-from django.utils import timezone
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 from rest_framework import status
 from rest_framework.decorators import action
@@ -20,8 +20,15 @@ from core.serializers import (
     UserSignInSerializer,
     UserSignUpSerializer,
     UserWithTokenSerializer,
+    UserWithTokenValuesSerializer,
+)
+from core.services import (
+    get_user_resolver,
+    issue_auth_token,
+    send_email_verification,
+    send_reset_password_email,
+    set_user_password,
 )
-from core.services import send_email_verification, send_reset_password_email
 
 
 class AuthenticationViewSet(GenericViewSet):
@@ -31,6 +38,16 @@ class AuthenticationViewSet(GenericViewSet):
 
     serializer_class = UserWithTokenSerializer
     permission_classes_by_action = {"send_confirmation_email": [IsAuthenticated], "set_telegram_id": [IsAuthenticated]}
+    #  Actions open to anyone, limited per client by ActionSlidingWindowThrottle with rates from settings.
+    throttle_scope_by_action = {
+        "sign_in": "sign_in",
+        "sign_up": "sign_up",
+        "confirm_email": "confirm_email",
+        "forgot_password": "forgot_password",
+        "reset_password": "reset_password",
+    }
+    #  Reset emails to one address are limited whichever client asks for them.
+    throttle_field_by_action = {"forgot_password": ("forgot_password_email", "email")}
 
     def get_permissions(self):
         try:
@@ -43,6 +60,7 @@ class AuthenticationViewSet(GenericViewSet):
         responses={
             "200": openapi.Response("User with token field", UserWithTokenSerializer),
             "400": "User with this email does not exist.",
+            "429": "If client sent too many requests, see Retry-After header.",
         },
     )
     @action(methods=["POST"], detail=False)
@@ -55,24 +73,22 @@ class AuthenticationViewSet(GenericViewSet):
         Raises:
             Validation Error if User does not exist or no email in request data.
         """
-        serializer = UserSignInSerializer(data=request.data)
+        serializer = UserSignInSerializer(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
-        data = request.data
-        user = authenticate(
-            request,
-            email=data["email"],
-            password=data["password"],
-        )
+        data = serializer.validated_data
+        #  UserResolverBackend reuses User resolved by serializer validators.
+        user = authenticate(request, email=data["email"], password=data["password"])
         if user is None:
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
-        return Response(self.serializer_class(user, context={"request": request}).data, status=status.HTTP_200_OK)
+        return Response(UserWithTokenValuesSerializer(user).data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
         request_body=UserSignUpSerializer,
         responses={
             "201": openapi.Response("User with token field", UserWithTokenSerializer),
             "400": "User with this email already exist or Validation errors - {error_type: [error_list].",
+            "429": "If client sent too many requests, see Retry-After header.",
         },
     )
     @action(methods=["POST"], detail=False)
@@ -95,13 +111,14 @@ class AuthenticationViewSet(GenericViewSet):
             last_name=serializer.validated_data["last_name"],
         )
 
-        user.set_password(serializer.validated_data["password"])
-        user.save()
-
-        token = Token.objects.create(user=user, token_type=TokenTypeEnum.EMAIL_VERIFICATION)
+        set_user_password(user, serializer.validated_data["password"])
+        with transaction.atomic():
+            user.save()
+            issue_auth_token(user)
+            token = Token.objects.create(user=user, token_type=TokenTypeEnum.EMAIL_VERIFICATION)
         send_email_verification(user=user, token=token)
 
-        return Response(self.serializer_class(user, context={"request": request}).data, status=status.HTTP_201_CREATED)
+        return Response(UserWithTokenValuesSerializer(user).data, status=status.HTTP_201_CREATED)
 
     @swagger_auto_schema(
         method="POST",
@@ -109,6 +126,7 @@ class AuthenticationViewSet(GenericViewSet):
         responses={
             "200": openapi.Response("User with token field", UserWithTokenSerializer),
             "400": "Invalid token.",
+            "429": "If client sent too many requests, see Retry-After header.",
         },
     )
     @swagger_auto_schema(
@@ -116,6 +134,7 @@ class AuthenticationViewSet(GenericViewSet):
         responses={
             "200": openapi.Response("User with token field", UserWithTokenSerializer),
             "400": "Invalid token.",
+            "429": "If client sent too many requests, see Retry-After header.",
         },
     )
     @action(methods=["POST", "GET"], detail=False)
@@ -130,10 +149,8 @@ class AuthenticationViewSet(GenericViewSet):
         # TODO token serialization in serializer
 
         try:
-            token = Token.objects.get(
-                value=request.data.get("token") or request.GET.get("token"),
-                expiration_date__gt=timezone.now(),
-                token_type=TokenTypeEnum.EMAIL_VERIFICATION,
+            token = Token.objects.select_related("user").get_valid(
+                request.data.get("token") or request.GET.get("token"), TokenTypeEnum.EMAIL_VERIFICATION
             )
         except Token.DoesNotExist:
             raise ValidationError(_("Invalid Token"))
@@ -145,7 +162,7 @@ class AuthenticationViewSet(GenericViewSet):
         user.save()
         if request.method == "GET":
             return Response(status=status.HTTP_200_OK)
-        return Response(self.serializer_class(user, context={"request": request}).data, status=status.HTTP_200_OK)
+        return Response(UserWithTokenValuesSerializer(user).data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(request_body=ForgotPasswordSerializer)
     @action(methods=["POST"], detail=False)
@@ -158,10 +175,9 @@ class AuthenticationViewSet(GenericViewSet):
             ValidationError if User with given email does not exist.
         """
 
-        serializer = ForgotPasswordSerializer(data=request.data)
+        serializer = ForgotPasswordSerializer(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
-        email = request.data.get("email")
-        user = User.objects.get(email=email)
+        user = get_user_resolver(request).get_by_email(serializer.validated_data["email"])
 
         request.user = user
         token = Token.objects.create(user=user, token_type=TokenTypeEnum.RESET_PASSWORD)
@@ -184,10 +200,8 @@ class AuthenticationViewSet(GenericViewSet):
         serializer.is_valid(raise_exception=True)
         # TODO maybe move token and password serialization in serializer
         try:
-            token = Token.objects.get(
-                value=request.data.get("token"),
-                expiration_date__gt=timezone.now(),
-                token_type=TokenTypeEnum.RESET_PASSWORD,
+            token = Token.objects.select_related("user").get_valid(
+                request.data.get("token"), TokenTypeEnum.RESET_PASSWORD
             )
         except Token.DoesNotExist:
             raise ValidationError(_("Invalid token"))
@@ -201,8 +215,8 @@ class AuthenticationViewSet(GenericViewSet):
         except ValidationError as e:
             return Response(data=[e], status=status.HTTP_400_BAD_REQUEST)
 
-        user.set_password(request_data["password"])
+        set_user_password(user, request_data["password"])
         token.delete()
         user.save()
 
-        return Response(self.serializer_class(user, context={"request": request}).data)
+        return Response(UserWithTokenValuesSerializer(user).data)
@@ -0,0 +1,78 @@
+import functools
+import hashlib
+import time
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from django.utils.translation import get_language
+
+
+def get_validators(request, user, version):
+    """
+    Builds validators of a response from collection version, nothing is read from database or serialized.
+    ETag depends on version, on what user may see, on url with query parameters and on negotiated representation.
+    Last-Modified has one second resolution, so it is omitted until the second of the last change is over,
+    otherwise a change later in the same second would be hidden from "If-Modified-Since" clients.
+    Response may be read from a lagging replica while version is not settled, then ETag differs from the settled one
+    and Last-Modified is omitted, so such copy is never revalidated after replicas caught up.
+    Args:
+        request: Request to build validators for.
+        user: Authenticated User.
+        version: Version of the collection response is built from.
+    Returns:
+        Tuple with weak ETag string and integer Last-Modified timestamp or None.
+    """
+    scope = "staff" if user.is_staff else f"user:{user.id}"
+    number = str(version.number) if version.settled else f"{version.number}:unsettled"
+    key = "|".join((number, scope, request.get_full_path(), request.META.get("HTTP_ACCEPT", ""), get_language() or ""))
+    etag = 'W/"{}"'.format(hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest())
+    last_modified = int(version.modified_at)
+    if not version.settled or time.time() < last_modified + 1:
+        last_modified = None
+    return etag, last_modified
+
+
+def set_validators(response, etag, last_modified):
+    """
+    Adds validators to successful and 304 responses, every response must be revalidated by clients and caches.
+    Args:
+        response: Response to change.
+        etag: String - ETag from get_validators.
+        last_modified: Integer timestamp or None.
+    Returns:
+        The same response.
+    """
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional(get_version):
+    """
+    Decorator for list and retrieve methods of viewsets, answers "If-None-Match" and "If-Modified-Since"
+    with 304 before the method runs, so not modified response costs one version store read and no database queries.
+    Method runs after authentication, so validators are built for request.user.
+    Without version (store is not available) response goes without validators.
+    Args:
+        get_version: Callable without arguments that returns Version of the collection or None.
+    Returns:
+        Decorator.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            version = get_version()
+            if version is None:
+                return method(self, request, *args, **kwargs)
+            etag, last_modified = get_validators(request, request.user, version)
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = method(self, request, *args, **kwargs)
+            return set_validators(response, etag, last_modified)
+
+        return wrapper
+
+    return decorator
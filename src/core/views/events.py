@@ -0,0 +1,115 @@
+import asyncio
+import io
+import json
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from rest_framework import exceptions, status
+
+from core.authentication import CachedTokenAuthentication
+from core.services import event_hub, get_event_broker
+
+
+async def _send_json(send, status_code, data, headers=()):
+    body = json.dumps(data).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [(b"content-type", b"application/json"), *headers],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _wait_for_disconnect(receive):
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+def format_event(event):
+    """
+    Args:
+        event: Dict with "type" and "ticket".
+    Returns:
+        Bytes - Server-Sent Events message with event type as event name and JSON data.
+    """
+    return f"event: {event['type']}\ndata: {json.dumps(event['ticket'], separators=(',', ':'))}\n\n".encode("utf-8")
+
+
+async def _is_still_authenticated(authentication, request, subscription):
+    try:
+        user_and_token = await authentication.aauthenticate(request)
+    except exceptions.APIException:
+        return False
+    return user_and_token is not None and subscription.matches(user_and_token[0])
+
+
+async def ticket_event_stream(scope, receive, send):
+    """
+    ASGI application that streams Ticket events as Server-Sent Events, routed in rest_api.asgi.
+    Request is authenticated with token from "Authorization" header, as async views are.
+    Staff receives events of all Tickets, other users only events of Tickets they created.
+    Events are "ticket.created" with Ticket and "ticket.closed" with Ticket id, creator and is_archived.
+    Stream has no replay, after reconnect clients catch up with Ticket changes endpoint.
+    Comment line is sent every EVENTS_HEARTBEAT seconds, so proxies keep idle connections open.
+    Token is authenticated again at least every EVENTS_HEARTBEAT seconds, stream ends if it is no longer valid
+    or staff status of User changed, client reconnects and gets events it may see now.
+    Args:
+        scope: ASGI http connection scope.
+        receive: ASGI receive callable.
+        send: ASGI send callable.
+    """
+    request = ASGIRequest(scope, io.BytesIO())
+    authentication = CachedTokenAuthentication()
+    try:
+        if request.method != "GET":
+            raise exceptions.MethodNotAllowed(request.method)
+        user_and_token = await authentication.aauthenticate(request)
+        if user_and_token is None:
+            raise exceptions.NotAuthenticated()
+    except exceptions.APIException as error:
+        headers = ()
+        if isinstance(error, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            headers = ((b"www-authenticate", authentication.authenticate_header(request).encode("latin1")),)
+        await _send_json(send, error.status_code, {"detail": str(error.detail)}, headers)
+        return
+
+    get_event_broker().start()
+    subscription = event_hub.subscribe(user_and_token[0], settings.EVENTS_QUEUE_SIZE)
+    disconnect = asyncio.ensure_future(_wait_for_disconnect(receive))
+    loop = asyncio.get_running_loop()
+    check_at = loop.time() + settings.EVENTS_HEARTBEAT
+    try:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_200_OK,
+                "headers": [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                    (b"x-accel-buffering", b"no"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b": connected\n\n", "more_body": True})
+        while not subscription.overflowed:
+            event = asyncio.ensure_future(subscription.queue.get())
+            done, _ = await asyncio.wait(
+                {event, disconnect}, timeout=settings.EVENTS_HEARTBEAT, return_when=asyncio.FIRST_COMPLETED
+            )
+            if disconnect in done:
+                event.cancel()
+                return
+            if event in done:
+                await send({"type": "http.response.body", "body": format_event(event.result()), "more_body": True})
+            else:
+                event.cancel()
+                await send({"type": "http.response.body", "body": b": heartbeat\n\n", "more_body": True})
+            if event not in done or loop.time() >= check_at:
+                if not await _is_still_authenticated(authentication, request, subscription):
+                    break
+                check_at = loop.time() + settings.EVENTS_HEARTBEAT
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        event_hub.unsubscribe(subscription)
+        disconnect.cancel()
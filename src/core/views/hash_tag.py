@@ -1,6 +1,8 @@
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError
 from django.utils.translation import gettext_lazy as _
 from rest_framework import mixins, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
@@ -9,7 +11,14 @@ from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 from core.models import HashTag
-from core.serializers import HashTagCreateSerializer, HashTagSerializer
+from core.pagination import IdCursorPagination
+from core.serializers import (
+    HashTagCreateSerializer,
+    HashTagSerializer,
+    HashTagValuesSerializer,
+)
+from core.services import hash_tag_catalog
+from core.views.conditional import conditional
 
 
 class HashTagViewSet(
@@ -23,6 +32,7 @@ class HashTagViewSet(
     permission_classes = [IsAuthenticated, IsAdminUser]
     serializer_class = HashTagSerializer
     queryset = HashTag.objects
+    pagination_class = IdCursorPagination
 
     @swagger_auto_schema(
         request_body=HashTagCreateSerializer,
@@ -48,32 +58,42 @@ class HashTagViewSet(
         serializer = HashTagCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        data = self.serializer_class(serializer.create(serializer.validated_data))
+        #  HashTag catalog may be a few seconds stale in this process, unique index has the last word.
+        try:
+            hash_tag = serializer.create(serializer.validated_data)
+        except IntegrityError:
+            raise ValidationError({"hash_tag": [serializer.validated_data["name"] + " " + _("HashTag already exist.")]})
+
+        data = self.serializer_class(hash_tag)
         return Response(data=data.data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
         responses={
             "200": openapi.Response(
-                "List of HashTag models.",
+                "Page of HashTag models ordered by id.",
                 HashTagSerializer(many=True),
             ),
+            "304": "If HashTags are not modified since ETag or time from request.",
             "401": "If user is not authenticated.",
             "403": "If user is not staff.",
         }
     )
+    @conditional(hash_tag_catalog.version)
     def list(self, request, *args, **kwargs):
         """
-        Get all HashTag objects and return list.
+        Get all HashTag objects and return them page by page.
+        Use "?cursor=" from "next" link to get next page, "?page_size=" to change page size
+        and "?total=true" to count all HashTags.
+        "If-None-Match" or "If-Modified-Since" with ETag or Last-Modified of response get 304 while no HashTag was changed.
         Returns:
-            # 200 - List of all HashTag models,
+            # 200 - Page of HashTag models - {"next": link, "total": count if asked, "results": list of HashTags},
             401 - If user is not authenticated,
             403 - If user is not staff,
         }
         """
-        query_set = HashTag.objects.all()
-
-        data = self.serializer_class(query_set, many=True)
-        return Response(data=data.data, status=status.HTTP_200_OK)
+        page = self.paginate_queryset(hash_tag_catalog.all())
+        data = HashTagValuesSerializer(page, many=True)
+        return self.get_paginated_response(data.data)
 
     @swagger_auto_schema(
         responses={
@@ -81,15 +101,18 @@ class HashTagViewSet(
                 "HashTag model.",
                 HashTagSerializer,
             ),
+            "304": "If HashTag is not modified since ETag or time from request.",
             "401": "If user is not authenticated.",
             "403": "If user is not staff.",
             "404": "If HashTag does not exist.",
         }
     )
+    @conditional(hash_tag_catalog.version)
     def retrieve(self, request, *args, **kwargs):
         """
         Tries to get HashTag model by id from request and then return it
         If object does not exist returns 404.
+        "If-None-Match" or "If-Modified-Since" with ETag or Last-Modified of response get 304 while no HashTag was changed.
         Returns:
             200 - Serialized HashTag model.
             401 - If user is not authenticated,
@@ -97,13 +120,15 @@ class HashTagViewSet(
             404 - If HashTag does not exist."
         """
         try:
-            query_set = HashTag.objects.get(id=kwargs["pk"])
-
-            data = self.serializer_class(query_set)
-            return Response(data=data.data, status=status.HTTP_200_OK)
-        except ObjectDoesNotExist:
+            hash_tag = hash_tag_catalog.get_by_id(int(kwargs["pk"]))
+        except ValueError:
+            hash_tag = None
+        if hash_tag is None:
             return Response(_("HashTag does not exist."), status=status.HTTP_404_NOT_FOUND)
 
+        data = HashTagValuesSerializer(hash_tag)
+        return Response(data=data.data, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(
         responses={
             "200": "If HashTag deleted successfully",
@@ -0,0 +1,21 @@
+import hmac
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_GET
+
+from core.metrics import get_metrics_store
+
+
+@require_GET
+def metrics(request):
+    """
+    Internal endpoint with request metrics in Prometheus text format for scrapers,
+    they authenticate with "Authorization: Bearer <METRICS_TOKEN>". Endpoint does not exist if METRICS_TOKEN is not set.
+    Returns:
+        HttpResponse with metrics or 403 if token does not match.
+    """
+    if not settings.METRICS_TOKEN:
+        raise Http404()
+    if not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {settings.METRICS_TOKEN}"):
+        return HttpResponse(status=403)
+    return HttpResponse(get_metrics_store().render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,74 @@
+from django.core.handlers.asgi import ASGIHandler, ASGIRequest
+from django.http import StreamingHttpResponse
+
+from asgiref.sync import sync_to_async
+
+
+async def iterate_in_thread(iterator):
+    """
+    Iterates sync iterator that queries database from event loop, every item is fetched with one sync_to_async call.
+    Calls are thread sensitive, so database cursor of the iterator stays in one thread with one connection.
+    Args:
+        iterator: Iterable, generators are closed in the same thread if the stream stops early.
+    Yields:
+        Items of iterator.
+    """
+    iterator = iter(iterator)
+    get_next = sync_to_async(next, thread_sensitive=True)
+    try:
+        while True:
+            item = await get_next(iterator, StopAsyncIteration)
+            if item is StopAsyncIteration:
+                return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await sync_to_async(close, thread_sensitive=True)()
+
+
+class AsyncStreamingHttpResponse(StreamingHttpResponse):
+    """
+    Streaming response with async iterator of bytes, sent by StreamingASGIHandler.
+    Django 3.2 iterates streaming content on event loop, where database queries raise SynchronousOnlyOperation.
+    Attributes:
+        async_content: Async iterator of bytes.
+    """
+
+    def __init__(self, async_content, *args, **kwargs):
+        super().__init__((), *args, **kwargs)
+        self.async_content = async_content
+
+
+class StreamingASGIHandler(ASGIHandler):
+    """
+    Django ASGI handler that sends async content of AsyncStreamingHttpResponse before the closing message.
+    """
+
+    async def send_response(self, response, send):
+        if not isinstance(response, AsyncStreamingHttpResponse):
+            return await super().send_response(response, send)
+
+        async def send_with_content(message):
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                async for part in response.async_content:
+                    for chunk, _ in self.chunk_bytes(part):
+                        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send(message)
+
+        return await super().send_response(response, send_with_content)
+
+
+def streaming_response(request, content, **kwargs):
+    """
+    Streams content that queries database, under ASGI every piece is produced in a thread.
+    Args:
+        request: DRF or Django request.
+        content: Iterator of bytes.
+        **kwargs: StreamingHttpResponse arguments.
+    Returns:
+        AsyncStreamingHttpResponse under ASGI, StreamingHttpResponse otherwise.
+    """
+    if isinstance(getattr(request, "_request", request), ASGIRequest):
+        return AsyncStreamingHttpResponse(iterate_in_thread(content), **kwargs)
+    return StreamingHttpResponse(content, **kwargs)
@@ -1,6 +1,6 @@
-from django.utils.translation import gettext_lazy as _
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -9,12 +9,35 @@ from rest_framework.viewsets import GenericViewSet, mixins
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
-from core.models import HashTag, Ticket
+from core.db import replica_reads
+from core.filters import TicketFilterBackend
+from core.models import Ticket
+from core.pagination import BoundedOffsetPagination, IdCursorPagination
+from core.search import get_search_backend
 from core.serializers import (
+    TicketBulkCloseSerializer,
+    TicketBulkCreateSerializer,
+    TicketChangesSerializer,
     TicketCloseSerializer,
     TicketCreateSerializer,
+    TicketExportSerializer,
+    TicketSearchSerializer,
     TicketSerializer,
+    TicketValuesSerializer,
 )
+from core.services import (
+    TransitionResult,
+    bulk_close_tickets,
+    bulk_create_tickets,
+    close_ticket,
+    export_tickets,
+    get_ticket_changes,
+    publish_tickets_closed,
+    publish_tickets_created,
+    ticket_versions,
+)
+from core.views.conditional import conditional
+from core.views.streaming import streaming_response
 
 
 class TicketViewSet(GenericViewSet, mixins.CreateModelMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin):
@@ -26,21 +49,30 @@ class TicketViewSet(GenericViewSet, mixins.CreateModelMixin, mixins.ListModelMix
 
     permission_classes = [IsAuthenticated]
 
+    pagination_class = IdCursorPagination
+
+    filter_backends = [TicketFilterBackend]
+
     @swagger_auto_schema(
         responses={
             "200": openapi.Response(
                 "Ticket model. If user is staff returns ticket, if not only if ticket created by user.",
                 TicketSerializer,
             ),
+            "304": "If ticket is not modified since ETag or time from request.",
             "401": "If user is not authenticated.",
             "403": "If user is not ticket creator.",
             "404": "If ticket does not exist.",
         },
     )
+    @conditional(ticket_versions.get)
+    @replica_reads()
     def retrieve(self, request, *args, **kwargs):
         """
         Method to get Ticket by id, User can retrieve only his Ticket
         If User.is_staff equals True User can get any Ticket that exist.
+        Response has ETag and Last-Modified of Tickets collection, send them back in "If-None-Match"
+        or "If-Modified-Since" to get 304 without body while no Ticket was changed.
         Returns:
             TickerSerializer with model data.
         Raises:
@@ -48,46 +80,168 @@ class TicketViewSet(GenericViewSet, mixins.CreateModelMixin, mixins.ListModelMix
             HTTP_403 - If user is not ticket creator,
             HTTP_404 - If ticket does not exist.
         """
-        ticket = get_object_or_404(Ticket, id=kwargs["pk"])
+        ticket = get_object_or_404(Ticket.objects.for_read(), id=kwargs["pk"])
 
-        if not request.user.is_staff and ticket.creator is not request.user:
+        if not request.user.is_staff and ticket.creator_id != request.user.id:
             return Response(status=status.HTTP_403_FORBIDDEN)
 
-        serializer = self.serializer_class(ticket)
+        serializer = TicketValuesSerializer(ticket)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @swagger_auto_schema(
+        manual_parameters=TicketFilterBackend.parameters,
         responses={
             "200": openapi.Response(
-                "List of Tickets. If user is staff returns all tickets, if not only tickets created by user.",
+                "Page of Tickets. If user is staff returns all tickets, if not only tickets created by user.",
                 TicketSerializer(many=True),
             ),
+            "304": "If tickets are not modified since ETag or time from request.",
+            "400": "If filter parameters are invalid.",
             "401": "If user is not authenticated.",
         },
     )
+    @conditional(ticket_versions.get)
+    @replica_reads()
     def list(self, request, *args, **kwargs):
         """
         Method to get list of Tickets.
         User can get only Tickets that he created, but if User is staff can get all created Tickets.
-        If request has parameter "?filter=HashTag.name" return only Tickets with given HashTag
+        Tickets can be filtered by "?hash_tag=HashTag.name" (or "?filter=HashTag.name"), "?is_archived=",
+        "?creator=User.id", "?min_id=" and "?max_id=", all filters are applied in one query.
+        Tickets are paginated by id, use "?cursor=" from "next" link to get next page,
+        "?page_size=" to change page size and "?total=true" to count all Tickets.
+        Response has ETag and Last-Modified, "If-None-Match" or "If-Modified-Since" get 304 while no Ticket was changed.
         Returns:
-            List of Tickets.
+            Page of Tickets - {"next": link, "total": count if asked, "results": list of Tickets}.
         Raises:
+            HTTP_400 - If filter parameters are invalid,
             HTTP_401 - If user is not authenticated.
         """
-        query_set = Ticket.objects.all()
-        hash_tag = HashTag.objects.filter(name=kwargs.get("filter")).first()
-
-        #  If hash_tag in request parameters, filters Tickets by HashTag
-        if hash_tag:
-            query_set = Ticket.objects.filter(hash_tag=hash_tag)
+        query_set = self.filter_queryset(Ticket.objects.all())
 
         #  If user is not staff excludes Tickets that not created by user.
         if not request.user.is_staff:
             query_set = query_set.filter(creator=request.user)
 
-        serializer = self.serializer_class(query_set, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        #  Page is read as tuples of serialized columns, HashTag name is joined by the same query.
+        page = self.paginate_queryset(TicketValuesSerializer.values(query_set))
+        serializer = TicketValuesSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @swagger_auto_schema(
+        query_serializer=TicketSearchSerializer,
+        manual_parameters=TicketFilterBackend.parameters,
+        responses={
+            "200": openapi.Response(
+                "Page of Tickets ordered by relevance. If user is not staff only tickets created by user.",
+                TicketSerializer(many=True),
+            ),
+            "400": "If search query or filter parameters are invalid.",
+            "401": "If user is not authenticated.",
+        },
+    )
+    @action(methods=["GET"], detail=False, pagination_class=BoundedOffsetPagination)
+    def search(self, request, *args, **kwargs):
+        """
+        Method to search Tickets by words from "?q=" in question.
+        Search uses full text index of database and returns Tickets ordered by relevance,
+        use "?limit=" and "?offset=" or "next" link to get next page.
+        Filters from Ticket list can be applied too.
+        Returns:
+            Page of Tickets - {"next": link, "results": list of Tickets}.
+        Raises:
+            HTTP_400 - If search query or filter parameters are invalid,
+            HTTP_401 - If user is not authenticated.
+        """
+        serializer = TicketSearchSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        query_set = self.filter_queryset(Ticket.objects.for_read())
+        if not request.user.is_staff:
+            query_set = query_set.filter(creator=request.user)
+        query_set = get_search_backend().search(query_set, serializer.validated_data["q"])
+
+        page = self.paginate_queryset(query_set)
+        return self.get_paginated_response(self.serializer_class(page, many=True).data)
+
+    @swagger_auto_schema(
+        query_serializer=TicketExportSerializer,
+        manual_parameters=TicketFilterBackend.parameters,
+        responses={
+            "200": "All Tickets as JSON array, newline delimited JSON or CSV. "
+            "If user is staff exports all tickets, if not only tickets created by user.",
+            "400": "If export format or filter parameters are invalid.",
+            "401": "If user is not authenticated.",
+        },
+    )
+    @action(methods=["GET"], detail=False)
+    def export(self, request, *args, **kwargs):
+        """
+        Method to export all Tickets without pagination.
+        Format is chosen by "?export_format=" - "json" (default), "ndjson" or "csv", filters from Ticket list are applied.
+        Tickets are read with database cursor and encoded chunk by chunk while response is streamed,
+        so memory use does not depend on number of exported Tickets. Under ASGI every chunk is read in a thread.
+        Returns:
+            Streaming response with Tickets ordered by id.
+        Raises:
+            HTTP_400 - If export format or filter parameters are invalid,
+            HTTP_401 - If user is not authenticated.
+        """
+        serializer = TicketExportSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        export_format = serializer.validated_data["export_format"]
+
+        query_set = self.filter_queryset(Ticket.objects.all())
+        if not request.user.is_staff:
+            query_set = query_set.filter(creator=request.user)
+
+        content, content_type = export_tickets(query_set, export_format)
+        response = streaming_response(request, content, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="tickets.{export_format}"'
+        return response
+
+    @swagger_auto_schema(
+        query_serializer=TicketChangesSerializer,
+        responses={
+            "200": "Tickets created or changed after sync token ordered by change time - "
+            '{"sync_token": String, "has_more": Boolean, "results": [Ticket]}.',
+            "400": "If sync token or page size is invalid.",
+            "401": "If user is not authenticated.",
+        },
+    )
+    @action(methods=["GET"], detail=False)
+    def changes(self, request, *args, **kwargs):
+        """
+        Method to poll Tickets created or changed since previous call, closed Tickets come with is_archived true.
+        Pass "sync_token" from response as "?since=" next time, without it all Tickets are returned page by page.
+        If "has_more" is true there are more changes, ask again at once, otherwise poll later.
+        Changes are returned about TICKET_CHANGES_LAG seconds after they are made,
+        so Tickets committed by slower transactions are never skipped.
+        Filters from Ticket list are not applied, closed Tickets must be seen too.
+        Returns:
+            Changed Tickets - {"sync_token": String or null, "has_more": Boolean, "results": list of Tickets}.
+        Raises:
+            HTTP_400 - If sync token or page size is invalid,
+            HTTP_401 - If user is not authenticated.
+        """
+        serializer = TicketChangesSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        query_set = Ticket.objects.all()
+        if not request.user.is_staff:
+            query_set = query_set.filter(creator=request.user)
+
+        rows, sync_token, has_more = get_ticket_changes(
+            query_set, serializer.validated_data.get("since"), serializer.validated_data["page_size"]
+        )
+        return Response(
+            data={
+                "sync_token": sync_token,
+                "has_more": has_more,
+                "results": TicketValuesSerializer(rows, many=True).data,
+            },
+            status=status.HTTP_200_OK,
+        )
 
     @swagger_auto_schema(
         request_body=TicketCreateSerializer,
@@ -102,6 +256,7 @@ class TicketViewSet(GenericViewSet, mixins.CreateModelMixin, mixins.ListModelMix
         Method to create new Ticket.
         Request data - {"hash_tag": String with HashTag.name,
                         "question": String with question.
+        Subscribers of Ticket event stream get "ticket.created" event after commit.
         Returns:
             TicketSerializer data with created Ticket.
         Raises:
@@ -113,9 +268,10 @@ class TicketViewSet(GenericViewSet, mixins.CreateModelMixin, mixins.ListModelMix
 
         ticket = Ticket.objects.create(
             creator=request.user,
-            hash_tag=HashTag.objects.get(name=serializer.validated_data["hash_tag"]["name"]),
+            hash_tag=serializer.validated_data["hash_tag"],
             question=serializer.validated_data["question"],
         )
+        publish_tickets_created([ticket])
 
         return Response(data=self.serializer_class(ticket).data, status=status.HTTP_200_OK)
 
@@ -123,10 +279,9 @@ class TicketViewSet(GenericViewSet, mixins.CreateModelMixin, mixins.ListModelMix
         request_body=TicketCloseSerializer,
         responses={
             "200": "",
-            "400": "If Ticket already marked as archived",
+            "400": "If Ticket does not exist or already marked as archived",
             "401": "If user is not authenticated.",
             "403": "If user is not ticket creator.",
-            "404": "If Ticket does not exist.",
         },
     )
     @action(methods=["POST"], detail=False)
@@ -134,24 +289,93 @@ class TicketViewSet(GenericViewSet, mixins.CreateModelMixin, mixins.ListModelMix
         """
         Method to close ticket if user or staff decided that it solved or need to be closed.
         Tickets flag is_archived would be True, and Ticket no longer can be updated.
+        Ticket is closed with one conditional UPDATE, so concurrent closes can not both succeed.
+        Subscribers of Ticket event stream get "ticket.closed" event after commit.
         Returns:
             HTTP_200 - If Ticket was archived successful,
-            HTTP_400 - If Ticket already marked as archived,
+            HTTP_400 - If Ticket does not exist or already marked as archived,
             HTTP_401 - If user is not authenticated,
-            HTTP_403 - If user is not ticket creator,
-            HTTP_404 - If Ticket does not exist.
+            HTTP_403 - If user is not ticket creator.
         """
         serializer = TicketCloseSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        ticket = Ticket.objects.get(id=serializer.validated_data["id"])
 
-        if not request.user.is_staff and ticket.creator is not request.user:
-            return Response(status=status.HTTP_403_FORBIDDEN)
+        result = close_ticket.apply(serializer.validated_data["id"], request.user)
+
+        if result is TransitionResult.NOT_FOUND:
+            raise ValidationError({"id": [close_ticket.get_error_message(result)]})
 
-        if ticket.is_archived:
-            return Response(data=_("Ticket already marked as archived."), status=status.HTTP_400_BAD_REQUEST)
+        if result is TransitionResult.FORBIDDEN:
+            return Response(status=status.HTTP_403_FORBIDDEN)
 
-        ticket.is_archived = True
-        ticket.save()
+        if result is TransitionResult.INVALID_STATE:
+            return Response(data=close_ticket.get_error_message(result), status=status.HTTP_400_BAD_REQUEST)
 
+        #  User who is not staff can close only his Tickets, so creator is known without a query.
+        publish_tickets_closed(
+            [serializer.validated_data["id"]], creator_id=None if request.user.is_staff else request.user.id
+        )
         return Response(status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        request_body=TicketBulkCreateSerializer,
+        responses={
+            "200": "Created Tickets and result for every ticket from request - "
+            '{"tickets": [Ticket], "results": [{"index": 0, "status": "created" or "error", "errors": {}}]}.',
+            "400": "If request has no tickets or too many tickets.",
+            "401": "If user is not authenticated.",
+        },
+    )
+    @action(methods=["POST"], detail=False)
+    def bulk_create(self, request, *args, **kwargs):
+        """
+        Method to create many Tickets with one request.
+        Request data - {"tickets": [{"hash_tag": String with HashTag.name, "question": String with question}]}.
+        Every ticket is validated separately, invalid tickets are reported in results and valid ones are created.
+        Returns:
+            Created Tickets and per ticket results.
+        Raises:
+            HTTP_400 - If request has no tickets or too many tickets,
+            HTTP_401 - If user is not authenticated.
+        """
+        serializer = TicketBulkCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        tickets, results = bulk_create_tickets(request.user, serializer.validated_data["tickets"])
+        publish_tickets_created(tickets)
+        return Response(
+            data={"tickets": self.serializer_class(tickets, many=True).data, "results": results},
+            status=status.HTTP_200_OK,
+        )
+
+    @swagger_auto_schema(
+        request_body=TicketBulkCloseSerializer,
+        responses={
+            "200": "Result for every Ticket id from request - "
+            '{"results": [{"id": 1, "status": "closed" or "error", "error": "reason"}]}.',
+            "400": "If request has no ids or too many ids.",
+            "401": "If user is not authenticated.",
+        },
+    )
+    @action(methods=["POST"], detail=False)
+    def bulk_close(self, request, *args, **kwargs):
+        """
+        Method to close many Tickets with one request.
+        Request data - {"ids": [Ticket ids]}.
+        Ticket is not closed if it does not exist, user is not ticket creator or it is already archived,
+        such Tickets are reported in results and the rest are closed.
+        Returns:
+            Per Ticket results.
+        Raises:
+            HTTP_400 - If request has no ids or too many ids,
+            HTTP_401 - If user is not authenticated.
+        """
+        serializer = TicketBulkCloseSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = bulk_close_tickets(request.user, serializer.validated_data["ids"])
+        publish_tickets_closed(
+            [result["id"] for result in results if result["status"] == "closed"],
+            creator_id=None if request.user.is_staff else request.user.id,
+        )
+        return Response(data={"results": results}, status=status.HTTP_200_OK)
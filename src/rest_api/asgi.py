@@ -7,9 +7,27 @@ For more information on this file, see
 https://docs.djangoproject.com/en/3.1/howto/deployment/asgi/
 """
 
+import django
 import os
-from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "rest_api.settings")
 
-application = get_asgi_application()
+django.setup(set_prefix=False)
+
+# Imported after Django is set up, the stream uses models and settings.
+from core.views.events import ticket_event_stream  # noqa: E402
+from core.views.streaming import StreamingASGIHandler  # noqa: E402
+
+# The same as get_asgi_application(), with responses streamed from async iterators.
+django_application = StreamingASGIHandler()
+
+# Long-lived streams bypass Django request handling, it would hold a thread for every connected client.
+EVENT_STREAMS = {
+    "/api/events/ticket/": ticket_event_stream,
+}
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "http" and scope["path"] in EVENT_STREAMS:
+        return await EVENT_STREAMS[scope["path"]](scope, receive, send)
+    return await django_application(scope, receive, send)
@@ -13,6 +13,8 @@ import os
 from django.utils.translation import gettext_lazy as _
 from pathlib import Path
 
+from rest_api.database import get_databases
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -31,10 +33,32 @@ ALLOWED_HOSTS = []
 # Application definition
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
-        "rest_framework.authentication.BasicAuthentication",
+        "core.authentication.CachedTokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
-    ]
+    ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PAGINATION_CLASS": "core.pagination.IdCursorPagination",
+    "PAGE_SIZE": int(os.environ.get("PAGE_SIZE", 100)),
+    "DEFAULT_THROTTLE_CLASSES": [
+        "core.throttling.UserSlidingWindowThrottle",
+        "core.throttling.ActionSlidingWindowThrottle",
+        "core.throttling.FieldSlidingWindowThrottle",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        # All endpoints for authenticated user, e.g. "1000/min", not limited if not set.
+        "user": os.environ.get("THROTTLE_USER_RATE") or None,
+        "sign_in": os.environ.get("THROTTLE_SIGN_IN_RATE", "10/min"),
+        "sign_up": os.environ.get("THROTTLE_SIGN_UP_RATE", "5/min"),
+        "confirm_email": os.environ.get("THROTTLE_CONFIRM_EMAIL_RATE", "10/min"),
+        "forgot_password": os.environ.get("THROTTLE_FORGOT_PASSWORD_RATE", "3/min"),
+        "reset_password": os.environ.get("THROTTLE_RESET_PASSWORD_RATE", "10/min"),
+        "forgot_password_email": os.environ.get("THROTTLE_FORGOT_PASSWORD_EMAIL_RATE", "5/hour"),
+    },
+    # Anonymous clients are identified by REMOTE_ADDR, X-Forwarded-For is trusted for that many proxies only.
+    "NUM_PROXIES": int(os.environ.get("NUM_PROXIES", 0)),
 }
 
 
@@ -54,10 +78,19 @@ INSTALLED_APPS = [
 ]
 
 AUTH_USER_MODEL = "core.User"
+AUTHENTICATION_BACKENDS = ["core.authentication.UserResolverBackend"]
 VERIFICATION_TOKEN_EXPIRATION_TIME: int = 60 * 60
+TICKET_BULK_MAX_SIZE: int = 1000
+TICKET_EXPORT_CHUNK_SIZE: int = 1000
+TICKET_CHANGES_PAGE_SIZE: int = 100
+TICKET_CHANGES_MAX_PAGE_SIZE: int = 1000
+# Seconds changes are held back for transactions still in flight, must exceed the longest Ticket write transaction
+# plus clock difference between servers. Tickets of transactions longer than half of it are restamped after commit.
+TICKET_CHANGES_LAG: float = 1.0
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 MIDDLEWARE = [
+    "core.metrics.PerformanceMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -91,12 +124,29 @@ WSGI_APPLICATION = "rest_api.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/3.1/ref/settings/#databases
 
-DATABASES = {
+# Primary and replicas from DATABASE_URL and DATABASE_REPLICA_URLS, see rest_api/database.py.
+DATABASES = get_databases(os.environ, default_url=f"sqlite:///{BASE_DIR / 'db.sqlite3'}")
+DATABASE_ROUTERS = ["core.db.PrimaryReplicaRouter"]
+# Seconds replicas may lag behind primary, collection versions are not settled for that time after a change.
+DATABASE_REPLICA_LAG: float = float(os.environ.get("DATABASE_REPLICA_LAG", 1)) if len(DATABASES) > 1 else 0
+
+
+# Cache
+# https://docs.djangoproject.com/en/3.1/topics/cache/
+
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "BACKEND": os.environ.get("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("CACHE_LOCATION", ""),
     }
 }
+HASH_TAG_CACHE_TIMEOUT: int = 60 * 60
+HASH_TAG_LOCAL_CACHE_TIMEOUT: int = 5
+AUTH_TOKEN_CACHE_ALIAS = os.environ.get("AUTH_TOKEN_CACHE_ALIAS") or None
+AUTH_TOKEN_CACHE_TIMEOUT: int = 5 * 60
+# Bounds staleness in processes that missed an invalidation broadcast, see CACHE_INVALIDATION_URL.
+AUTH_TOKEN_LOCAL_CACHE_TIMEOUT: int = 5
+AUTH_TOKEN_LOCAL_CACHE_SIZE: int = 10000
 
 
 # Password validation
@@ -110,13 +160,39 @@ AUTH_PASSWORD_VALIDATORS = [
         "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
     },
     {
-        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+        "NAME": "core.services.passwords.validators.CommonPasswordValidator",
     },
     {
         "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
     },
 ]
 
+# Password hashing
+# Preferred hasher is selected by PASSWORD_HASHER: "scrypt" (default), "argon2" (requires argon2-cffi) or "pbkdf2",
+# the rest of hashers only verify existing passwords, which are rehashed with preferred one on sign in.
+
+PASSWORD_HASHER_CHOICES = {
+    "scrypt": "core.services.passwords.hashers.ScryptPasswordHasher",
+    "argon2": "core.services.passwords.hashers.TunedArgon2PasswordHasher",
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+}
+PASSWORD_HASHER = os.environ.get("PASSWORD_HASHER", "scrypt")
+PASSWORD_HASHERS = [PASSWORD_HASHER_CHOICES[PASSWORD_HASHER]] + [
+    hasher for name, hasher in PASSWORD_HASHER_CHOICES.items() if name != PASSWORD_HASHER
+]
+PASSWORD_HASHERS += [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+PASSWORD_SCRYPT_WORK_FACTOR = 2 ** 14
+PASSWORD_SCRYPT_BLOCK_SIZE = 8
+PASSWORD_SCRYPT_PARALLELISM = 1
+PASSWORD_ARGON2_TIME_COST = 2
+PASSWORD_ARGON2_MEMORY_COST = 65536
+PASSWORD_ARGON2_PARALLELISM = 2
+# Number of processes hashing passwords, 0 hashes in request thread.
+PASSWORD_HASHING_POOL_SIZE = int(os.environ.get("PASSWORD_HASHING_POOL_SIZE", 0))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/3.1/topics/i18n/
@@ -142,7 +218,7 @@ USE_TZ = True
 
 STATIC_URL = "/static/"
 
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+EMAIL_BACKEND = os.environ.get("EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
 EMAIL_FILE_PATH = os.path.join(BASE_DIR, "files/sent_emails")
 EMAIL_USE_TLS = True
 EMAIL_HOST = "smtp.gmail.com"
@@ -157,3 +233,67 @@ path = "default"
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://127.0.0.1:6379")
 CELERY_BEAT_SCHEDULER = "django"
 CELERY_TIMEZONE = "Europe/Moscow"
+CELERY_BEAT_SCHEDULE = {
+    "flush-email-outbox": {
+        "task": "core.tasks.email.flush_email_outbox",
+        "schedule": 60.0,
+    },
+    "delete-expired-tokens": {
+        "task": "core.tasks.tokens.delete_expired_tokens",
+        "schedule": 3600.0,
+    },
+}
+
+# Email delivery pipeline
+# Messages are queued to outbox in Redis ("memory://" keeps them in process, for tests and eager Celery only)
+# and sent by worker in batches through one long-lived connection.
+EMAIL_OUTBOX_URL = os.environ.get("EMAIL_OUTBOX_URL", CELERY_BROKER_URL)
+EMAIL_BATCH_SIZE = 50
+EMAIL_BATCH_WINDOW = 5
+EMAIL_CONNECTION_MAX_IDLE = 30
+EMAIL_MAX_RETRIES = 5
+EMAIL_RETRY_BACKOFF = 10
+EMAIL_RETRY_BACKOFF_MAX = 600
+
+# Ticket events
+# Events are fanned out to ASGI processes through Redis pub/sub ("memory://" reaches clients of current process only).
+EVENTS_BROKER_URL = os.environ.get("EVENTS_BROKER_URL", CELERY_BROKER_URL)
+EVENTS_CHANNEL = "events:tickets"
+EVENTS_QUEUE_SIZE = 100
+EVENTS_HEARTBEAT = 15
+
+# Throttling
+# Sliding window counters are kept in Redis ("memory://" counts requests in process), rates are in REST_FRAMEWORK.
+THROTTLE_STORE_URL = os.environ.get("THROTTLE_STORE_URL", CELERY_BROKER_URL)
+
+# Collection versions
+# Tickets and HashTags versions behind ETag and Last-Modified are kept in Redis, all processes must see every bump
+# ("memory://" keeps them in process, for tests and single process servers).
+VERSION_STORE_URL = os.environ.get("VERSION_STORE_URL", CELERY_BROKER_URL)
+
+# Cache invalidation
+# Keys deleted from tiered caches (auth tokens) are dropped from in-process levels of all processes
+# through Redis pub/sub ("memory://" reaches current process only).
+CACHE_INVALIDATION_URL = os.environ.get("CACHE_INVALIDATION_URL", CELERY_BROKER_URL)
+CACHE_INVALIDATION_CHANNEL = "cache:invalidations"
+
+# Performance metrics
+# Every request is recorded by core.metrics.PerformanceMiddleware, METRICS_SAMPLE_RATE share of requests also gets
+# database and serializer timings. Metrics of all processes are summed up in Redis ("memory://" exposes current
+# process only) by a background thread every METRICS_FLUSH_INTERVAL seconds and served at /internal/metrics/
+# if METRICS_TOKEN is set. Server-Timing header shows timings to any client, so it is off unless debugging.
+METRICS_STORE_URL = os.environ.get("METRICS_STORE_URL", CELERY_BROKER_URL)
+METRICS_KEY = "metrics:http"
+METRICS_FLUSH_INTERVAL = 10
+METRICS_SAMPLE_RATE = float(os.environ.get("METRICS_SAMPLE_RATE", 0.1))
+METRICS_SERVER_TIMING = os.environ.get("METRICS_SERVER_TIMING", "false").lower() in ("1", "true", "yes", "on")
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
+# Slow queries
+# Queries slower than SLOW_QUERY_THRESHOLD seconds are explained and counted in SlowQuery by a background thread,
+# "manage.py slow_queries" prints the slowest ones. Off if not set.
+SLOW_QUERY_THRESHOLD = float(os.environ["SLOW_QUERY_THRESHOLD"]) if os.environ.get("SLOW_QUERY_THRESHOLD") else None
+
+# Expired tokens reaper
+TOKEN_REAPER_BATCH_SIZE = 1000
+TOKEN_REAPER_MAX_BATCHES = 100
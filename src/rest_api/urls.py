@@ -20,9 +20,12 @@ from rest_framework.permissions import AllowAny
 from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 
+from core.views import metrics
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include("core.urls", namespace="api")),
+    path("internal/metrics/", metrics.metrics, name="metrics"),
 ]
 
 